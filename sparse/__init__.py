@@ -1,4 +1,9 @@
-from sparse import utils
+from sparse import cache, dedup, metrics, models, tracing, utils
+from sparse.engines import available_engines, get_engine, register_engine, unregister_engine
+from sparse.aio import AsyncParser, aparse, aparse_batch
+from sparse.corpus import iter_parse, parse_corpus
+from sparse.pipeline import Pipeline
+from sparse.tracing import instrument
 
 def parse(text, engine=None, lowercase=False, remove_punctuation=False, 
           remove_stopwords=False, lemmatize=False, tokenize=False,
@@ -30,6 +35,11 @@ def parse(text, engine=None, lowercase=False, remove_punctuation=False,
     Returns:
         str or list: Processed text or tokens.
     """
+    if cache._active is not None:
+        return parse_batch([text], engine, dedupe=False, **_flat_options(locals()))[0]
+    if tracing._hooks:
+        return _pipeline(engine, _flat_options(locals()))(text)
+
     if engine:
         # Delegate to engine
         return _dispatch_engine(engine, text, locals())
@@ -64,6 +74,99 @@ def parse(text, engine=None, lowercase=False, remove_punctuation=False,
     return result
 
 
+def parse_batch(texts, engine=None, dedupe=True, **options):
+    """
+    Parse a list of texts in one call, using the engine's bulk path when it has one.
+
+    Engines that expose ``parse_batch`` (spaCy ``nlp.pipe``, Stanza multi-document
+    input, Flair list ``predict``, HF Tokenizers ``encode_batch``, SentencePiece list
+    encoding) receive the whole list at once; other engines fall back to calling
+    their ``parse`` once per text.
+
+    Args:
+        texts (iterable of str): The raw texts to parse.
+        engine (str, optional): Engine to use ('nltk', 'spacy', etc.). None = lightweight.
+        dedupe (bool or callable): Parse identical texts once and copy the result to
+            each duplicate. Pass a key function such as :func:`sparse.dedup.normalize`
+            to also merge texts differing only in whitespace or case. False disables.
+        **options: Same options accepted by :func:`parse`. Engines with a bulk path may
+            also accept tuning options such as ``batch_size`` and ``n_process`` (spaCy).
+            ``as_tuples=True`` takes ``(text, context)`` pairs and returns
+            ``(result, context)`` pairs, for any engine.
+
+    Returns:
+        list: One result per input text, in input order.
+
+    Raises:
+        ValueError: If engine is unknown or not installed.
+    """
+    texts = list(texts)
+    if options.pop('as_tuples', False):
+        contexts = [context for _, context in texts]
+        results = parse_batch([text for text, _ in texts], engine, dedupe, **options)
+        return list(zip(results, contexts))
+
+    if dedupe and len(texts) > 1:
+        unique, positions = dedup.dedupe(texts, key=None if dedupe is True else dedupe)
+        if len(unique) < len(texts):
+            return dedup.expand(parse_batch(unique, engine, dedupe=False, **options), positions)
+
+    if cache._active is not None:
+        return cache._active.parse_batch(texts, engine, options, _parse_batch)
+    return _parse_batch(texts, engine, options)
+
+
+def _parse_batch(texts, engine, options):
+    if engine and not tracing._hooks:
+        return _dispatch_engine_batch(engine, texts, options)
+    return _pipeline(engine, options).batch(texts)
+
+
+def _pipeline(engine, options):
+    """Build the :class:`Pipeline` equivalent to a ``parse()`` call with flat ``options``."""
+    if engine:
+        return Pipeline(engine, **options)
+    # Like parse(), the lightweight path ignores engine-specific options.
+    lightweight_options = {
+        k: v for k, v in options.items()
+        if k in _STANDARD_OPTIONS or k in _LIGHTWEIGHT_OPTIONS
+    }
+    return Pipeline(**lightweight_options)
+
+
+# Options consumed by the lightweight pipeline only; engines never see them.
+_LIGHTWEIGHT_OPTIONS = (
+    'fix_text', 'transliterate', 'remove_emoji', 'remove_unicode', 'clean_html',
+    'extract_text', 'remove_urls', 'detect_language', 'language_engine',
+)
+
+# Options every engine accepts, forwarded with a default of False.
+_STANDARD_OPTIONS = ('lowercase', 'remove_punctuation', 'remove_stopwords', 'lemmatize', 'tokenize')
+
+
+def _flat_options(parse_locals):
+    """Turn ``parse()``'s ``locals()`` into the flat options dict ``parse_batch()`` takes."""
+    options = {k: v for k, v in parse_locals.items() if k not in ('text', 'engine', 'kwargs')}
+    options.update(parse_locals['kwargs'])
+    return options
+
+
+def _engine_options(options, extra_kwargs):
+    """Build the flat kwargs dict passed to an engine's ``parse``/``parse_batch``."""
+    engine_options = {name: options.get(name, False) for name in _STANDARD_OPTIONS}
+    # Include any extra kwargs the user passed
+    engine_options.update(extra_kwargs)
+    return engine_options
+
+
+def _extra_options(options):
+    """Return the engine-specific entries of a flat options dict."""
+    return {
+        k: v for k, v in options.items()
+        if k not in _STANDARD_OPTIONS and k not in _LIGHTWEIGHT_OPTIONS
+    }
+
+
 def _dispatch_engine(engine_name, text, options):
     """
     Dispatch to the appropriate engine module.
@@ -79,101 +182,30 @@ def _dispatch_engine(engine_name, text, options):
     Raises:
         ValueError: If engine is unknown or not installed.
     """
-    # Clean up options dict
-    engine_options = {
-        'lowercase': options.get('lowercase', False),
-        'remove_punctuation': options.get('remove_punctuation', False),
-        'remove_stopwords': options.get('remove_stopwords', False),
-        'lemmatize': options.get('lemmatize', False),
-        'tokenize': options.get('tokenize', False),
-    }
-    # Include any extra kwargs the user passed
-    extra_kwargs = {k: v for k, v in options.get('kwargs', {}).items()}
-    engine_options.update(extra_kwargs)
-    
-    if engine_name == 'nltk':
-        try:
-            from sparse.engines import nltk_engine
-            return nltk_engine.parse(text, **engine_options)
-        except ImportError:
-            raise ValueError('NLTK engine not available. Install nltk: pip install nltk')
-    elif engine_name == 'spacy':
-        try:
-            from sparse.engines import spacy_engine
-            return spacy_engine.parse(text, **engine_options)
-        except ImportError:
-            raise ValueError('spaCy engine not available. Install spacy: pip install spacy')
-    elif engine_name == 'textblob':
-        try:
-            from sparse.engines import textblob_engine
-            return textblob_engine.parse(text, **engine_options)
-        except ImportError:
-            raise ValueError('TextBlob engine not available. Install textblob: pip install textblob')
-    elif engine_name == 'transformers':
-        try:
-            from sparse.engines import transformers_engine
-            return transformers_engine.parse(text, **engine_options)
-        except ImportError:
-            raise ValueError(
-                'Transformers engine not available. '
-                'Install with: pip install sparse[advanced]'
-            )
-    elif engine_name == 'gensim':
-        try:
-            from sparse.engines import gensim_engine
-            return gensim_engine.parse(text, **engine_options)
-        except ImportError:
-            raise ValueError(
-                'Gensim engine not available. Install with: pip install sparse[advanced]'
-            )
-    elif engine_name == 'stanza':
-        try:
-            from sparse.engines import stanza_engine
-            return stanza_engine.parse(text, **engine_options)
-        except ImportError:
-            raise ValueError(
-                'Stanza engine not available. Install with: pip install sparse[advanced]'
-            )
-    elif engine_name == 'hf_tokenizers':
-        try:
-            from sparse.engines import hf_tokenizers_engine
-            return hf_tokenizers_engine.parse(text, **engine_options)
-        except ImportError:
-            raise ValueError(
-                'Hugging Face Tokenizers engine not available. '
-                'Install with: pip install sparse[specialized]'
-            )
-    elif engine_name == 'sentencepiece':
-        try:
-            from sparse.engines import sentencepiece_engine
-            return sentencepiece_engine.parse(text, **engine_options)
-        except ImportError:
-            raise ValueError(
-                'SentencePiece engine not available. Install with: pip install sparse[specialized]'
-            )
-    elif engine_name == 'flair':
-        try:
-            from sparse.engines import flair_engine
-            return flair_engine.parse(text, **engine_options)
-        except ImportError:
-            raise ValueError(
-                'Flair engine not available. Install with: pip install sparse[specialized]'
-            )
-    elif engine_name == 'sklearn':
-        try:
-            from sparse.engines import sklearn_engine
-            return sklearn_engine.parse(text, **engine_options)
-        except ImportError:
-            raise ValueError(
-                'scikit-learn engine not available. Install with: pip install sparse[utils]'
-            )
-    elif engine_name == 'textacy':
-        try:
-            from sparse.engines import textacy_engine
-            return textacy_engine.parse(text, **engine_options)
-        except ImportError:
-            raise ValueError(
-                'Textacy engine not available. Install with: pip install sparse[utils]'
-            )
-    else:
-        raise ValueError(f'Unknown engine: {engine_name}')
\ No newline at end of file
+    engine_options = _engine_options(options, options.get('kwargs', {}))
+    return get_engine(engine_name).parse(text, **engine_options)
+
+
+def _dispatch_engine_batch(engine_name, texts, options):
+    """
+    Dispatch a list of texts to the appropriate engine module.
+
+    Args:
+        engine_name (str): Name of the engine (e.g., 'nltk', 'spacy').
+        texts (list of str): Input texts.
+        options (dict): Flat options dict as passed to :func:`parse_batch`.
+
+    Returns:
+        list: Engine results, one per input text.
+
+    Raises:
+        ValueError: If engine is unknown or not installed.
+    """
+    engine_options = _engine_options(options, _extra_options(options))
+    module = get_engine(engine_name)
+
+    engine_parse_batch = getattr(module, 'parse_batch', None)
+    if engine_parse_batch is None:
+        return [module.parse(text, **engine_options) for text in texts]
+    return engine_parse_batch(texts, **engine_options)
+
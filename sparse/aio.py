@@ -0,0 +1,154 @@
+"""asyncio front-end for sparse.
+
+Engine work runs on an executor so it never blocks the event loop. Documents
+awaited concurrently with the same engine and options are merged into small
+batches and handed to :func:`sparse.parse_batch`, so engines with a bulk path
+(spaCy ``nlp.pipe``, Stanza, Flair, ...) are used even when callers submit one
+text at a time.
+"""
+
+import asyncio
+
+
+class AsyncParser:
+    """
+    Async parser with a concurrency limit and micro-batching.
+
+    Args:
+        executor (concurrent.futures.Executor, optional): Executor that runs engine
+            work. None uses the event loop's default thread pool; pass a
+            ``ProcessPoolExecutor`` for engines that hold the GIL.
+        max_concurrency (int): Maximum number of documents in flight at once.
+        max_batch_size (int): Maximum number of documents merged into one batch.
+        max_wait (float): Seconds to wait for more documents before a partial
+            batch is sent.
+    """
+
+    def __init__(self, executor=None, max_concurrency=64, max_batch_size=32, max_wait=0.002):
+        if max_concurrency < 1:
+            raise ValueError(f'max_concurrency must be at least 1, got {max_concurrency}')
+        if max_batch_size < 1:
+            raise ValueError(f'max_batch_size must be at least 1, got {max_batch_size}')
+
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+
+        self._loop = None
+        self._semaphore = None
+        self._pending = {}
+
+    async def parse(self, text, engine=None, **options):
+        """
+        Parse a single text without blocking the event loop.
+
+        Args:
+            text (str): The raw text to parse.
+            engine (str, optional): Engine to use ('nltk', 'spacy', etc.). None = lightweight.
+            **options: Same options accepted by :func:`sparse.parse`.
+
+        Returns:
+            str or list: Processed text or tokens.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Semaphores and futures are bound to the loop that created them.
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._pending = {}
+
+        async with self._semaphore:
+            future = loop.create_future()
+            self._enqueue(loop, engine, options, text, future)
+            return await future
+
+    async def parse_batch(self, texts, engine=None, **options):
+        """
+        Parse a list of texts without blocking the event loop.
+
+        Texts share the concurrency limit with :meth:`parse` and are merged into
+        batches of at most ``max_batch_size``.
+
+        Returns:
+            list: One result per input text, in input order.
+        """
+        return list(await asyncio.gather(*(self.parse(text, engine, **options) for text in texts)))
+
+    def _enqueue(self, loop, engine, options, text, future):
+        key = _batch_key(engine, options)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = ([], [])
+            loop.call_later(self.max_wait, self._flush, loop, key, batch, engine, options)
+
+        texts, futures = batch
+        texts.append(text)
+        futures.append(future)
+        if len(texts) >= self.max_batch_size:
+            self._flush(loop, key, batch, engine, options)
+
+    def _flush(self, loop, key, batch, engine, options):
+        # The timer may fire after a full batch was already sent.
+        if self._pending.get(key) is not batch:
+            return
+        del self._pending[key]
+
+        texts, futures = batch
+        task = loop.run_in_executor(self.executor, _run_batch, engine, texts, options)
+        task.add_done_callback(lambda done: _resolve(done, futures))
+
+
+def _batch_key(engine, options):
+    key = (engine, tuple(sorted(options.items())))
+    try:
+        hash(key)
+    except TypeError:
+        key = (engine, repr(key[1]))
+    return key
+
+
+def _run_batch(engine, texts, options):
+    from sparse import parse_batch
+
+    return parse_batch(texts, engine=engine, **options)
+
+
+def _resolve(done, futures):
+    if done.cancelled():
+        for future in futures:
+            if not future.done():
+                future.cancel()
+        return
+
+    error = done.exception()
+    results = None if error is not None else done.result()
+    for i, future in enumerate(futures):
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(results[i])
+
+
+_default_parser = AsyncParser()
+
+
+def configure(executor=None, max_concurrency=64, max_batch_size=32, max_wait=0.002):
+    """Replace the parser used by :func:`aparse` and :func:`aparse_batch`."""
+    global _default_parser
+
+    _default_parser = AsyncParser(executor=executor, max_concurrency=max_concurrency,
+                                  max_batch_size=max_batch_size, max_wait=max_wait)
+    return _default_parser
+
+
+async def aparse(text, engine=None, **options):
+    """Async version of :func:`sparse.parse`. See :class:`AsyncParser`."""
+    return await _default_parser.parse(text, engine, **options)
+
+
+async def aparse_batch(texts, engine=None, **options):
+    """Async version of :func:`sparse.parse_batch`. See :class:`AsyncParser`."""
+    return await _default_parser.parse_batch(texts, engine, **options)
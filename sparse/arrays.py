@@ -0,0 +1,44 @@
+"""Ragged NumPy arrays for token-level engine output.
+
+A batch of variable-length rows (e.g. token ids per text) is stored as one
+flat array plus ``row_splits``: row ``i`` is ``flat[row_splits[i]:row_splits[i + 1]]``.
+This costs one allocation per batch instead of one Python object per token.
+
+NumPy is imported on first use; only engines whose libraries already depend on
+it call these helpers.
+"""
+
+import itertools
+
+
+def concat(rows, dtype, width=None):
+    """
+    Flatten variable-length rows into one array.
+
+    Args:
+        rows (list of sequences): One sequence per text.
+        dtype: NumPy dtype of the flat array.
+        width (int, optional): Items are fixed-size sequences of this length
+            (e.g. 2 for ``(start, end)`` offsets); the flat array is then 2-D.
+
+    Returns:
+        tuple: ``(flat, row_splits)``, where ``row_splits`` is an int64 array of
+        length ``len(rows) + 1``.
+    """
+    import numpy as np
+
+    lengths = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows))
+    row_splits = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=row_splits[1:])
+    total = int(row_splits[-1])
+
+    items = itertools.chain.from_iterable(rows)
+    if width is None:
+        return np.fromiter(items, dtype=dtype, count=total), row_splits
+    flat = np.fromiter(itertools.chain.from_iterable(items), dtype=dtype, count=total * width)
+    return flat.reshape(total, width), row_splits
+
+
+def split(flat, row_splits):
+    """Return one view of ``flat`` per row (no copies)."""
+    return [flat[start:end] for start, end in zip(row_splits[:-1], row_splits[1:])]
@@ -0,0 +1,312 @@
+"""Benchmark harness for sparse engines and utility stages.
+
+Run with ``python -m sparse.bench``. Each engine and each lightweight stage is
+run over deterministic synthetic corpora (short tweets, long articles, HTML
+pages) with the same option sets. Reported per case: throughput (docs/s,
+chars/s), per-document latency percentiles, cold-start time (engine import and
+model load plus the first document) and peak RSS. Engines whose libraries or
+models are missing are reported as skipped.
+
+By default every case runs in a fresh interpreter so cold-start and peak RSS
+figures are not polluted by earlier cases. Results are printed as JSON, which
+can be diffed across releases::
+
+    python -m sparse.bench --docs 500 --output bench-0.2.0.json
+    python -m sparse.bench --engines spacy nltk --corpora tweets
+"""
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+
+CORPORA = ('tweets', 'articles', 'html')
+
+# Option sets shared by every engine, so results are comparable.
+ENGINE_OPTION_SETS = (
+    {'tokenize': True},
+    {'tokenize': True, 'lowercase': True, 'remove_punctuation': True, 'remove_stopwords': True},
+    {'tokenize': True, 'lemmatize': True},
+)
+
+STAGES = (
+    'clean_html', 'extract_text', 'remove_urls', 'fix_text', 'transliterate',
+    'remove_emoji', 'remove_unicode', 'lowercase', 'remove_punctuation', 'detect_language',
+)
+
+_WORDS = (
+    'the of and to in is that for it was on are as with by this be at from have not '
+    'data model language text system people time year market city team report study '
+    'new good first last long great little own other old right big high small large '
+    'run runs running ran make makes made say says said go goes went see sees saw '
+    'Apple Google London Paris Monday January Amazon Berlin Tokyo Microsoft'
+).split()
+_EMOJI = ('😀', '🎉', '🔥', '👍', '🌍')
+_HASHTAGS = ('#nlp', '#python', '#news', '#ai', '#data')
+
+
+def make_corpus(kind, n_docs, seed=0):
+    """
+    Generate a deterministic synthetic corpus.
+
+    Args:
+        kind (str): 'tweets', 'articles' or 'html'.
+        n_docs (int): Number of documents.
+        seed (int): Random seed; the same seed always yields the same corpus.
+
+    Returns:
+        list of str: The documents.
+    """
+    rng = random.Random(f'{kind}:{seed}')
+
+    def sentence(n_words):
+        words = [rng.choice(_WORDS) for _ in range(n_words)]
+        return ' '.join(words).capitalize() + rng.choice('..!?')
+
+    if kind == 'tweets':
+        return [
+            ' '.join(filter(None, (
+                sentence(rng.randint(5, 20)),
+                rng.choice(_HASHTAGS),
+                rng.choice(_EMOJI) if rng.random() < 0.5 else '',
+                f'https://t.co/{rng.randrange(16 ** 8):08x}' if rng.random() < 0.3 else '',
+            )))
+            for _ in range(n_docs)
+        ]
+    if kind == 'articles':
+        return [
+            '\n\n'.join(
+                ' '.join(sentence(rng.randint(8, 30)) for _ in range(rng.randint(3, 8)))
+                for _ in range(rng.randint(4, 10))
+            )
+            for _ in range(n_docs)
+        ]
+    if kind == 'html':
+        return [
+            '<html><head><title>{}</title><style>p {{ color: red; }}</style>'
+            '<script>var x = 1;</script></head><body>{}</body></html>'.format(
+                sentence(5),
+                ''.join(
+                    f'<p>{sentence(rng.randint(8, 25))} <a href="https://example.com/{i}">'
+                    f'{rng.choice(_WORDS)}</a> <b>{rng.choice(_WORDS)}</b></p>'
+                    for i in range(rng.randint(3, 10))
+                ),
+            )
+            for _ in range(n_docs)
+        ]
+    raise ValueError(f'Unknown corpus: {kind}')
+
+
+def cases(engines=None, stages=None, corpora=CORPORA, extra_options=None):
+    """
+    List the benchmark cases to run.
+
+    Args:
+        engines (iterable of str, optional): Engine names. None = every registered engine.
+        stages (iterable of str, optional): Lightweight stages. None = all of :data:`STAGES`.
+        corpora (iterable of str): Corpus kinds.
+        extra_options (dict, optional): Per-engine options merged into every option set,
+            e.g. ``{'sentencepiece': {'model_file': 'm.model'}}``.
+
+    Returns:
+        list of dict: ``engine``, ``options`` and ``corpus`` for each case.
+    """
+    from sparse.engines import registered_engines
+
+    if engines is None:
+        engines = registered_engines()
+    if stages is None:
+        stages = STAGES
+    extra_options = extra_options or {}
+
+    result = []
+    for corpus in corpora:
+        for engine in engines:
+            for options in ENGINE_OPTION_SETS:
+                result.append({
+                    'engine': engine,
+                    'options': dict(options, **extra_options.get(engine, {})),
+                    'corpus': corpus,
+                })
+        for stage in stages:
+            result.append({'engine': None, 'options': {stage: True}, 'corpus': corpus})
+    return result
+
+
+def run_case(engine, options, corpus, n_docs=200, seed=0):
+    """
+    Run one benchmark case in the current process.
+
+    Returns:
+        dict: The case description plus ``status`` ('ok', 'skipped' or 'error') and,
+        when 'ok', the measurements.
+    """
+    from sparse import available_engines, parse, parse_batch
+
+    result = {'engine': engine, 'options': options, 'corpus': corpus, 'docs': n_docs}
+    if engine and engine not in available_engines():
+        return dict(result, status='skipped', reason='engine not installed')
+
+    texts = make_corpus(corpus, n_docs, seed)
+    chars = sum(len(text) for text in texts)
+
+    start = time.perf_counter()
+    try:
+        parse(texts[0], engine=engine, **options)
+    except (RuntimeError, ValueError) as e:
+        # Missing optional libraries, models or corpora
+        return dict(result, status='skipped', reason=str(e))
+    except Exception as e:
+        return dict(result, status='error', reason=f'{type(e).__name__}: {e}')
+    cold_start = time.perf_counter() - start
+
+    latencies = []
+    try:
+        start = time.perf_counter()
+        for text in texts:
+            doc_start = time.perf_counter()
+            parse(text, engine=engine, **options)
+            latencies.append(time.perf_counter() - doc_start)
+        elapsed = time.perf_counter() - start
+
+        # Dedup is off so repeated synthetic texts are not discounted.
+        start = time.perf_counter()
+        parse_batch(texts, engine=engine, dedupe=False, **options)
+        batch_elapsed = time.perf_counter() - start
+    except Exception as e:
+        return dict(result, status='error', reason=f'{type(e).__name__}: {e}')
+
+    latencies.sort()
+    return dict(
+        result,
+        status='ok',
+        chars=chars,
+        cold_start_s=cold_start,
+        docs_per_s=n_docs / elapsed if elapsed else None,
+        chars_per_s=chars / elapsed if elapsed else None,
+        batch_docs_per_s=n_docs / batch_elapsed if batch_elapsed else None,
+        latency_p50_ms=_percentile(latencies, 50) * 1000,
+        latency_p95_ms=_percentile(latencies, 95) * 1000,
+        latency_p99_ms=_percentile(latencies, 99) * 1000,
+        peak_rss_bytes=_peak_rss(),
+    )
+
+
+def run(engines=None, stages=None, corpora=CORPORA, n_docs=200, seed=0, isolate=True,
+        extra_options=None, log=None):
+    """
+    Run the benchmark suite and return a JSON-serializable report.
+
+    Args:
+        isolate (bool): Run each case in a fresh interpreter. Without isolation,
+            cold-start and peak RSS figures include earlier cases.
+        log (callable, optional): Called with a one-line summary after each case.
+
+    Other arguments are as for :func:`cases` and :func:`run_case`.
+    """
+    from sparse.engines import engine_version
+
+    results = []
+    for case in cases(engines, stages, corpora, extra_options):
+        if isolate:
+            result = _run_isolated(case, n_docs, seed)
+        else:
+            result = run_case(case['engine'], case['options'], case['corpus'], n_docs, seed)
+        if result['engine'] and result['status'] == 'ok':
+            result['engine_version'] = engine_version(result['engine'])
+        results.append(result)
+        if log is not None:
+            log(_summary(result))
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'docs': n_docs,
+        'seed': seed,
+        'isolated': isolate,
+        'results': results,
+    }
+
+
+def _run_isolated(case, n_docs, seed):
+    payload = json.dumps(dict(case, docs=n_docs, seed=seed))
+    proc = subprocess.run(
+        [sys.executable, '-m', 'sparse.bench', '--run-case', payload],
+        capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        reason = proc.stderr.strip().splitlines()[-1:] or [f'exit code {proc.returncode}']
+        return dict(case, docs=n_docs, status='error', reason=reason[0])
+    # Libraries may print to stdout; the result is the last line.
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _percentile(sorted_values, pct):
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _peak_rss():
+    """Peak resident set size of this process in bytes, or None if unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _summary(result):
+    options = ','.join(k for k, v in result['options'].items() if v is True)
+    name = f"{result['engine'] or 'utils'} {options}"
+    if result['status'] != 'ok':
+        return f"{result['corpus']:<8} {name:<60} {result['status']}: {result.get('reason', '')}"
+    return (f"{result['corpus']:<8} {name:<60} {result['docs_per_s']:>10.1f} docs/s  "
+            f"p99 {result['latency_p99_ms']:.2f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m sparse.bench',
+                                     description=__doc__.split('\n')[0])
+    parser.add_argument('--engines', nargs='*', help='engines to run (default: all)')
+    parser.add_argument('--stages', nargs='*', help='lightweight stages to run (default: all)')
+    parser.add_argument('--corpora', nargs='*', default=list(CORPORA), choices=CORPORA)
+    parser.add_argument('--docs', type=int, default=200, help='documents per corpus')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-isolate', action='store_true',
+                        help='run every case in this process (faster, less accurate)')
+    parser.add_argument('--sentencepiece-model', help='model file for the sentencepiece engine')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    parser.add_argument('--run-case', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_case:
+        case = json.loads(args.run_case)
+        result = run_case(case['engine'], case['options'], case['corpus'], case['docs'],
+                          case['seed'])
+        print(json.dumps(result))
+        return 0
+
+    extra_options = {}
+    if args.sentencepiece_model:
+        extra_options['sentencepiece'] = {'model_file': args.sentencepiece_model}
+
+    report = run(engines=args.engines, stages=args.stages, corpora=args.corpora,
+                 n_docs=args.docs, seed=args.seed, isolate=not args.no_isolate,
+                 extra_options=extra_options, log=lambda line: print(line, file=sys.stderr))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,409 @@
+"""Opt-in result cache for :func:`sparse.parse` and the batch APIs.
+
+Results are keyed by a hash of the text, the engine, the normalized options and
+the versions of the engine's libraries and models, so upgrading spaCy or
+retraining a SentencePiece model never serves stale results. Lookups go to an
+in-memory LRU tier first, then to an optional persistent tier (SQLite database
+or directory of files) that survives restarts.
+
+Example:
+    >>> from sparse import cache
+    >>> cache.enable(maxsize=100_000, path='parse-cache.sqlite')
+    >>> cache.stats()
+    {'hits': 0, 'store_hits': 0, 'misses': 0, 'evictions': 0, 'size': 0}
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+from collections import OrderedDict
+
+# Bump when the key or value format changes.
+_FORMAT_VERSION = 2
+
+# Options whose value names a model; the model's version is part of the key.
+_MODEL_OPTIONS = ('model', 'model_name', 'model_file', 'vectors')
+
+# Options that change how a batch is executed, never its results.
+_EXECUTION_OPTIONS = ('batch_size', 'n_process', 'doc_store', 'mini_batch_size', 'num_threads')
+
+# Libraries behind the lightweight pipeline's optional stages.
+_LIGHTWEIGHT_DISTRIBUTIONS = {
+    'fix_text': ('ftfy',),
+    'transliterate': ('Unidecode',),
+    'remove_emoji': ('emoji',),
+    'clean_html': ('beautifulsoup4', 'bleach'),
+    'extract_text': ('beautifulsoup4', 'bleach'),
+    'detect_language': ('langdetect',),
+}
+
+
+class ResultCache:
+    """
+    Two-tier cache of parse results.
+
+    Args:
+        maxsize (int): Maximum number of results held in memory.
+        store (SQLiteStore or DirectoryStore, optional): Persistent tier.
+    """
+
+    def __init__(self, maxsize=10000, store=None):
+        self.maxsize = maxsize
+        self.store = store
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def parse_batch(self, texts, engine, options, compute):
+        """
+        Return cached results for ``texts``, calling ``compute`` on the misses.
+
+        Args:
+            texts (list of str): Input texts.
+            engine (str or None): Engine name.
+            options (dict): Flat options dict.
+            compute (callable): ``compute(texts, engine, options)`` returning one
+                result per text.
+
+        Returns:
+            list: One result per input text, in input order.
+        """
+        prefix = options_fingerprint(engine, options)
+        keys = [_text_key(prefix, text) for text in texts]
+        results = [None] * len(texts)
+        missing = []
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                found, value = self._get_memory(key)
+                if found:
+                    results[i] = value
+                else:
+                    missing.append(i)
+
+        if missing and self.store is not None:
+            stored = self.store.get_many([keys[i] for i in missing])
+            still_missing = []
+            with self._lock:
+                for i in missing:
+                    value = stored.get(keys[i])
+                    if value is None:
+                        still_missing.append(i)
+                        continue
+                    self.store_hits += 1
+                    results[i] = pickle.loads(value)
+                    self._set_memory(keys[i], _encode(results[i]))
+            missing = still_missing
+
+        if missing:
+            computed = compute([texts[i] for i in missing], engine, options)
+            with self._lock:
+                self.misses += len(missing)
+                for i, result in zip(missing, computed):
+                    self._set_memory(keys[i], _encode(result))
+                    results[i] = result
+            if self.store is not None:
+                self.store.set_many({
+                    keys[i]: pickle.dumps(results[i], protocol=pickle.HIGHEST_PROTOCOL)
+                    for i in missing
+                })
+
+        return results
+
+    def stats(self):
+        """
+        Return hit, miss and eviction counters.
+
+        Returns:
+            dict: ``hits`` (memory tier), ``store_hits`` (persistent tier),
+            ``misses``, ``evictions`` (memory tier) and ``size`` (memory tier).
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'store_hits': self.store_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._memory),
+            }
+
+    def clear(self):
+        """Drop every cached result, including the persistent tier."""
+        with self._lock:
+            self._memory.clear()
+        if self.store is not None:
+            self.store.clear()
+
+    def _get_memory(self, key):
+        value = self._memory.get(key)
+        if value is None:
+            return False, None
+        self._memory.move_to_end(key)
+        self.hits += 1
+        return True, _decode(value)
+
+    def _set_memory(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+
+class SQLiteStore:
+    """
+    Persistent tier backed by a single SQLite database file.
+
+    Values are pickled results. Safe to share between threads and processes;
+    each process opens its own connection.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+
+    def get_many(self, keys):
+        """Return a dict of the stored values for ``keys``."""
+        found = {}
+        with self._lock:
+            connection = self._connect()
+            # Stay well below SQLite's bound-parameter limit.
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = connection.execute(
+                    f"SELECT key, value FROM results WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                found.update(rows)
+        return found
+
+    def set_many(self, items):
+        """Store a dict of key -> value."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)", items.items()
+                )
+
+    def clear(self):
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM results")
+
+    def _connect(self):
+        # Connections must not be shared with forked children.
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB)"
+            )
+            self._pid = os.getpid()
+        return self._connection
+
+
+class DirectoryStore:
+    """Persistent tier storing one file per result under a directory."""
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        os.makedirs(self.path, exist_ok=True)
+
+    def get_many(self, keys):
+        """Return a dict of the stored values for ``keys``."""
+        found = {}
+        for key in keys:
+            try:
+                with open(self._file(key), 'rb') as f:
+                    found[key] = f.read()
+            except FileNotFoundError:
+                pass
+        return found
+
+    def set_many(self, items):
+        """Store a dict of key -> value."""
+        for key, value in items.items():
+            path = self._file(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write then rename so concurrent readers never see partial files.
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, 'wb') as f:
+                f.write(value)
+            os.replace(tmp, path)
+
+    def clear(self):
+        for root, _, files in os.walk(self.path):
+            for name in files:
+                os.remove(os.path.join(root, name))
+
+    def _file(self, key):
+        return os.path.join(self.path, key[:2], key[2:])
+
+
+def options_fingerprint(engine, options):
+    """
+    Return a string identifying ``engine``, ``options`` and the library/model versions.
+
+    Options equal to their default in ``sparse.parse`` or in the engine's own
+    ``parse`` signature are dropped, so ``parse(text)`` and
+    ``parse(text, lowercase=False)`` share cache entries, as are execution
+    options such as ``batch_size``. Any other value, including ``False`` for an
+    option that defaults to True, is part of the key.
+    """
+    from sparse.engines import distribution_version, engine_version
+
+    defaults = _option_defaults(engine)
+    normalized = {
+        name: value for name, value in options.items()
+        if name not in _EXECUTION_OPTIONS
+        and not _is_default(value, defaults.get(name, _NO_DEFAULT))
+    }
+
+    if engine:
+        versions = [engine_version(engine)]
+    else:
+        versions = sorted({
+            f'{dist}=={distribution_version(dist)}'
+            for option, dists in _LIGHTWEIGHT_DISTRIBUTIONS.items() if normalized.get(option)
+            for dist in dists
+        })
+    # The model in effect, passed or defaulted, always versions the key.
+    for option in _MODEL_OPTIONS:
+        model = options.get(option, defaults.get(option)) if engine else options.get(option)
+        if isinstance(model, str):
+            versions.append(_model_version(model))
+
+    return json.dumps([_FORMAT_VERSION, engine, normalized, versions], sort_keys=True, default=repr)
+
+
+_NO_DEFAULT = object()
+
+
+def _option_defaults(engine):
+    import sparse
+    from sparse.engines import get_engine
+
+    defaults = dict(_signature_defaults(sparse.parse))
+    defaults.pop('engine', None)
+    if engine:
+        try:
+            parse = getattr(get_engine(engine), 'parse', None)
+        except ValueError:
+            # Not installed; dispatching the call reports that.
+            parse = None
+        if parse is not None:
+            defaults.update(_signature_defaults(parse))
+    return defaults
+
+
+@functools.lru_cache(maxsize=None)
+def _signature_defaults(func):
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return {}
+    return {
+        parameter.name: parameter.default for parameter in parameters
+        if parameter.default is not inspect.Parameter.empty
+    }
+
+
+def _is_default(value, default):
+    # Compare types too: 0 == False, but max_df=0 is not tokenize=False.
+    return type(value) is type(default) and value == default
+
+
+def _model_version(model):
+    # Model files change in place; model packages (e.g. spaCy's) carry a version.
+    if os.path.exists(model):
+        stat = os.stat(model)
+        return f'{model}@{stat.st_mtime_ns}:{stat.st_size}'
+    from sparse.engines import distribution_version
+
+    return f'{model}=={distribution_version(model)}'
+
+
+def _text_key(prefix, text):
+    digest = hashlib.sha256(prefix.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(text.encode('utf-8', 'surrogatepass'))
+    return digest.hexdigest()
+
+
+def _encode(result):
+    # In memory, strings are immutable and stored as-is; anything else is pickled
+    # so that callers mutating a returned list never corrupt the cache.
+    if isinstance(result, str):
+        return result
+    return pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode(value):
+    if isinstance(value, str):
+        return value
+    return pickle.loads(value)
+
+
+_active = None
+_active_config = None
+
+
+def enable(maxsize=10000, path=None, backend='sqlite'):
+    """
+    Turn on result caching for :func:`sparse.parse` and the batch APIs.
+
+    Args:
+        maxsize (int): Maximum number of results held in memory.
+        path (str, optional): Location of the persistent tier. None = memory only.
+        backend (str): Persistent tier type: 'sqlite' (a database file at ``path``)
+            or 'directory' (one file per result under ``path``).
+
+    Returns:
+        ResultCache: The active cache.
+    """
+    global _active, _active_config
+
+    if path is None:
+        store = None
+    elif backend == 'sqlite':
+        store = SQLiteStore(path)
+    elif backend == 'directory':
+        store = DirectoryStore(path)
+    else:
+        raise ValueError(f'Unknown cache backend: {backend}')
+
+    _active = ResultCache(maxsize=maxsize, store=store)
+    _active_config = {'maxsize': maxsize, 'path': path, 'backend': backend}
+    return _active
+
+
+def disable():
+    """Turn off result caching. The persistent tier is left on disk."""
+    global _active, _active_config
+
+    _active = None
+    _active_config = None
+
+
+def stats():
+    """Return the active cache's counters (see :meth:`ResultCache.stats`), or None."""
+    return _active.stats() if _active is not None else None
+
+
+def clear():
+    """Drop every result from the active cache, including the persistent tier."""
+    if _active is not None:
+        _active.clear()
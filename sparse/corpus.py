@@ -0,0 +1,184 @@
+"""Streaming and multi-process corpus processing.
+
+Documents are read lazily and split into chunks. Chunks are either parsed in
+the calling process or spread over a ``ProcessPoolExecutor``; each worker
+imports its engine and loads the engine's model once, in the pool initializer,
+so tasks only pay for inference.
+"""
+
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from sparse import cache, dedup
+from sparse.engines import get_engine
+
+# Per-worker state, set by ``_init_worker`` in each pool process.
+_worker_engine = None
+_worker_options = {}
+
+
+def parse_corpus(texts, engine=None, workers=None, chunksize=256, progress=None, dedupe=True,
+                 **options):
+    """
+    Parse a corpus of texts across a pool of worker processes.
+
+    Args:
+        texts (iterable of str): The raw texts to parse. Consumed lazily.
+        engine (str, optional): Engine to use ('nltk', 'spacy', etc.). None = lightweight.
+        workers (int, optional): Number of worker processes (default: ``os.cpu_count()``).
+        chunksize (int): Number of texts sent to a worker per task.
+        progress (callable, optional): Called as ``progress(done, total)`` after each
+            chunk completes. ``total`` is None when ``texts`` has no ``len()``.
+        dedupe (bool or callable): Send each distinct text in a chunk to the workers
+            once. See :func:`sparse.parse_batch`.
+        **options: Same options accepted by :func:`sparse.parse`.
+
+    Returns:
+        list: One result per input text, in input order.
+
+    Raises:
+        ValueError: If engine is unknown or not installed, or ``chunksize`` < 1.
+    """
+    try:
+        total = len(texts)
+    except TypeError:
+        total = None
+
+    results = []
+    for chunk_results in _map_chunks(texts, engine, options, workers, chunksize, dedupe):
+        results.extend(chunk_results)
+        if progress is not None:
+            progress(len(results), total)
+    return results
+
+
+def iter_parse(source, engine=None, batch_size=64, workers=None, key=None, dedupe=True,
+               **options):
+    """
+    Lazily parse texts from any iterable, yielding results as batches finish.
+
+    Only a bounded window of ``source`` is held in memory: one batch when parsing
+    in the calling process, or ``2 * workers`` batches when ``workers`` is set.
+
+    Args:
+        source (iterable): Texts to parse, e.g. a file object, generator or DB cursor.
+            Lines read from file objects have their trailing newline removed.
+        engine (str, optional): Engine to use ('nltk', 'spacy', etc.). None = lightweight.
+        batch_size (int): Number of texts handed to the engine at a time.
+        workers (int, optional): If set, parse batches in this many worker processes.
+        key (callable, optional): Extract the text from each item, e.g.
+            ``lambda row: row[0]`` for DB cursor rows.
+        dedupe (bool or callable): Parse each distinct text in a batch once. See
+            :func:`sparse.parse_batch`.
+        **options: Same options accepted by :func:`sparse.parse`.
+
+    Yields:
+        One result per input item, in input order.
+
+    Raises:
+        ValueError: If engine is unknown or not installed, or ``batch_size`` < 1.
+    """
+    texts = _iter_texts(source, key)
+
+    if workers:
+        chunks = _map_chunks(texts, engine, options, workers, batch_size, dedupe)
+    else:
+        if batch_size < 1:
+            raise ValueError(f'batch_size must be at least 1, got {batch_size}')
+        from sparse import parse_batch
+
+        chunks = (parse_batch(chunk, engine=engine, dedupe=dedupe, **options)
+                  for chunk in _chunked(texts, batch_size))
+
+    for chunk_results in chunks:
+        yield from chunk_results
+
+
+def _map_chunks(texts, engine, options, workers, chunksize, dedupe):
+    """
+    Yield parsed chunks in input order.
+
+    At most ``2 * workers`` chunks are in flight at a time, so ``texts`` is read
+    only as fast as the pool consumes it. Duplicates are removed before a chunk
+    is sent to a worker and restored when its results come back.
+    """
+    if chunksize < 1:
+        raise ValueError(f'chunksize must be at least 1, got {chunksize}')
+    workers = workers or os.cpu_count() or 1
+
+    if engine:
+        # Fail fast in the parent rather than once per worker.
+        get_engine(engine)
+
+    chunks = _chunked(texts, chunksize)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(engine, options, cache._active_config)) as executor:
+        def submit(chunk):
+            positions = None
+            if dedupe:
+                unique, positions = dedup.dedupe(chunk, key=None if dedupe is True else dedupe)
+                if len(unique) < len(chunk):
+                    chunk = unique
+                else:
+                    positions = None
+            pending.append((executor.submit(_parse_chunk, chunk), positions))
+
+        pending = deque()
+        for chunk in itertools.islice(chunks, 2 * workers):
+            submit(chunk)
+
+        while pending:
+            future, positions = pending.popleft()
+            chunk_results = future.result()
+            for chunk in itertools.islice(chunks, 1):
+                submit(chunk)
+            if positions is not None:
+                chunk_results = dedup.expand(chunk_results, positions)
+            yield chunk_results
+
+
+def _iter_texts(source, key):
+    texts = iter(source)
+    if hasattr(source, 'readline'):
+        texts = (line.rstrip('\r\n') for line in texts)
+    if key is not None:
+        texts = map(key, texts)
+    return texts
+
+
+def _chunked(texts, chunksize):
+    iterator = iter(texts)
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _init_worker(engine, options, cache_config):
+    """Pool initializer: resolve the engine and load its model once per worker."""
+    global _worker_engine, _worker_options
+
+    _worker_engine = engine
+    _worker_options = options
+
+    # Workers keep their own memory tier and share the parent's persistent tier.
+    if cache_config is not None:
+        cache.enable(**cache_config)
+
+    if engine:
+        from sparse import _engine_options, _extra_options
+
+        module = get_engine(engine)
+        preload = getattr(module, 'preload', None)
+        if preload is not None:
+            preload(**_engine_options(options, _extra_options(options)))
+
+
+def _parse_chunk(texts):
+    from sparse import parse_batch
+
+    # Chunks arrive already deduplicated by the parent.
+    return parse_batch(texts, engine=_worker_engine, dedupe=False, **_worker_options)
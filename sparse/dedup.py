@@ -0,0 +1,67 @@
+"""In-batch deduplication.
+
+Identical texts in a batch are parsed once and the result is fanned back out
+to every position the text appeared at.
+"""
+
+import copy
+import re
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize(text):
+    """Dedup key that treats texts differing only in case or whitespace as equal."""
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+def dedupe(texts, key=None):
+    """
+    Split ``texts`` into unique texts and the position of each input among them.
+
+    Args:
+        texts (list of str): Input texts.
+        key (callable, optional): Maps a text to its dedup key (e.g. :func:`normalize`).
+            None = exact match. The first text with a given key is the one parsed.
+
+    Returns:
+        tuple: ``(unique_texts, positions)`` where ``texts[i]`` is represented by
+        ``unique_texts[positions[i]]``.
+    """
+    seen = {}
+    unique = []
+    positions = []
+    for text in texts:
+        k = text if key is None else key(text)
+        index = seen.get(k)
+        if index is None:
+            index = seen[k] = len(unique)
+            unique.append(text)
+        positions.append(index)
+    return unique, positions
+
+
+def expand(results, positions):
+    """
+    Fan results for unique texts back out to the original positions.
+
+    The first occurrence receives the result itself; later occurrences get a
+    copy, so mutating one result never changes another.
+    """
+    expanded = []
+    used = [False] * len(results)
+    for index in positions:
+        result = results[index]
+        if used[index]:
+            result = _copy(result)
+        used[index] = True
+        expanded.append(result)
+    return expanded
+
+
+def _copy(result):
+    if isinstance(result, (str, bytes, int, float, tuple, type(None))):
+        return result
+    if isinstance(result, list) and all(isinstance(item, (str, tuple)) for item in result):
+        return list(result)
+    return copy.deepcopy(result)
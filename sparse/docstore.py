@@ -0,0 +1,139 @@
+"""Opt-in on-disk store of spaCy annotations.
+
+Annotated Docs are serialized with ``DocBin`` into a SQLite database, keyed by a
+hash of the text and of the pipeline that annotated it (model name and version,
+spaCy version and component names). Re-running a corpus with different
+filtering options (``remove_stopwords``, ``lemmatize``, ``pos_tag``, ``ner``)
+then loads the stored Docs and applies only the option logic, skipping
+inference.
+
+Used by the spaCy and textacy engines through the ``doc_store`` option::
+
+    parse_batch(texts, engine="spacy", lemmatize=True, doc_store="annotations.sqlite")
+    parse_batch(texts, engine="spacy", pos_tag=True, tokenize=True,
+                doc_store="annotations.sqlite")  # no inference
+"""
+
+import itertools
+import json
+import os
+import threading
+
+from sparse.cache import SQLiteStore, _text_key
+
+# Bump when the key or value format changes.
+_FORMAT_VERSION = 1
+
+# Texts looked up and annotated together.
+_CHUNK_SIZE = 1000
+
+
+class DocStore:
+    """
+    Persistent store of annotated spaCy Docs.
+
+    Args:
+        path (str): SQLite database file, created if missing.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        self._store = SQLiteStore(self.path)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def pipe(self, nlp, texts, batch_size=None, n_process=1, as_tuples=False):
+        """
+        Like ``nlp.pipe``, but load stored Docs and annotate only unseen texts.
+
+        Args:
+            nlp (spacy.language.Language): The pipeline.
+            texts (iterable): Texts, or ``(text, context)`` pairs when ``as_tuples``.
+            batch_size (int, optional): Passed to ``nlp.pipe`` for unseen texts.
+            n_process (int): Passed to ``nlp.pipe`` for unseen texts.
+            as_tuples (bool): Yield ``(doc, context)`` pairs.
+
+        Yields:
+            spacy.tokens.Doc: One Doc per input text, in input order.
+        """
+        from spacy.tokens import DocBin
+
+        prefix = fingerprint(nlp)
+        items = iter(texts)
+        while True:
+            chunk = list(itertools.islice(items, _CHUNK_SIZE))
+            if not chunk:
+                return
+            if as_tuples:
+                chunk_texts = [text for text, _ in chunk]
+                contexts = [context for _, context in chunk]
+            else:
+                chunk_texts = chunk
+
+            keys = [_text_key(prefix, text) for text in chunk_texts]
+            stored = self._store.get_many(keys)
+            missing = [i for i, key in enumerate(keys) if key not in stored]
+            with self._lock:
+                self.hits += len(keys) - len(missing)
+                self.misses += len(missing)
+
+            docs = [None] * len(keys)
+            for i, key in enumerate(keys):
+                value = stored.get(key)
+                if value is not None:
+                    docs[i] = next(DocBin().from_bytes(value).get_docs(nlp.vocab))
+            if missing:
+                annotated = nlp.pipe([chunk_texts[i] for i in missing], batch_size=batch_size,
+                                     n_process=n_process)
+                new = {}
+                for i, doc in zip(missing, annotated):
+                    docs[i] = doc
+                    new[keys[i]] = DocBin(docs=[doc]).to_bytes()
+                self._store.set_many(new)
+
+            if as_tuples:
+                yield from zip(docs, contexts)
+            else:
+                yield from docs
+
+    def stats(self):
+        """Return ``hits`` (Docs loaded) and ``misses`` (Docs annotated and stored)."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+    def clear(self):
+        """Delete every stored Doc."""
+        self._store.clear()
+
+
+def fingerprint(nlp):
+    """Return a string identifying the pipeline that annotates Docs."""
+    import spacy
+
+    meta = nlp.meta
+    return json.dumps([
+        _FORMAT_VERSION, spacy.__version__, meta.get('lang'), meta.get('name'),
+        meta.get('version'), list(nlp.pipe_names),
+    ])
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(store):
+    """
+    Return the :class:`DocStore` for ``store``.
+
+    Args:
+        store (str or DocStore): Database path (one shared instance per path in
+            this process) or an existing store.
+    """
+    if isinstance(store, DocStore):
+        return store
+    path = os.path.abspath(os.fspath(store))
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = DocStore(path)
+        return _stores[path]
@@ -1 +1,222 @@
-"""Engine adapters for sparse text processing."""
+"""Engine adapters for sparse text processing.
+
+Engines are looked up by name in a registry. Built-in engines live in this
+package as ``{name}_engine`` modules; third-party engines can be added with
+:func:`register_engine` or advertised by an installed distribution through the
+``sparse.engines`` entry-point group::
+
+    [project.entry-points."sparse.engines"]
+    fast = "mypackage.fast_engine"
+
+An engine is any module or object exposing ``parse(text, **options)`` and,
+optionally, ``parse_batch(texts, **options)`` and ``preload(**options)``.
+Modules are imported on first use and cached.
+"""
+
+import importlib
+import importlib.util
+from collections import namedtuple
+
+ENTRY_POINT_GROUP = 'sparse.engines'
+
+# target: dotted module path, entry point, or an already-loaded engine object.
+# requires: top-level modules the engine needs, checked without importing them.
+EngineSpec = namedtuple('EngineSpec', ['name', 'target', 'requires', 'install_hint'])
+
+_BUILTIN_ENGINES = (
+    EngineSpec('nltk', 'sparse.engines.nltk_engine', ('nltk',),
+               'NLTK engine not available. Install nltk: pip install nltk'),
+    EngineSpec('spacy', 'sparse.engines.spacy_engine', ('spacy',),
+               'spaCy engine not available. Install spacy: pip install spacy'),
+    EngineSpec('textblob', 'sparse.engines.textblob_engine', ('textblob',),
+               'TextBlob engine not available. Install textblob: pip install textblob'),
+    EngineSpec('transformers', 'sparse.engines.transformers_engine', ('transformers',),
+               'Transformers engine not available. Install with: pip install sparse[advanced]'),
+    EngineSpec('gensim', 'sparse.engines.gensim_engine', ('gensim',),
+               'Gensim engine not available. Install with: pip install sparse[advanced]'),
+    EngineSpec('stanza', 'sparse.engines.stanza_engine', ('stanza',),
+               'Stanza engine not available. Install with: pip install sparse[advanced]'),
+    EngineSpec('hf_tokenizers', 'sparse.engines.hf_tokenizers_engine', ('tokenizers',),
+               'Hugging Face Tokenizers engine not available. '
+               'Install with: pip install sparse[specialized]'),
+    EngineSpec('sentencepiece', 'sparse.engines.sentencepiece_engine', ('sentencepiece',),
+               'SentencePiece engine not available. Install with: pip install sparse[specialized]'),
+    EngineSpec('flair', 'sparse.engines.flair_engine', ('flair',),
+               'Flair engine not available. Install with: pip install sparse[specialized]'),
+    EngineSpec('sklearn', 'sparse.engines.sklearn_engine', ('sklearn',),
+               'scikit-learn engine not available. Install with: pip install sparse[utils]'),
+    EngineSpec('textacy', 'sparse.engines.textacy_engine', ('textacy', 'spacy'),
+               'Textacy engine not available. Install with: pip install sparse[utils]'),
+)
+
+# Import names whose distribution name differs.
+_DISTRIBUTIONS = {'sklearn': 'scikit-learn'}
+
+_registry = {spec.name: spec for spec in _BUILTIN_ENGINES}
+_loaded = {}
+_versions = {}
+_entry_points_scanned = False
+
+
+def register_engine(name, target, requires=(), install_hint=None):
+    """
+    Register an engine under ``name``, replacing any existing registration.
+
+    Args:
+        name (str): Engine name, as passed to ``parse(engine=...)``.
+        target (str or object): Dotted module path, imported on first use, or an
+            object exposing ``parse(text, **options)``.
+        requires (iterable of str): Top-level modules the engine needs; used by
+            :func:`available_engines`.
+        install_hint (str, optional): Error message when the engine cannot be imported.
+    """
+    _registry[name] = EngineSpec(name, target, tuple(requires), install_hint)
+    _loaded.pop(name, None)
+    _versions.pop(name, None)
+
+
+def unregister_engine(name):
+    """
+    Remove the engine registered under ``name``, if any.
+
+    Args:
+        name (str): Engine name, as passed to :func:`register_engine`.
+    """
+    _registry.pop(name, None)
+    _loaded.pop(name, None)
+    _versions.pop(name, None)
+
+
+def get_engine(name):
+    """
+    Return the engine registered under ``name``, importing it on first use.
+
+    Raises:
+        ValueError: If engine is unknown or not installed.
+    """
+    try:
+        return _loaded[name]
+    except KeyError:
+        pass
+
+    spec = _get_spec(name)
+    try:
+        if isinstance(spec.target, str):
+            engine = importlib.import_module(spec.target)
+        elif hasattr(spec.target, 'load'):
+            engine = spec.target.load()
+        else:
+            engine = spec.target
+    except ImportError as e:
+        raise ValueError(spec.install_hint or f"Engine '{name}' not available: {e}")
+
+    _loaded[name] = engine
+    return engine
+
+
+def available_engines():
+    """
+    Return the names of engines whose dependencies are installed.
+
+    Dependencies are located with ``importlib.util.find_spec`` so heavy
+    libraries are not imported.
+
+    Returns:
+        list of str: Sorted engine names.
+    """
+    _scan_entry_points()
+    return sorted(name for name, spec in _registry.items() if _is_importable(spec))
+
+
+def registered_engines():
+    """
+    Return the names of all registered engines, installed or not.
+
+    Returns:
+        list of str: Sorted engine names.
+    """
+    _scan_entry_points()
+    return sorted(_registry)
+
+
+def engine_version(name):
+    """
+    Return the installed versions of the libraries behind an engine.
+
+    Versions are read from package metadata, so the libraries are not imported.
+
+    Returns:
+        str: e.g. ``'spacy==3.7.2'``; empty if unknown or not installed.
+    """
+    try:
+        return _versions[name]
+    except KeyError:
+        pass
+
+    versions = []
+    for module in _get_spec(name).requires:
+        dist = _DISTRIBUTIONS.get(module, module)
+        dist_version = distribution_version(dist)
+        if dist_version:
+            versions.append(f'{dist}=={dist_version}')
+
+    _versions[name] = ' '.join(versions)
+    return _versions[name]
+
+
+def distribution_version(dist):
+    """Return the installed version of distribution ``dist``, or None."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(dist)
+    except PackageNotFoundError:
+        return None
+
+
+def _get_spec(name):
+    spec = _registry.get(name)
+    if spec is None:
+        _scan_entry_points()
+        spec = _registry.get(name)
+        if spec is None:
+            raise ValueError(f'Unknown engine: {name}')
+    return spec
+
+
+def _is_importable(spec):
+    if spec.name in _loaded:
+        return True
+    requires = spec.requires
+    if not requires and isinstance(spec.target, str):
+        requires = (spec.target,)
+    try:
+        return all(importlib.util.find_spec(module) is not None for module in requires)
+    except (ImportError, ValueError):
+        return False
+
+
+def _scan_entry_points():
+    global _entry_points_scanned
+
+    if _entry_points_scanned:
+        return
+    _entry_points_scanned = True
+
+    for entry_point in _iter_entry_points():
+        # Built-in and explicitly registered engines take precedence.
+        if entry_point.name not in _registry:
+            module = entry_point.value.split(':')[0]
+            _registry[entry_point.name] = EngineSpec(
+                entry_point.name, entry_point, (module.split('.')[0],), None
+            )
+
+
+def _iter_entry_points():
+    from importlib.metadata import entry_points
+
+    eps = entry_points()
+    if hasattr(eps, 'select'):
+        return eps.select(group=ENTRY_POINT_GROUP)
+    # Python < 3.10 returns a dict keyed by group
+    return eps.get(ENTRY_POINT_GROUP, ())
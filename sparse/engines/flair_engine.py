@@ -5,9 +5,12 @@ This engine leverages Flair for NER, POS tagging, and embedding generation.
 
 from typing import List, Union
 
+from sparse import models
+
 
 def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=False,
-          lemmatize=False, tokenize=False, ner=False, pos_tag=False, **kwargs):
+          lemmatize=False, tokenize=False, ner=False, pos_tag=False, mini_batch_size=32,
+          split_sentences=False, **kwargs):
     """
     Parse text using Flair.
 
@@ -19,54 +22,142 @@ def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=Fals
         lemmatize (bool): Ignored.
         tokenize (bool): Return tokens list instead of joined string.
         ner (bool): Perform named entity recognition.
-        pos_tag (bool): Perform POS tagging.
+        pos_tag (bool): Perform POS tagging. With ``ner`` as well, both taggers
+            run over one tokenization and a dict with ``entities`` and ``pos`` is returned.
+        mini_batch_size (int): Sentences per tagger forward pass.
+        split_sentences (bool): Split texts into sentences before tagging, so the
+            tagger sees bounded sequence lengths. Entity offsets still refer to the
+            original text. Off by default: each text is tagged as one sentence.
         **kwargs: Additional options (unused).
 
     Returns:
-        list or str: Tokens, entities, or tagged tokens.
+        list or str or dict: Tokens, entities, tagged tokens, or both entities and
+        tagged tokens.
+
+    Raises:
+        RuntimeError: If flair is not installed.
+    """
+    return parse_batch([text], lowercase=lowercase, remove_punctuation=remove_punctuation,
+                       remove_stopwords=remove_stopwords, lemmatize=lemmatize,
+                       tokenize=tokenize, ner=ner, pos_tag=pos_tag,
+                       mini_batch_size=mini_batch_size, split_sentences=split_sentences,
+                       **kwargs)[0]
+
+
+def parse_batch(texts, lowercase=False, remove_punctuation=False, remove_stopwords=False,
+                lemmatize=False, tokenize=False, ner=False, pos_tag=False, mini_batch_size=32,
+                split_sentences=False, **kwargs):
+    """
+    Parse a list of texts using Flair.
+
+    Taggers are loaded once and ``predict`` is called on the sentences of every
+    text together, ``mini_batch_size`` at a time. Options are the same as for
+    :func:`parse`.
+
+    Args:
+        texts (list of str): Input texts to parse.
+
+    Returns:
+        list: One result per input text, in input order.
 
     Raises:
         RuntimeError: If flair is not installed.
     """
     try:
         from flair.data import Sentence
-        from flair.models import SequenceTagger
     except ImportError:
         raise RuntimeError(
             "Flair library not found. "
             "Install with: pip install sparse[specialized]"
         )
 
+    if not (ner or pos_tag):
+        # Basic tokenization (simplified)
+        results = []
+        for text in texts:
+            tokens = [token.text for token in Sentence(text)]
+
+            if tokenize:
+                results.append(tokens)
+            else:
+                results.append(' '.join(tokens))
+        return results
+
+    if split_sentences:
+        splitter = _sentence_splitter()
+        groups = [splitter.split(text) for text in texts]
+    else:
+        groups = [[Sentence(text)] for text in texts]
+    sentences = [sentence for group in groups for sentence in group]
+
+    # Both taggers annotate the same Sentence objects, so text is tokenized once.
     if ner:
-        try:
-            tagger = SequenceTagger.load('ner')
-        except Exception as e:
-            raise RuntimeError(f"Failed to load Flair NER model: {e}")
-
-        sentence = Sentence(text)
-        tagger.predict(sentence)
-        entities = [
-            {"text": ent.text, "label": ent.tag, "start": ent.start_position, "end": ent.end_position}
-            for ent in sentence.get_spans('ner')
-        ]
-        return entities
+        _load_tagger('ner').predict(sentences, mini_batch_size=mini_batch_size)
+    if pos_tag:
+        pos_tagger = _load_tagger('pos')
+        pos_tagger.predict(sentences, mini_batch_size=mini_batch_size)
+
+    results = []
+    for group in groups:
+        if ner:
+            entities = [
+                {"text": ent.text, "label": ent.tag,
+                 "start": _offset(sentence) + ent.start_position,
+                 "end": _offset(sentence) + ent.end_position}
+                for sentence in group for ent in sentence.get_spans('ner')
+            ]
+        if pos_tag:
+            tagged = [
+                (token.text, token.get_label(pos_tagger.label_type).value)
+                for sentence in group for token in sentence
+            ]
+        if ner and pos_tag:
+            results.append({"entities": entities, "pos": tagged})
+        else:
+            results.append(entities if ner else tagged)
+    return results
 
+
+def preload(ner=False, pos_tag=False, **kwargs):
+    """Load the taggers the options need into this process's cache."""
+    if ner:
+        _load_tagger('ner')
     if pos_tag:
-        try:
-            tagger = SequenceTagger.load('pos')
-        except Exception as e:
-            raise RuntimeError(f"Failed to load Flair POS model: {e}")
-
-        sentence = Sentence(text)
-        tagger.predict(sentence)
-        tagged = [(token.text, token.tag) for token in sentence]
-        return tagged
-
-    # Basic tokenization (simplified)
-    sentence = Sentence(text)
-    tokens = [token.text for token in sentence]
-
-    if tokenize:
-        return tokens
-    else:
-        return ' '.join(tokens)
+        _load_tagger('pos')
+
+
+def _load_tagger(name):
+    return models.get('flair', name, lambda: _tagger_load(name))
+
+
+def _tagger_load(name):
+    try:
+        from flair.models import SequenceTagger
+    except ImportError:
+        raise RuntimeError(
+            "Flair library not found. "
+            "Install with: pip install sparse[specialized]"
+        )
+
+    try:
+        return SequenceTagger.load(name)
+    except Exception as e:
+        raise RuntimeError(f"Failed to load Flair {name.upper()} model: {e}")
+
+
+_splitter = None
+
+
+def _sentence_splitter():
+    global _splitter
+
+    if _splitter is None:
+        from flair.splitter import SegtokSentenceSplitter
+
+        _splitter = SegtokSentenceSplitter()
+    return _splitter
+
+
+def _offset(sentence):
+    # Sentences produced by the splitter know where they start in the original text.
+    return getattr(sentence, 'start_position', None) or 0
@@ -1,16 +1,25 @@
 """Gensim-based text processing engine.
 
 This engine leverages `gensim` utilities for lightweight preprocessing and
-also optionally uses NLTK for lemmatization when requested. It is intended
-as a starting point for Phase 2 functionality (embeddings, topic modeling,
-etc.).
+also optionally uses NLTK for lemmatization when requested.
+
+For training over large corpora, :class:`TokenStream` streams ``sparse``-processed
+token lists and can be iterated any number of times (as Word2Vec and LDA
+require), :func:`build_dictionary` builds a ``Dictionary`` in one pass and
+:func:`serialize_corpus` writes bag-of-words vectors to an ``MmCorpus`` on disk.
+:func:`train_vectors` trains Word2Vec or FastText embeddings from such a stream
+and saves them so :func:`load_vectors` can memory-map them: worker processes
+loading the same file share one read-only copy through the OS page cache.
 """
 
+import os
 from typing import List, Union
 
+from sparse import models
+
 
 def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=False,
-          lemmatize=False, tokenize=False, **kwargs):
+          lemmatize=False, tokenize=False, embed=False, vectors=None, **kwargs):
     """
     Parse text using gensim preprocessing utilities.
 
@@ -21,22 +30,20 @@ def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=Fals
         remove_stopwords (bool): Remove gensim's built-in stop words.
         lemmatize (bool): Apply NLTK WordNet lemmatizer to tokens.
         tokenize (bool): Return tokens list instead of joined string.
+        embed (bool): Return the average of the tokens' vectors as a NumPy array.
+        vectors (str): Path of vectors saved by :func:`train_vectors` (required
+            with ``embed``).
         **kwargs: Additional options (unused).
 
     Returns:
-        list or str: Processed tokens or joined string.
+        list or str or numpy.ndarray: Processed tokens, joined string or document vector.
 
     Raises:
         RuntimeError: If gensim is not installed or required NLTK data is missing.
     """
-    try:
-        from gensim.utils import simple_preprocess
-        from gensim.parsing.preprocessing import STOPWORDS as GENSIM_STOPWORDS
-    except ImportError:
-        raise RuntimeError(
-            "Gensim library not found. "
-            "Install with: pip install sparse[advanced]"
-        )
+    _import_gensim()
+    from gensim.utils import simple_preprocess
+    from gensim.parsing.preprocessing import STOPWORDS as GENSIM_STOPWORDS
 
     # simple_preprocess lowercases and removes punctuation by default
     # ``deacc=True`` strips accent marks.
@@ -56,7 +63,238 @@ def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=Fals
                 "Run: python -m nltk.downloader wordnet omw-1.4"
             )
 
+    if embed:
+        return _mean_vector(load_vectors(vectors), tokens)
+
     if tokenize:
         return tokens
     else:
         return ' '.join(tokens)
+
+
+def preload(embed=False, vectors=None, **kwargs):
+    """Map the vectors into this process's cache so later calls skip loading."""
+    if embed:
+        load_vectors(vectors)
+
+
+class TokenStream:
+    """
+    Restartable iterable of token lists.
+
+    Each iteration re-reads ``source`` and parses it with
+    :func:`sparse.iter_parse` (``tokenize=True``), so only one batch of
+    documents is in memory at a time.
+
+    Example::
+
+        tokens = TokenStream("corpus.txt", remove_stopwords=True)
+        dictionary = build_dictionary(tokens, no_below=5, no_above=0.5)
+        corpus = serialize_corpus(tokens, dictionary, "corpus.mm")
+        lda = LdaModel(corpus, id2word=dictionary, num_topics=100)
+        w2v = Word2Vec(tokens, vector_size=100)
+
+    Args:
+        source: Where to read texts from on each iteration: a file path (one
+            document per line), a list of file paths, a zero-argument callable
+            returning a fresh iterable (e.g. a generator function), or any other
+            re-iterable such as a list. A one-shot iterator can be passed but
+            only iterated once.
+        engine (str, optional): Engine to use. Defaults to 'gensim'; None = lightweight.
+        batch_size (int): Number of texts handed to the engine at a time.
+        workers (int, optional): Parse batches in this many worker processes.
+        key (callable, optional): Extract the text from each item.
+        **options: Same options accepted by :func:`sparse.parse`.
+    """
+
+    def __init__(self, source, engine='gensim', batch_size=256, workers=None, key=None,
+                 **options):
+        self.source = source
+        self.engine = engine
+        self.batch_size = batch_size
+        self.workers = workers
+        self.key = key
+        self.options = options
+        self._consumed = False
+
+    def __iter__(self):
+        from sparse.corpus import iter_parse
+
+        options = dict(self.options, tokenize=True)
+        for tokens in iter_parse(self._texts(), engine=self.engine, batch_size=self.batch_size,
+                                 workers=self.workers, key=self.key, **options):
+            # Engines without a token output return text
+            yield tokens.split() if isinstance(tokens, str) else tokens
+
+    def _texts(self):
+        source = self.source
+        if isinstance(source, (str, os.PathLike)):
+            return _read_lines([source])
+        if isinstance(source, (list, tuple)) and source and all(
+                isinstance(item, os.PathLike) or isinstance(item, str) and os.path.isfile(item)
+                for item in source):
+            return _read_lines(source)
+        if callable(source):
+            return source()
+        if iter(source) is source:
+            if self._consumed:
+                raise RuntimeError(
+                    "TokenStream source is a one-shot iterator and was already consumed; "
+                    "pass a list, file path or generator function to iterate again."
+                )
+            self._consumed = True
+        return source
+
+
+def _read_lines(paths):
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                yield line.rstrip('\r\n')
+
+
+def build_dictionary(documents, prune_at=2000000, **filter_options):
+    """
+    Build a ``gensim.corpora.Dictionary`` in one pass over ``documents``.
+
+    Args:
+        documents (iterable of list of str): Token lists, e.g. a :class:`TokenStream`.
+        prune_at (int): Bound on distinct tokens kept while counting.
+        **filter_options: If given, passed to ``Dictionary.filter_extremes``
+            (``no_below``, ``no_above``, ``keep_n``).
+
+    Returns:
+        gensim.corpora.Dictionary: The dictionary.
+
+    Raises:
+        RuntimeError: If gensim is not installed.
+    """
+    _import_gensim()
+    from gensim.corpora import Dictionary
+
+    dictionary = Dictionary(documents, prune_at=prune_at)
+    if filter_options:
+        dictionary.filter_extremes(**filter_options)
+    return dictionary
+
+
+def serialize_corpus(documents, dictionary, path):
+    """
+    Stream bag-of-words vectors of ``documents`` to a Matrix Market file.
+
+    Args:
+        documents (iterable of list of str): Token lists, e.g. a :class:`TokenStream`.
+        dictionary (gensim.corpora.Dictionary): Maps tokens to ids.
+        path (str): Output ``.mm`` file; an index is written alongside it.
+
+    Returns:
+        gensim.corpora.MmCorpus: The corpus, read lazily from ``path``.
+
+    Raises:
+        RuntimeError: If gensim is not installed.
+    """
+    _import_gensim()
+    from gensim.corpora import MmCorpus
+
+    # id2word fixes num_terms to the dictionary, even if its highest ids never occur
+    MmCorpus.serialize(os.fspath(path), (dictionary.doc2bow(tokens) for tokens in documents),
+                       id2word=dictionary)
+    return MmCorpus(os.fspath(path))
+
+
+def train_vectors(documents, path=None, algorithm='word2vec', workers=None, vector_size=100,
+                  window=5, min_count=5, epochs=5, **model_options):
+    """
+    Train Word2Vec or FastText embeddings over a stream of token lists.
+
+    ``documents`` is iterated once to build the vocabulary and once per epoch,
+    so it must be restartable, e.g. a :class:`TokenStream`.
+
+    Args:
+        documents (iterable of list of str): Token lists.
+        path (str, optional): Save the vectors here, with every array in its own
+            ``.npy`` file so :func:`load_vectors` can memory-map them.
+        algorithm (str): "word2vec" or "fasttext".
+        workers (int, optional): Training threads (default: ``os.cpu_count()``).
+        vector_size (int): Dimensionality of the vectors.
+        window (int): Maximum distance between a word and its context words.
+        min_count (int): Ignore tokens with a lower total frequency.
+        epochs (int): Passes over ``documents``.
+        **model_options: Passed to ``Word2Vec``/``FastText``.
+
+    Returns:
+        gensim.models.KeyedVectors: The trained vectors.
+
+    Raises:
+        RuntimeError: If gensim is not installed.
+        ValueError: If ``algorithm`` is unknown.
+    """
+    _import_gensim()
+    from gensim.models import FastText, Word2Vec
+
+    if algorithm == 'word2vec':
+        model_class = Word2Vec
+    elif algorithm == 'fasttext':
+        model_class = FastText
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+
+    model = model_class(documents, vector_size=vector_size, window=window,
+                        min_count=min_count, epochs=epochs,
+                        workers=workers or os.cpu_count() or 1, **model_options)
+    if path is not None:
+        # sep_limit=0 stores every array outside the pickle, where mmap can reach it
+        model.wv.save(os.fspath(path), sep_limit=0)
+    return model.wv
+
+
+def load_vectors(path):
+    """
+    Return the vectors saved at ``path``, memory-mapped read-only.
+
+    Loaded once per process; the arrays stay on disk and are paged in on use,
+    so concurrent processes share a single copy.
+
+    Args:
+        path (str): Path given to :func:`train_vectors`.
+
+    Returns:
+        gensim.models.KeyedVectors: The vectors.
+
+    Raises:
+        RuntimeError: If gensim is not installed or the vectors cannot be loaded.
+    """
+    if not path:
+        raise RuntimeError("Gensim embeddings require a vectors path.")
+    return models.get('gensim', os.fspath(path), lambda: _vectors_load(os.fspath(path)))
+
+
+def _vectors_load(path):
+    _import_gensim()
+    from gensim.models import KeyedVectors
+
+    try:
+        return KeyedVectors.load(path, mmap='r')
+    except Exception as e:
+        raise RuntimeError(f"Failed to load vectors '{path}': {e}")
+
+
+def _mean_vector(vectors, tokens):
+    import numpy as np
+
+    # FastText vectors also cover unseen tokens through character n-grams
+    known = [token for token in tokens if token in vectors]
+    if not known:
+        return np.zeros(vectors.vector_size, dtype=np.float32)
+    return np.mean([vectors[token] for token in known], axis=0)
+
+
+def _import_gensim():
+    try:
+        import gensim
+    except ImportError:
+        raise RuntimeError(
+            "Gensim library not found. "
+            "Install with: pip install sparse[advanced]"
+        )
+    return gensim
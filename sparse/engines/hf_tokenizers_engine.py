@@ -4,12 +4,18 @@ This engine uses the `tokenizers` library for high-performance tokenization,
 focusing on subword models like BPE, WordPiece, and Unigram.
 """
 
+import contextlib
+import os
+import threading
+import warnings
 from typing import List, Union
 
+from sparse import arrays, models
+
 
 def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=False,
           lemmatize=False, tokenize=False, return_ids=False, model_name='bert-base-uncased',
-          **kwargs):
+          as_arrays=False, **kwargs):
     """
     Parse text using Hugging Face tokenizers.
 
@@ -21,40 +27,179 @@ def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=Fals
         lemmatize (bool): Ignored.
         tokenize (bool): Return tokens list instead of joined string.
         return_ids (bool): Return token IDs instead of strings.
-        model_name (str): Pretrained tokenizer name (e.g., 'bert-base-uncased').
+        model_name (str): Pretrained tokenizer name (e.g., 'bert-base-uncased'), or the
+            path of a local ``tokenizer.json`` (or a directory containing one) to
+            load without network access.
+        as_arrays (bool): Return NumPy arrays: ``ids`` and ``offsets`` (one
+            ``(start, end)`` character span per token).
         **kwargs: Additional options (unused).
 
     Returns:
-        list or str: Tokens or joined text.
+        list or str or dict: Tokens, joined text, or a dict of arrays.
 
     Raises:
         RuntimeError: If tokenizers library is not installed.
     """
+    tokenizer = _load_tokenizer(model_name)
+
+    # Encode the text
+    encoding = tokenizer.encode(text)
+
+    if as_arrays:
+        return _arrays_per_text([encoding])[0]
+    return _format_encoding(encoding, tokenize, return_ids)
+
+
+def parse_batch(texts, lowercase=False, remove_punctuation=False, remove_stopwords=False,
+                lemmatize=False, tokenize=False, return_ids=False,
+                model_name='bert-base-uncased', as_arrays=False, num_threads=None, **kwargs):
+    """
+    Parse a list of texts using ``Tokenizer.encode_batch``.
+
+    The tokenizer is loaded once and the whole list is encoded in a single call,
+    which runs in parallel in Rust without holding the GIL. Options are the same
+    as for :func:`parse`.
+
+    Args:
+        texts (list of str): Input texts to parse.
+        num_threads (int, optional): Threads for this ``encode_batch`` call. 1
+            disables parallelism. Larger values size the Rust thread pool, which
+            only takes effect before the first parallel encode in the process.
+            The environment is restored after the call; calls passing
+            ``num_threads`` from several threads encode one at a time.
+
+    Returns:
+        list: One result per input text, in input order.
+
+    Raises:
+        RuntimeError: If tokenizers library is not installed.
+    """
+    tokenizer = _load_tokenizer(model_name)
+    with _thread_settings(num_threads):
+        encodings = tokenizer.encode_batch(list(texts))
+    if as_arrays:
+        return _arrays_per_text(encodings)
+    return [_format_encoding(encoding, tokenize, return_ids) for encoding in encodings]
+
+
+def encode(texts, model_name='bert-base-uncased', num_threads=None):
+    """
+    Encode a list of texts into flat arrays.
+
+    Args:
+        texts (list of str): Input texts.
+        model_name (str): Pretrained tokenizer name or local ``tokenizer.json`` path.
+        num_threads (int, optional): See :func:`parse_batch`.
+
+    Returns:
+        dict: ``ids`` (uint32), ``offsets`` (int64, shape ``(n_tokens, 2)``) and
+        ``row_splits``; text ``i`` owns rows ``row_splits[i]:row_splits[i + 1]``.
+    """
+    tokenizer = _load_tokenizer(model_name)
+    with _thread_settings(num_threads):
+        encodings = tokenizer.encode_batch(list(texts))
+    return _flat_arrays(encodings)
+
+
+def _arrays_per_text(encodings):
+    """Return per-text ``{'ids', 'offsets'}`` dicts viewing one flat buffer per field."""
+    flat = _flat_arrays(encodings)
+    ids = arrays.split(flat['ids'], flat['row_splits'])
+    offsets = arrays.split(flat['offsets'], flat['row_splits'])
+    return [{'ids': i, 'offsets': o} for i, o in zip(ids, offsets)]
+
+
+def preload(model_name='bert-base-uncased', **kwargs):
+    """Load the tokenizer into this process's cache so later calls skip loading."""
+    _load_tokenizer(model_name)
+
+
+def _flat_arrays(encodings):
+    import numpy as np
+
+    ids, row_splits = arrays.concat([encoding.ids for encoding in encodings], np.uint32)
+    offsets, _ = arrays.concat([encoding.offsets for encoding in encodings], np.int64, width=2)
+    return {'ids': ids, 'offsets': offsets, 'row_splits': row_splits}
+
+
+_num_threads = None
+
+# os.environ is process-wide: overriding calls run one at a time so each
+# restores exactly what it saved.
+_environ_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def _thread_settings(num_threads):
+    """Apply ``num_threads`` for one ``encode_batch`` call, then restore the environment."""
+    if num_threads is None:
+        yield
+        return
+
+    with _environ_lock:
+        with _environ_override(num_threads):
+            yield
+
+
+@contextlib.contextmanager
+def _environ_override(num_threads):
+    global _num_threads
+
+    updates = {'TOKENIZERS_PARALLELISM': 'false' if num_threads == 1 else 'true'}
+    if num_threads > 1:
+        # The Rayon pool is sized once, on the first parallel encode in the process.
+        if _num_threads is None and 'RAYON_NUM_THREADS' not in os.environ:
+            _num_threads = num_threads
+        pool_threads = _num_threads or os.environ.get('RAYON_NUM_THREADS')
+        if str(pool_threads) != str(num_threads):
+            warnings.warn(
+                f"Tokenizers thread pool already uses {pool_threads} threads; "
+                f"num_threads={num_threads} is ignored."
+            )
+        else:
+            updates['RAYON_NUM_THREADS'] = str(num_threads)
+
+    previous = {name: os.environ.get(name) for name in updates}
+    os.environ.update(updates)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _load_tokenizer(model_name):
+    return models.get('hf_tokenizers', model_name, lambda: _tokenizer_load(model_name))
+
+
+def _tokenizer_load(model_name):
     try:
         from tokenizers import Tokenizer
-        from tokenizers.models import BPE, WordPiece, Unigram
-        from tokenizers.pre_tokenizers import Whitespace
-        from tokenizers.decoders import ByteLevel as ByteLevelDecoder
-        from tokenizers.normalizers import NFD, StripAccents
-        from tokenizers.trainers import BpeTrainer, WordPieceTrainer, UnigramTrainer
     except ImportError:
         raise RuntimeError(
             "Tokenizers library not found. "
             "Install with: pip install sparse[specialized]"
         )
 
+    path = model_name
+    if os.path.isdir(path):
+        path = os.path.join(path, 'tokenizer.json')
+
     try:
-        # For simplicity, use a basic tokenizer; in practice, load from pretrained
-        tokenizer = Tokenizer.from_pretrained(model_name)
+        if os.path.isfile(path):
+            return Tokenizer.from_file(path)
+        return Tokenizer.from_pretrained(model_name)
     except Exception as e:
         raise RuntimeError(
             f"Unable to load tokenizer '{model_name}': {e}. "
-            "Ensure the model name is valid."
+            "Ensure the model name or tokenizer.json path is valid."
         )
 
-    # Encode the text
-    encoding = tokenizer.encode(text)
 
+def _format_encoding(encoding, tokenize, return_ids):
     if return_ids:
         return encoding.ids
 
@@ -4,11 +4,15 @@ This engine uses SentencePiece for subword and character-level tokenization,
 suitable for multilingual and low-resource languages.
 """
 
+import functools
+import re
 from typing import List, Union
 
+from sparse import arrays, models
+
 
 def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=False,
-          lemmatize=False, tokenize=False, model_file=None, **kwargs):
+          lemmatize=False, tokenize=False, model_file=None, out_type=str, **kwargs):
     """
     Parse text using SentencePiece.
 
@@ -20,38 +24,181 @@ def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=Fals
         lemmatize (bool): Ignored.
         tokenize (bool): Return tokens list instead of joined string.
         model_file (str): Path to SentencePiece model file (required).
+        out_type (type): ``str`` for pieces; ``int`` for a dict of NumPy arrays:
+            ``ids`` and ``offsets`` (one ``(start, end)`` character span per piece).
         **kwargs: Additional options (unused).
 
     Returns:
-        list or str: Tokens or joined text.
+        list or str or dict: Tokens, joined text, or a dict of arrays.
+
+    Raises:
+        RuntimeError: If sentencepiece is not installed or model not found.
+    """
+    sp = _load_processor(model_file)
+
+    if lowercase:
+        text = text.lower()
+
+    if out_type is int:
+        return _arrays_per_text(_encode_protos(sp, [text], None), [text])[0]
+
+    # Tokenize
+    tokens = sp.encode_as_pieces(text)
+
+    if tokenize:
+        return tokens
+    else:
+        return ' '.join(tokens)
+
+
+def parse_batch(texts, lowercase=False, remove_punctuation=False, remove_stopwords=False,
+                lemmatize=False, tokenize=False, model_file=None, out_type=str,
+                num_threads=None, **kwargs):
+    """
+    Parse a list of texts using SentencePiece list encoding.
+
+    The model is loaded once and the whole list is encoded in a single
+    ``encode`` call, which SentencePiece spreads over native threads. Options
+    are the same as for :func:`parse`.
+
+    Args:
+        texts (list of str): Input texts to parse.
+        num_threads (int, optional): Threads for batched encoding. Defaults to
+            SentencePiece's own setting (all cores).
+
+    Returns:
+        list: One result per input text, in input order.
+
+    Raises:
+        RuntimeError: If sentencepiece is not installed or model not found.
+    """
+    sp = _load_processor(model_file)
+
+    texts = list(texts)
+    if lowercase:
+        texts = [text.lower() for text in texts]
+
+    if out_type is int:
+        return _arrays_per_text(_encode_protos(sp, texts, num_threads), texts)
+
+    pieces = _encode(sp, texts, str, num_threads)
+
+    if tokenize:
+        return pieces
+    else:
+        return [' '.join(tokens) for tokens in pieces]
+
+
+def encode(texts, model_file, lowercase=False, num_threads=None):
+    """
+    Encode a list of texts into flat arrays.
+
+    Args:
+        texts (list of str): Input texts.
+        model_file (str): Path to SentencePiece model file.
+        lowercase (bool): Convert to lowercase before encoding.
+        num_threads (int, optional): See :func:`parse_batch`.
+
+    Returns:
+        dict: ``ids`` (int32), ``offsets`` (int64, shape ``(n_pieces, 2)``) and
+        ``row_splits``; text ``i`` owns rows ``row_splits[i]:row_splits[i + 1]``.
 
     Raises:
         RuntimeError: If sentencepiece is not installed or model not found.
     """
+    sp = _load_processor(model_file)
+
+    texts = list(texts)
+    if lowercase:
+        texts = [text.lower() for text in texts]
+    return _flat_arrays(_encode_protos(sp, texts, num_threads), texts)
+
+
+def preload(model_file=None, **kwargs):
+    """Load the model into this process's cache so later calls skip loading."""
+    _load_processor(model_file)
+
+
+def _encode(sp, texts, out_type, num_threads):
+    if num_threads is None:
+        return sp.encode(texts, out_type=out_type)
+    return sp.encode(texts, out_type=out_type, num_threads=num_threads)
+
+
+def _encode_protos(sp, texts, num_threads):
+    # Pieces carry ids plus begin/end offsets into the input: characters for
+    # 'immutable_proto', UTF-8 bytes for 'proto' (see _flat_arrays).
+    return _encode(sp, texts, _proto_out_type(), num_threads)
+
+
+@functools.lru_cache(maxsize=None)
+def _proto_out_type():
+    """Return the proto ``out_type`` supported by the installed SentencePiece."""
+    import sentencepiece as spm
+
+    # 0.2.1 removed 'immutable_proto'; 'proto' needs the protobuf package.
+    version = tuple(int(part) for part in re.findall(r'\d+', spm.__version__)[:3])
+    if version < (0, 2, 1):
+        return 'immutable_proto'
     try:
-        import sentencepiece as spm
+        import google.protobuf  # noqa: F401
     except ImportError:
         raise RuntimeError(
-            "SentencePiece library not found. "
+            "SentencePiece >= 0.2.1 needs protobuf for out_type=int. "
             "Install with: pip install sparse[specialized]"
         )
+    return 'proto'
+
+
+def _arrays_per_text(protos, texts):
+    """Return per-text ``{'ids', 'offsets'}`` dicts viewing one flat buffer per field."""
+    flat = _flat_arrays(protos, texts)
+    ids = arrays.split(flat['ids'], flat['row_splits'])
+    offsets = arrays.split(flat['offsets'], flat['row_splits'])
+    return [{'ids': i, 'offsets': o} for i, o in zip(ids, offsets)]
+
+
+def _flat_arrays(protos, texts):
+    import numpy as np
+
+    ids, row_splits = arrays.concat([[piece.id for piece in proto.pieces] for proto in protos],
+                                    np.int32)
+    spans = [[(piece.begin, piece.end) for piece in proto.pieces] for proto in protos]
+    if _proto_out_type() == 'proto':
+        spans = [_char_spans(text, text_spans) for text, text_spans in zip(texts, spans)]
+    offsets, _ = arrays.concat(spans, np.int64, width=2)
+    return {'ids': ids, 'offsets': offsets, 'row_splits': row_splits}
+
+
+def _char_spans(text, spans):
+    """Convert UTF-8 byte offsets into ``text`` to character offsets."""
+    if text.isascii():
+        return spans
+    char_index = []
+    for i, char in enumerate(text):
+        char_index.extend([i] * len(char.encode('utf-8')))
+    char_index.append(len(text))
+    return [(char_index[begin], char_index[end]) for begin, end in spans]
 
+
+def _load_processor(model_file):
     if not model_file:
         raise RuntimeError("SentencePiece requires a model_file path.")
+    return models.get('sentencepiece', model_file, lambda: _processor_load(model_file))
+
+
+def _processor_load(model_file):
+    try:
+        import sentencepiece as spm
+    except ImportError:
+        raise RuntimeError(
+            "SentencePiece library not found. "
+            "Install with: pip install sparse[specialized]"
+        )
 
     try:
         sp = spm.SentencePieceProcessor()
         sp.load(model_file)
     except Exception as e:
         raise RuntimeError(f"Failed to load SentencePiece model '{model_file}': {e}")
-
-    if lowercase:
-        text = text.lower()
-
-    # Tokenize
-    tokens = sp.encode_as_pieces(text)
-
-    if tokenize:
-        return tokens
-    else:
-        return ' '.join(tokens)
+    return sp
@@ -1,5 +1,17 @@
-"""Scikit-learn feature extraction engine."""
+"""Scikit-learn feature extraction engine.
 
+:func:`parse` vectorizes one text on its own. For a corpus, use
+:class:`CorpusVectorizer`, which fits the vocabulary (and IDF) once over all
+documents and returns a single CSR matrix. For corpora that do not fit in
+memory, :class:`HashingFeaturizer` hashes streamed chunks without keeping a
+vocabulary, optionally in worker processes and into ``.npz`` shards on disk.
+"""
+
+import itertools
+import os
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import Union, List
 
 
@@ -21,13 +33,6 @@ def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=Fals
     Raises:
         RuntimeError: If scikit-learn is not installed.
     """
-    try:
-        from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
-    except ImportError:
-        raise RuntimeError(
-            "scikit-learn not installed. Install with: pip install sparse[utils]"
-        )
-
     processed = text
     if lowercase:
         processed = processed.lower()
@@ -39,11 +44,320 @@ def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=Fals
     if tokenize:
         return processed.split()
 
+    return _make_vectorizer(vectorizer, kwargs).fit_transform([processed])
+
+
+class CorpusVectorizer:
+    """
+    Fit a Count/TF-IDF vectorizer once over a corpus.
+
+    Documents are preprocessed with :func:`sparse.iter_parse`, so any ``sparse``
+    options (and engine) apply, and streamed into the vectorizer without
+    materializing the corpus. With ``tokenize=True`` the engine's tokens are
+    used as-is instead of the vectorizer's own analyzer.
+
+    Example::
+
+        vectorizer = CorpusVectorizer("tfidf", lowercase=True, remove_punctuation=True,
+                                      vectorizer_options={"min_df": 2})
+        X = vectorizer.fit_transform(open("corpus.txt"))
+        vectorizer.save("tfidf.pkl")
+        X_new = CorpusVectorizer.load("tfidf.pkl").transform(new_texts)
+
+    Args:
+        vectorizer (str): "count" or "tfidf".
+        engine (str, optional): Engine used to preprocess documents. None = lightweight.
+        batch_size (int): Documents preprocessed at a time.
+        workers (int, optional): Preprocess in this many worker processes.
+        vectorizer_options (dict, optional): Passed to the scikit-learn vectorizer.
+        **options: Same options accepted by :func:`sparse.parse`.
+
+    Raises:
+        RuntimeError: If scikit-learn is not installed.
+        ValueError: If ``vectorizer`` is unknown.
+    """
+
+    def __init__(self, vectorizer="count", engine=None, batch_size=1000, workers=None,
+                 vectorizer_options=None, **options):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.workers = workers
+        self.options = options
+
+        vectorizer_options = dict(vectorizer_options or {})
+        if options.get('tokenize'):
+            vectorizer_options.setdefault('analyzer', _tokens)
+        self.vectorizer = _make_vectorizer(vectorizer, vectorizer_options)
+
+    def fit(self, texts):
+        """Learn the vocabulary (and IDF) from ``texts``. Returns ``self``."""
+        self.vectorizer.fit(self._preprocess(texts))
+        return self
+
+    def fit_transform(self, texts):
+        """
+        Learn the vocabulary from ``texts`` and return their document-term matrix.
+
+        Args:
+            texts (iterable of str): The corpus. Consumed once, lazily.
+
+        Returns:
+            scipy.sparse.csr_matrix: One row per document.
+        """
+        return self.vectorizer.fit_transform(self._preprocess(texts)).tocsr()
+
+    def transform(self, texts):
+        """
+        Return the document-term matrix of ``texts`` using the fitted vocabulary.
+
+        Args:
+            texts (iterable of str): Documents to vectorize.
+
+        Returns:
+            scipy.sparse.csr_matrix: One row per document.
+        """
+        return self.vectorizer.transform(self._preprocess(texts)).tocsr()
+
+    def get_feature_names_out(self):
+        """Return the fitted vocabulary, in column order."""
+        return self.vectorizer.get_feature_names_out()
+
+    def save(self, path):
+        """Write the fitted vectorizer and its preprocessing options to ``path``."""
+        with open(path, 'wb') as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """Read a vectorizer written by :meth:`save`."""
+        with open(path, 'rb') as f:
+            vectorizer = pickle.load(f)
+        if not isinstance(vectorizer, cls):
+            raise ValueError(f"{path} does not contain a {cls.__name__}")
+        return vectorizer
+
+    def _preprocess(self, texts):
+        from sparse.corpus import iter_parse
+
+        return iter_parse(texts, engine=self.engine, batch_size=self.batch_size,
+                          workers=self.workers, **self.options)
+
+
+class HashingFeaturizer:
+    """
+    Stateless, out-of-core featurizer built on ``HashingVectorizer``.
+
+    Texts are read in chunks of ``chunksize``; each chunk is preprocessed with
+    the usual ``sparse`` options and hashed into ``n_features`` columns, so
+    memory is bounded by the chunk size and ``n_features``, never by the corpus
+    or its vocabulary. With ``workers``, chunks are featurized in a process pool
+    with at most ``2 * workers`` chunks in flight.
+
+    With ``tfidf=True``, chunks hold raw term counts until :meth:`fit` has made
+    a first streaming pass to count document frequencies; later transforms
+    (the second pass) are IDF-weighted and normalized with ``norm``.
+
+    Example::
+
+        featurizer = HashingFeaturizer(n_features=2**20, tfidf=True, workers=8,
+                                       lowercase=True)
+        featurizer.fit(open("corpus.txt"))
+        paths = featurizer.write_shards(open("corpus.txt"), "features/")
+        X = load_shards(paths)
+
+    Args:
+        n_features (int): Number of hashed columns.
+        tfidf (bool): Reweight counts with IDF learned by :meth:`fit`.
+        norm (str, optional): Row normalization, "l2", "l1" or None.
+        engine (str, optional): Engine used to preprocess documents. None = lightweight.
+        chunksize (int): Documents featurized per chunk (and per shard).
+        workers (int, optional): Featurize chunks in this many worker processes.
+        vectorizer_options (dict, optional): Passed to ``HashingVectorizer``.
+        **options: Same options accepted by :func:`sparse.parse`.
+
+    Raises:
+        RuntimeError: If scikit-learn is not installed.
+    """
+
+    def __init__(self, n_features=2 ** 20, tfidf=False, norm="l2", engine=None, chunksize=10000,
+                 workers=None, vectorizer_options=None, **options):
+        try:
+            from sklearn.feature_extraction.text import HashingVectorizer
+        except ImportError:
+            raise RuntimeError(
+                "scikit-learn not installed. Install with: pip install sparse[utils]"
+            )
+
+        if chunksize < 1:
+            raise ValueError(f'chunksize must be at least 1, got {chunksize}')
+        self.n_features = n_features
+        self.tfidf = tfidf
+        self.norm = norm
+        self.engine = engine
+        self.chunksize = chunksize
+        self.workers = workers
+        self.options = options
+        self.idf_ = None
+
+        vectorizer_options = dict(vectorizer_options or {})
+        if options.get('tokenize'):
+            vectorizer_options.setdefault('analyzer', _tokens)
+        if tfidf:
+            # Counts must stay non-negative and unnormalized until reweighted.
+            vectorizer_options.update(alternate_sign=False, norm=None)
+        else:
+            vectorizer_options.setdefault('norm', norm)
+        self.vectorizer = HashingVectorizer(n_features=n_features, **vectorizer_options)
+
+    def fit(self, texts):
+        """
+        Learn IDF weights in one streaming pass over ``texts``.
+
+        Only a document-frequency count per hashed column is kept. A no-op
+        unless ``tfidf=True``.
+
+        Returns:
+            HashingFeaturizer: ``self``.
+        """
+        import numpy as np
+
+        if not self.tfidf:
+            return self
+        n_documents = 0
+        df = np.zeros(self.n_features, dtype=np.int64)
+        for counts in self._map(texts, reweight=False):
+            n_documents += counts.shape[0]
+            df += np.bincount(counts.indices, minlength=self.n_features)
+        # Smoothed IDF, as computed by TfidfTransformer
+        self.idf_ = np.log((1 + n_documents) / (1 + df)) + 1
+        return self
+
+    def iter_transform(self, texts):
+        """
+        Featurize ``texts`` chunk by chunk.
+
+        Args:
+            texts (iterable of str): Documents. Consumed lazily.
+
+        Yields:
+            scipy.sparse.csr_matrix: One matrix of ``chunksize`` rows (fewer for the
+            last chunk) per chunk, in input order.
+
+        Raises:
+            RuntimeError: If ``tfidf=True`` and :meth:`fit` has not been called.
+        """
+        if self.tfidf and self.idf_ is None:
+            raise RuntimeError("HashingFeaturizer with tfidf=True must be fit() first.")
+        return self._map(texts, reweight=self.tfidf)
+
+    def transform(self, texts):
+        """Featurize ``texts`` and stack the chunks into one CSR matrix."""
+        import scipy.sparse
+
+        chunks = list(self.iter_transform(texts))
+        if not chunks:
+            return scipy.sparse.csr_matrix((0, self.n_features))
+        return scipy.sparse.vstack(chunks, format='csr')
+
+    def write_shards(self, texts, directory, prefix='shard'):
+        """
+        Featurize ``texts`` and write each chunk to ``directory`` as it completes.
+
+        Args:
+            texts (iterable of str): Documents. Consumed lazily.
+            directory (str): Created if missing.
+            prefix (str): Shard file name prefix.
+
+        Returns:
+            list of str: Shard paths (``<prefix>-00000.npz``, ...), in input order.
+        """
+        import scipy.sparse
+
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for i, matrix in enumerate(self.iter_transform(texts)):
+            path = os.path.join(directory, f'{prefix}-{i:05d}.npz')
+            scipy.sparse.save_npz(path, matrix)
+            paths.append(path)
+        return paths
+
+    def _featurize(self, texts, reweight):
+        from sparse import parse_batch
+
+        matrix = self.vectorizer.transform(
+            parse_batch(texts, engine=self.engine, **self.options)
+        ).tocsr()
+        if reweight:
+            from sklearn.preprocessing import normalize
+
+            matrix.data *= self.idf_[matrix.indices]
+            if self.norm:
+                matrix = normalize(matrix, norm=self.norm, copy=False)
+        return matrix
+
+    def _map(self, texts, reweight):
+        from sparse import cache
+        from sparse.corpus import _chunked, _iter_texts
+
+        chunks = _chunked(_iter_texts(texts, None), self.chunksize)
+        if not self.workers:
+            for chunk in chunks:
+                yield self._featurize(chunk, reweight)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_featurizer,
+                                 initargs=(self, cache._active_config)) as executor:
+            pending = deque(
+                executor.submit(_featurize_chunk, chunk, reweight)
+                for chunk in itertools.islice(chunks, 2 * self.workers)
+            )
+            while pending:
+                matrix = pending.popleft().result()
+                for chunk in itertools.islice(chunks, 1):
+                    pending.append(executor.submit(_featurize_chunk, chunk, reweight))
+                yield matrix
+
+
+def load_shards(paths):
+    """Stack shards written by :meth:`HashingFeaturizer.write_shards` into one CSR matrix."""
+    import scipy.sparse
+
+    return scipy.sparse.vstack([scipy.sparse.load_npz(path) for path in paths], format='csr')
+
+
+# Per-worker featurizer, set by ``_init_featurizer`` in each pool process.
+_worker_featurizer = None
+
+
+def _init_featurizer(featurizer, cache_config):
+    global _worker_featurizer
+    from sparse.corpus import _init_worker
+
+    _init_worker(featurizer.engine, featurizer.options, cache_config)
+    _worker_featurizer = featurizer
+
+
+def _featurize_chunk(texts, reweight):
+    return _worker_featurizer._featurize(texts, reweight)
+
+
+def _tokens(doc):
+    # Analyzer for documents the engine already tokenized; engines without a
+    # token output return text, which is split on whitespace.
+    return doc.split() if isinstance(doc, str) else doc
+
+
+def _make_vectorizer(vectorizer, options):
+    try:
+        from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+    except ImportError:
+        raise RuntimeError(
+            "scikit-learn not installed. Install with: pip install sparse[utils]"
+        )
+
     if vectorizer == "count":
-        vec = CountVectorizer(**kwargs)
+        return CountVectorizer(**options)
     elif vectorizer == "tfidf":
-        vec = TfidfVectorizer(**kwargs)
+        return TfidfVectorizer(**options)
     else:
         raise ValueError(f"Unknown vectorizer: {vectorizer}")
-
-    return vec.fit_transform([processed])
@@ -3,12 +3,29 @@
 import spacy
 from typing import List, Union
 
+from sparse import docstore, models
+
+# Trained components loaded only when an option needs them. Other components
+# (e.g. custom rule-based ones) are always kept.
+_OPTIONAL_COMPONENTS = (
+    'tok2vec', 'transformer', 'tagger', 'morphologizer', 'attribute_ruler', 'lemmatizer',
+    'trainable_lemmatizer', 'parser', 'senter', 'ner',
+)
+# Shared embedding layers that other components may listen to.
+_EMBEDDING_COMPONENTS = ('tok2vec', 'transformer')
+_POS_COMPONENTS = ('tagger', 'morphologizer', 'attribute_ruler')
+_LEMMA_COMPONENTS = _POS_COMPONENTS + ('lemmatizer', 'trainable_lemmatizer')
+
 
 def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=False,
           lemmatize=False, tokenize=False, pos_tag=False, ner=False, 
-          model='en_core_web_sm', **kwargs):
+          model='en_core_web_sm', as_arrays=False, doc_store=None, **kwargs):
     """
     Parse text using spaCy.
+
+    Only the pipeline components the options need are loaded: tokenize and
+    stop-word requests use the tokenizer alone, and the tagger and lemmatizer
+    are loaded only for ``lemmatize`` or ``pos_tag``.
     
     Args:
         text (str): Input text to parse.
@@ -20,25 +37,168 @@ def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=Fals
         pos_tag (bool): Include POS tags in output (for tokenize=True).
         ner (bool): Perform named entity recognition.
         model (str): spaCy model to load (default: 'en_core_web_sm').
+        as_arrays (bool): Return token attributes as NumPy arrays instead of
+            Python strings (see :func:`_doc_arrays`). Decode hash IDs with :func:`strings`.
+        doc_store (str or DocStore, optional): Database of annotated Docs (see
+            :mod:`sparse.docstore`). Stored Docs are reused instead of re-running
+            the pipeline; new ones are annotated with every component any option
+            needs, so later runs with different options also hit the store.
         **kwargs: Additional options (unused).
     
     Returns:
-        str or list: Processed text, token list, or NER results depending on options.
+        str or list or dict: Processed text, token list, NER results, or a dict of
+        arrays when ``as_arrays`` is True.
+    
+    Raises:
+        RuntimeError: If spaCy model is not installed.
+    """
+    nlp = _load_model(model, _excluded_components(lemmatize, tokenize or as_arrays, pos_tag, ner,
+                                                  doc_store))
+    
+    # Process text through spaCy pipeline
+    if doc_store:
+        doc = next(docstore.get_store(doc_store).pipe(nlp, [text]))
+    else:
+        doc = nlp(text)
     
+    return _format_doc(doc, lowercase, remove_punctuation, remove_stopwords,
+                       lemmatize, tokenize, pos_tag, ner, as_arrays)
+
+
+def parse_batch(texts, lowercase=False, remove_punctuation=False, remove_stopwords=False,
+                lemmatize=False, tokenize=False, pos_tag=False, ner=False,
+                model='en_core_web_sm', batch_size=None, n_process=1, as_tuples=False,
+                as_arrays=False, doc_store=None, **kwargs):
+    """
+    Parse a list of texts using spaCy's ``nlp.pipe``.
+
+    The model is loaded once and every text is streamed through the pipeline in
+    batches. Other options are the same as for :func:`parse`.
+
+    Args:
+        texts (list of str): Input texts to parse, or ``(text, context)`` pairs
+            when ``as_tuples`` is True.
+        batch_size (int, optional): Texts per ``nlp.pipe`` batch. None = the model's default.
+        n_process (int): Worker processes for ``nlp.pipe``; -1 = one per CPU.
+        as_tuples (bool): Input items are ``(text, context)`` pairs; results are
+            ``(result, context)`` pairs, so document IDs travel with their results.
+
+    Returns:
+        list: One result per input text, in input order.
+
     Raises:
         RuntimeError: If spaCy model is not installed.
     """
+    return list(pipe(texts, lowercase, remove_punctuation, remove_stopwords, lemmatize,
+                     tokenize, pos_tag, ner, model, batch_size, n_process, as_tuples,
+                     as_arrays, doc_store))
+
+
+def pipe(texts, lowercase=False, remove_punctuation=False, remove_stopwords=False,
+         lemmatize=False, tokenize=False, pos_tag=False, ner=False,
+         model='en_core_web_sm', batch_size=None, n_process=1, as_tuples=False,
+         as_arrays=False, doc_store=None, **kwargs):
+    """
+    Like :func:`parse_batch`, but yield results lazily as Docs stream out of ``nlp.pipe``.
+
+    ``texts`` may be any iterable, so arbitrarily large inputs run in bounded memory.
+    """
+    nlp = _load_model(model, _excluded_components(lemmatize, tokenize or as_arrays, pos_tag, ner,
+                                                  doc_store))
+
+    if doc_store:
+        docs = docstore.get_store(doc_store).pipe(nlp, texts, batch_size=batch_size,
+                                                  n_process=n_process, as_tuples=as_tuples)
+    else:
+        docs = nlp.pipe(texts, batch_size=batch_size, n_process=n_process, as_tuples=as_tuples)
+    if as_tuples:
+        for doc, context in docs:
+            yield (_format_doc(doc, lowercase, remove_punctuation, remove_stopwords,
+                               lemmatize, tokenize, pos_tag, ner, as_arrays), context)
+    else:
+        for doc in docs:
+            yield _format_doc(doc, lowercase, remove_punctuation, remove_stopwords,
+                              lemmatize, tokenize, pos_tag, ner, as_arrays)
+
+
+def preload(lemmatize=False, tokenize=False, pos_tag=False, ner=False,
+            model='en_core_web_sm', as_arrays=False, doc_store=None, **kwargs):
+    """Load ``model`` with the components the options need, so later calls skip loading."""
+    _load_model(model, _excluded_components(lemmatize, tokenize or as_arrays, pos_tag, ner,
+                                            doc_store))
+
+
+def _excluded_components(lemmatize, tokenize, pos_tag, ner, doc_store=None):
+    """
+    Return the components the options do not need, so they are never loaded.
+
+    Stop words, punctuation and casing are lexical attributes set by the
+    tokenizer, so tokenize/stopword/punctuation requests need no components.
+    NER output ignores every other option. Docs written to a doc store must
+    serve any later option combination, so they get every such component.
+    """
+    if doc_store:
+        needed = ('ner',) + _LEMMA_COMPONENTS
+    elif ner:
+        needed = ('ner',)
+    elif lemmatize:
+        needed = _LEMMA_COMPONENTS
+    elif pos_tag and tokenize:
+        needed = _POS_COMPONENTS
+    else:
+        return _OPTIONAL_COMPONENTS
+    needed += _EMBEDDING_COMPONENTS
+    return tuple(name for name in _OPTIONAL_COMPONENTS if name not in needed)
+
+
+def strings(model='en_core_web_sm'):
+    """
+    Return the StringStore that decodes hash IDs in ``as_arrays`` output for ``model``.
+
+    Every component set loaded for a model shares one vocabulary, so a single
+    StringStore decodes the output of any option combination, e.g.
+    ``strings()[int(arrays['orth'][0])]``. POS IDs are spaCy symbols and decode
+    the same way.
+    """
+    vocab = _shared_vocab(model)
+    if vocab is None:
+        vocab = _load_model(model, _OPTIONAL_COMPONENTS).vocab
+    return vocab.strings
+
+
+def _load_model(model, exclude=()):
+    # Each component set is a separate cache entry.
+    return models.get('spacy', model, lambda: _spacy_load(model, exclude),
+                      config={'exclude': exclude})
+
+
+def _shared_vocab(model):
+    """
+    Return the Vocab shared by the cached component sets of ``model``, or None.
+
+    The Vocab is only reachable through cached pipelines, so evicting the last
+    one also frees the Vocab (vectors and StringStore).
+    """
+    for nlp in models.find('spacy', model):
+        return nlp.vocab
+    return None
+
+
+def _spacy_load(model, exclude=()):
+    vocab = _shared_vocab(model)
     try:
-        nlp = spacy.load(model)
+        nlp = spacy.load(model, exclude=list(exclude), vocab=True if vocab is None else vocab)
     except OSError:
         raise RuntimeError(
             f"spaCy model '{model}' not found. "
             f"Download with: python -m spacy download {model}"
         )
-    
-    # Process text through spaCy pipeline
-    doc = nlp(text)
-    
+    return nlp
+
+
+def _format_doc(doc, lowercase, remove_punctuation, remove_stopwords, lemmatize,
+                tokenize, pos_tag, ner, as_arrays=False):
+    """Apply the option logic to an annotated ``Doc``."""
     # Handle NER separately if requested
     if ner:
         entities = [
@@ -46,6 +206,10 @@ def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=Fals
             for ent in doc.ents
         ]
         return entities
+
+    if as_arrays:
+        return _doc_arrays(doc, lowercase, remove_punctuation, remove_stopwords,
+                           lemmatize, pos_tag)
     
     # Process tokens
     tokens = []
@@ -79,3 +243,49 @@ def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=Fals
         return tokens
     else:
         return ' '.join([t[0] if isinstance(t, tuple) else t for t in tokens])
+
+
+def _doc_arrays(doc, lowercase, remove_punctuation, remove_stopwords, lemmatize, pos_tag):
+    """
+    Return the Doc's token attributes as columns, filtered with vectorized masks.
+
+    Returns:
+        dict: NumPy arrays with one entry per kept token:
+        ``orth`` (uint64 hash of the text, or of the lowercased text when
+        ``lowercase``), ``is_stop`` and ``is_punct`` (bool), ``start`` and ``end``
+        (int64 character offsets), plus ``lemma`` (uint64 hash) when ``lemmatize``
+        and ``pos`` (uint64 symbol ID) when ``pos_tag``. ``lowercase`` does not
+        apply to lemmas.
+    """
+    import numpy as np
+    from spacy.attrs import IDX, IS_PUNCT, IS_STOP, LEMMA, LENGTH, LOWER, ORTH, POS
+
+    attrs = [LOWER if lowercase else ORTH, IS_STOP, IS_PUNCT, IDX, LENGTH]
+    if lemmatize:
+        attrs.append(LEMMA)
+    if pos_tag:
+        attrs.append(POS)
+    array = doc.to_array(attrs).reshape(len(doc), len(attrs))
+
+    keep = None
+    if remove_stopwords:
+        keep = array[:, 1] == 0
+    if remove_punctuation:
+        not_punct = array[:, 2] == 0
+        keep = not_punct if keep is None else keep & not_punct
+    if keep is not None:
+        array = array[keep]
+
+    start = array[:, 3].astype(np.int64)
+    columns = {
+        'orth': np.ascontiguousarray(array[:, 0]),
+        'is_stop': array[:, 1].astype(bool),
+        'is_punct': array[:, 2].astype(bool),
+        'start': start,
+        'end': start + array[:, 4].astype(np.int64),
+    }
+    if lemmatize:
+        columns['lemma'] = np.ascontiguousarray(array[:, 5])
+    if pos_tag:
+        columns['pos'] = np.ascontiguousarray(array[:, -1])
+    return columns
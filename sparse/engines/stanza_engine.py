@@ -3,13 +3,19 @@
 This engine provides basic tokenization and lemmatization via the Stanza
 pipeline. It is intentionally simple: the heavy NLP work is delegated to
 `stanza` models which must be downloaded separately.
+
+Pipelines are built with only the processors the options need and cached per
+(lang, processors).
 """
 
+import unicodedata
 from typing import List, Union
 
+from sparse import models
+
 
 def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=False,
-          lemmatize=False, tokenize=False, ner=False, **kwargs):
+          lemmatize=False, tokenize=False, ner=False, lang='en', **kwargs):
     """
     Parse text using Stanza.
 
@@ -21,14 +27,61 @@ def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=Fals
         lemmatize (bool): Use token.lemma to output lemmatized form.
         tokenize (bool): Return list of tokens, otherwise joined string.
         ner (bool): If True, return named entities extracted from the text.
+        lang (str): Stanza language code (default: 'en'). The stop word list is
+            English-only.
         **kwargs: Additional options (unused).
 
     Returns:
         list or str or list[dict]: Tokens, joined text, or NER entities.
 
     Raises:
-        RuntimeError: If stanza is not installed or English models are missing.
+        RuntimeError: If stanza is not installed or the language's models are missing.
+    """
+    nlp = _load_pipeline(lang, _processors(lemmatize, ner))
+
+    doc = nlp(text)
+
+    return _format_doc(doc, lowercase, remove_punctuation, remove_stopwords,
+                       lemmatize, tokenize, ner)
+
+
+def parse_batch(texts, lowercase=False, remove_punctuation=False, remove_stopwords=False,
+                lemmatize=False, tokenize=False, ner=False, lang='en', **kwargs):
+    """
+    Parse a list of texts using Stanza's multi-document input.
+
+    The pipeline is built once and all texts are passed to it as a list of
+    ``stanza.Document`` objects, letting Stanza batch them internally. Options are
+    the same as for :func:`parse`.
+
+    Args:
+        texts (list of str): Input texts to parse.
+
+    Returns:
+        list: One result per input text, in input order.
+
+    Raises:
+        RuntimeError: If stanza is not installed or the language's models are missing.
     """
+    stanza = _import_stanza()
+    nlp = _load_pipeline(lang, _processors(lemmatize, ner))
+
+    docs = nlp([stanza.Document([], text=text) for text in texts])
+
+    return [
+        _format_doc(doc, lowercase, remove_punctuation, remove_stopwords,
+                    lemmatize, tokenize, ner)
+        for doc in docs
+    ]
+
+
+# simple english stop words list (could be improved later)
+STOPWORDS = {
+    'the', 'a', 'an', 'in', 'on', 'and', 'or', 'is', 'are', 'was', 'were'
+}
+
+
+def _import_stanza():
     try:
         import stanza
     except ImportError:
@@ -36,18 +89,52 @@ def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=Fals
             "Stanza library not found. "
             "Install with: pip install sparse[advanced]"
         )
+    return stanza
+
+
+def preload(lemmatize=False, ner=False, lang='en', **kwargs):
+    """Build the Stanza pipeline the options need so later calls skip loading."""
+    _load_pipeline(lang, _processors(lemmatize, ner))
+
+
+def _processors(lemmatize, ner):
+    """Return the Stanza processors the options need."""
+    if ner:
+        # NER output ignores every other option.
+        return 'tokenize,ner'
+    if lemmatize:
+        return 'tokenize,pos,lemma'
+    return 'tokenize'
 
-    # ensure the English model is downloaded; stanza will raise if not
+
+def _load_pipeline(lang='en', processors='tokenize'):
+    return models.get('stanza', lang, lambda: _build_pipeline(lang, processors),
+                      config={'processors': processors})
+
+
+def _build_pipeline(lang, processors):
+    stanza = _import_stanza()
+
+    # ensure the language's model is downloaded; stanza will raise if not
     try:
-        nlp = stanza.Pipeline(lang='en', processors='tokenize,pos,lemma,ner', verbose=False)
+        return stanza.Pipeline(lang=lang, processors=processors, verbose=False)
     except Exception as e:
         raise RuntimeError(
-            f"Unable to load Stanza English pipeline: {e}. "
-            "You may need to install models with ``import stanza; stanza.download('en')``."
+            f"Unable to load Stanza pipeline for '{lang}' ({processors}): {e}. "
+            f"You may need to install models with ``import stanza; stanza.download('{lang}')``."
         )
 
-    doc = nlp(text)
 
+def _is_punct(word):
+    # UPOS is only available when the pos processor ran (e.g. for lemmatize).
+    if word.upos is not None:
+        return word.upos == 'PUNCT'
+    return all(unicodedata.category(char).startswith('P') for char in word.text)
+
+
+def _format_doc(doc, lowercase, remove_punctuation, remove_stopwords, lemmatize,
+                tokenize, ner):
+    """Apply the option logic to an annotated ``stanza.Document``."""
     if ner:
         entities = []
         for sent in doc.sentences:
@@ -61,16 +148,11 @@ def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=Fals
         return entities
 
     tokens = []
-    # simple english stop words list (could be improved later)
-    STOPWORDS = {
-        'the', 'a', 'an', 'in', 'on', 'and', 'or', 'is', 'are', 'was', 'were'
-    }
-
     for sentence in doc.sentences:
         for word in sentence.words:
             token_text = word.text
 
-            if remove_punctuation and word.upos == 'PUNCT':
+            if remove_punctuation and _is_punct(word):
                 continue
 
             if remove_stopwords and token_text.lower() in STOPWORDS:
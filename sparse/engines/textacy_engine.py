@@ -2,6 +2,8 @@
 
 from typing import Union, List, Dict
 
+from sparse import docstore, models
+
 
 def parse(text: str, lowercase: bool = False, remove_punctuation: bool = False,
           remove_stopwords: bool = False, lemmatize: bool = False, tokenize: bool = False,
@@ -17,7 +19,8 @@ def parse(text: str, lowercase: bool = False, remove_punctuation: bool = False,
         tokenize (bool): Return list of tokens instead of joined string.
         keyterms (bool): Extract key terms using TextRank.
         readability (bool): Compute readability statistics.
-        **kwargs: Additional options (e.g., lang for language).
+        **kwargs: Additional options (e.g., lang for language, doc_store for a
+            :mod:`sparse.docstore` database of annotated Docs).
 
     Returns:
         str or list or dict: Processed text, tokens, keyterms, or readability stats.
@@ -25,6 +28,68 @@ def parse(text: str, lowercase: bool = False, remove_punctuation: bool = False,
     Raises:
         RuntimeError: If textacy or spaCy is not installed.
     """
+    textacy = _import_textacy()
+    lang = kwargs.get('lang', 'en')
+    nlp = _load_model(lang)
+
+    doc_store = kwargs.get('doc_store')
+    if doc_store:
+        doc = next(docstore.get_store(doc_store).pipe(nlp, [text]))
+    else:
+        doc = nlp(text)
+
+    return _format_doc(textacy, text, doc, lang, lowercase, remove_punctuation,
+                       remove_stopwords, lemmatize, tokenize, keyterms, readability)
+
+
+def parse_batch(texts, lowercase=False, remove_punctuation=False, remove_stopwords=False,
+                lemmatize=False, tokenize=False, keyterms=False, readability=False,
+                batch_size=None, n_process=1, as_tuples=False, **kwargs):
+    """
+    Parse a list of texts, streaming them through spaCy's ``nlp.pipe``.
+
+    Each Doc is post-processed as it comes out of the pipeline. Other options
+    are the same as for :func:`parse`.
+
+    Args:
+        texts (list of str): Input texts, or ``(text, context)`` pairs when
+            ``as_tuples`` is True.
+        batch_size (int, optional): Texts per ``nlp.pipe`` batch. None = the model's default.
+        n_process (int): Worker processes for ``nlp.pipe``; -1 = one per CPU.
+        as_tuples (bool): Input items are ``(text, context)`` pairs; results are
+            ``(result, context)`` pairs.
+
+    Returns:
+        list: One result per input text, in input order.
+
+    Raises:
+        RuntimeError: If textacy or spaCy is not installed.
+    """
+    textacy = _import_textacy()
+    lang = kwargs.get('lang', 'en')
+    nlp = _load_model(lang)
+
+    options = (lowercase, remove_punctuation, remove_stopwords, lemmatize, tokenize,
+               keyterms, readability)
+    doc_store = kwargs.get('doc_store')
+    if doc_store:
+        docs = docstore.get_store(doc_store).pipe(nlp, texts, batch_size=batch_size,
+                                                  n_process=n_process, as_tuples=as_tuples)
+    else:
+        docs = nlp.pipe(texts, batch_size=batch_size, n_process=n_process, as_tuples=as_tuples)
+    if as_tuples:
+        return [(_format_doc(textacy, doc.text, doc, lang, *options), context)
+                for doc, context in docs]
+    return [_format_doc(textacy, doc.text, doc, lang, *options) for doc in docs]
+
+
+def preload(lang='en', **kwargs):
+    """Load the spaCy model for ``lang`` so later calls skip loading."""
+    _import_textacy()
+    _load_model(lang)
+
+
+def _import_textacy():
     try:
         import textacy
         import spacy
@@ -32,20 +97,29 @@ def parse(text: str, lowercase: bool = False, remove_punctuation: bool = False,
         raise RuntimeError(
             "textacy and spacy not installed. Install with: pip install sparse[utils]"
         )
+    return textacy
 
-    lang = kwargs.get('lang', 'en')
+
+def _load_model(lang):
     model_name = f"{lang}_core_web_sm"
+    return models.get('textacy', model_name, lambda: _spacy_load(model_name))
+
+
+def _spacy_load(model_name):
+    import spacy
 
     try:
-        nlp = spacy.load(model_name)
+        return spacy.load(model_name)
     except OSError:
         raise RuntimeError(
             f"spaCy model '{model_name}' not found. "
             f"Download with: python -m spacy download {model_name}"
         )
 
-    doc = nlp(text)
 
+def _format_doc(textacy, text, doc, lang, lowercase, remove_punctuation, remove_stopwords,
+                lemmatize, tokenize, keyterms, readability):
+    """Apply the option logic to ``text`` and its annotated ``doc``."""
     # Special features
     if keyterms:
         return list(textacy.extract.keyterms.textrank(doc, topn=10))
@@ -66,7 +140,7 @@ def parse(text: str, lowercase: bool = False, remove_punctuation: bool = False,
         processed = textacy.preprocessing.remove_stopwords(processed, lang=lang)
 
     if lemmatize:
-        processed = textacy.preprocessing.lemmatize(processed, model=model_name)
+        processed = textacy.preprocessing.lemmatize(processed, model=f"{lang}_core_web_sm")
 
     if tokenize:
         # Extract words as tokens
@@ -78,4 +152,4 @@ def parse(text: str, lowercase: bool = False, remove_punctuation: bool = False,
         ))
         return tokens
 
-    return processed
\ No newline at end of file
+    return processed
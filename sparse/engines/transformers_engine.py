@@ -8,10 +8,13 @@ phase‑2 implementation expands.
 
 from typing import List, Union
 
+from sparse import models
+
 
 def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=False,
           lemmatize=False, tokenize=False, return_ids=False,
-          model_name='bert-base-uncased', **kwargs):
+          model_name='bert-base-uncased', as_arrays=False, padding=False, truncation=True,
+          max_length=None, return_offsets=False, **kwargs):
     """
     Parse text using a Hugging Face tokenizer.
 
@@ -30,29 +33,32 @@ def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=Fals
         return_ids (bool): If True, return integer token ids (requires
             `tokenize=True`).
         model_name (str): Name of the pretrained tokenizer to load.
+        as_arrays (bool): Return model inputs as NumPy arrays: ``input_ids`` and
+            ``attention_mask``, plus ``offset_mapping`` when ``return_offsets``.
+            Special tokens are added, as the model expects.
+        padding (bool or str): With ``as_arrays``, ``'max_length'`` pads to
+            ``max_length``; otherwise arrays are not padded. See :func:`encode`
+            for batch-level padding.
+        truncation (bool): With ``as_arrays``, truncate to ``max_length`` (default:
+            the model's maximum).
+        max_length (int, optional): With ``as_arrays``, the length to truncate or pad to.
+        return_offsets (bool): With ``as_arrays``, include ``offset_mapping``
+            (character spans per token). Requires a fast tokenizer.
         **kwargs: Additional options (unused).
 
     Returns:
-        list or str or list[int]: Tokenized output or text or IDs.
+        list or str or list[int] or dict: Tokenized output or text or IDs, or a
+        dict of arrays when ``as_arrays`` is True.
 
     Raises:
         RuntimeError: If transformers is not installed or model cannot be loaded.
     """
-    try:
-        from transformers import AutoTokenizer
-    except ImportError:
-        raise RuntimeError(
-            "Transformers library not found. "
-            "Install with: pip install sparse[advanced]"
-        )
+    if as_arrays:
+        return parse_batch([text], model_name=model_name, as_arrays=True, padding=padding,
+                           truncation=truncation, max_length=max_length,
+                           return_offsets=return_offsets)[0]
 
-    try:
-        tokenizer = AutoTokenizer.from_pretrained(model_name)
-    except Exception as e:
-        raise RuntimeError(
-            f"Unable to load tokenizer '{model_name}': {e}."
-            " Make sure the model name is correct and you have internet access."
-        )
+    tokenizer = _load_tokenizer(model_name)
 
     # Tokenize the input text
     tokens = tokenizer.tokenize(text)
@@ -61,14 +67,123 @@ def parse(text, lowercase=False, remove_punctuation=False, remove_stopwords=Fals
     # don't manually apply lowercase/remove_punctuation/remove_stopwords/lemmatize.
 
     if return_ids:
-        if not tokenize:
-            # we need tokens first
-            tokens = tokenizer.tokenize(text)
-        ids = tokenizer.convert_tokens_to_ids(tokens)
-        return ids
+        return tokenizer.convert_tokens_to_ids(tokens)
 
     if tokenize:
         return tokens
     else:
         # join tokens with spaces, mimic other engines
         return ' '.join(tokens)
+
+
+def parse_batch(texts, lowercase=False, remove_punctuation=False, remove_stopwords=False,
+                lemmatize=False, tokenize=False, return_ids=False,
+                model_name='bert-base-uncased', as_arrays=False, padding=False,
+                truncation=True, max_length=None, return_offsets=False, **kwargs):
+    """
+    Parse a list of texts with one tokenizer call.
+
+    Fast (Rust) tokenizers encode the whole list at once; slow tokenizers fall
+    back to one call per text. Options are the same as for :func:`parse`; with
+    ``as_arrays`` each result holds that text's own arrays, so results do not
+    depend on which texts were batched together.
+
+    Args:
+        texts (list of str): Input texts to parse.
+
+    Returns:
+        list: One result per input text, in input order.
+
+    Raises:
+        RuntimeError: If transformers is not installed or model cannot be loaded.
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+
+    if as_arrays:
+        batch = encode(texts, model_name, padding if padding == 'max_length' else False,
+                       truncation, max_length, return_offsets)
+        return [{name: column[i] for name, column in batch.items()} for i in range(len(texts))]
+
+    tokenizer = _load_tokenizer(model_name)
+    if not tokenizer.is_fast:
+        return [parse(text, tokenize=tokenize, return_ids=return_ids, model_name=model_name)
+                for text in texts]
+
+    encodings = tokenizer(texts, add_special_tokens=False)
+    if return_ids:
+        return encodings['input_ids']
+    if tokenize:
+        return [encodings.tokens(i) for i in range(len(texts))]
+    return [' '.join(encodings.tokens(i)) for i in range(len(texts))]
+
+
+def encode(texts, model_name='bert-base-uncased', padding='longest', truncation=True,
+           max_length=None, return_offsets=False):
+    """
+    Tokenize a list of texts in one call into NumPy arrays ready for model inference.
+
+    Args:
+        texts (list of str): Input texts.
+        model_name (str): Name of the pretrained tokenizer to load.
+        padding (bool or str): ``'longest'`` pads to the longest text in the batch,
+            ``'max_length'`` to ``max_length``; False returns one unpadded array per text.
+        truncation (bool): Truncate to ``max_length`` (default: the model's maximum).
+        max_length (int, optional): The length to truncate or pad to.
+        return_offsets (bool): Include ``offset_mapping``. Requires a fast tokenizer.
+
+    Returns:
+        dict: ``input_ids`` and ``attention_mask`` (and ``offset_mapping``) as 2-D
+        arrays when padding, otherwise as lists of 1-D arrays.
+
+    Raises:
+        RuntimeError: If transformers is not installed, the model cannot be loaded,
+            or offsets are requested from a slow tokenizer.
+    """
+    import numpy as np
+
+    tokenizer = _load_tokenizer(model_name)
+    if return_offsets and not tokenizer.is_fast:
+        raise RuntimeError(
+            f"Tokenizer '{model_name}' has no fast (Rust) implementation; "
+            "return_offsets requires one."
+        )
+
+    padded = padding not in (False, None, 'do_not_pad')
+    batch = tokenizer(list(texts), padding=padding if padded else False,
+                      truncation=truncation, max_length=max_length,
+                      return_attention_mask=True, return_offsets_mapping=return_offsets,
+                      return_tensors='np' if padded else None)
+
+    names = ['input_ids', 'attention_mask'] + (['offset_mapping'] if return_offsets else [])
+    if padded:
+        return {name: batch[name] for name in names}
+    return {name: [np.asarray(row) for row in batch[name]] for name in names}
+
+
+def preload(model_name='bert-base-uncased', **kwargs):
+    """Load the tokenizer into this process's cache so later calls skip loading."""
+    _load_tokenizer(model_name)
+
+
+def _load_tokenizer(model_name):
+    return models.get('transformers', model_name, lambda: _tokenizer_load(model_name))
+
+
+def _tokenizer_load(model_name):
+    try:
+        from transformers import AutoTokenizer
+    except ImportError:
+        raise RuntimeError(
+            "Transformers library not found. "
+            "Install with: pip install sparse[advanced]"
+        )
+
+    try:
+        return AutoTokenizer.from_pretrained(model_name, use_fast=True)
+    except Exception as e:
+        raise RuntimeError(
+            f"Unable to load tokenizer '{model_name}': {e}."
+            " Make sure the model name is correct and you have internet access."
+        )
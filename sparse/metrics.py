@@ -0,0 +1,263 @@
+"""Process-wide metrics with an OpenMetrics text exporter.
+
+Metrics are fed by the :mod:`sparse.tracing` hooks, so they cost nothing until
+:func:`enable` is called. Once enabled, every parse call updates:
+
+- ``sparse_documents_total``, ``sparse_characters_total`` and ``sparse_errors_total``
+  per engine and option set;
+- ``sparse_parse_duration_seconds``, a latency histogram per engine and option
+  set (one observation per call; a batch is one call);
+- ``sparse_stage_duration_seconds``, a latency histogram per engine and stage;
+- ``sparse_model_loads_total`` and ``sparse_model_load_seconds_total`` per engine and model.
+
+Result-cache counters and the number of loaded models are read when exporting.
+Documents served from the result cache are counted there, not as parsed.
+
+Example:
+    >>> from sparse import metrics
+    >>> metrics.enable()
+    >>> server = metrics.serve(port=9464)  # scrape http://127.0.0.1:9464/metrics
+    >>> print(metrics.export())
+"""
+
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from sparse import tracing
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+# Upper bounds in seconds; the +Inf bucket is implicit.
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# Engine label of the lightweight (engine=None) pipeline.
+_LIGHTWEIGHT = 'lightweight'
+
+
+class Histogram:
+    """Fixed-bucket histogram (not thread-safe; :class:`MetricsRegistry` locks)."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """Return ``(upper_bound, cumulative_count)`` pairs, ending with ``+Inf``."""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class MetricsRegistry:
+    """
+    Counters and histograms built from :class:`sparse.tracing.StageRecord` objects.
+
+    An instance is a tracing hook: ``tracing.add_hook(registry)``.
+
+    Args:
+        buckets (tuple of float): Histogram upper bounds in seconds.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Zero every metric."""
+        with self._lock:
+            self._documents = {}
+            self._characters = {}
+            self._errors = {}
+            self._parse_durations = {}
+            self._stage_durations = {}
+            self._model_loads = {}
+            self._model_load_seconds = {}
+
+    def __call__(self, record):
+        engine = record.engine or _LIGHTWEIGHT
+        with self._lock:
+            if record.kind == 'call':
+                labels = (('engine', engine), ('options', record.options or ''))
+                _increment(self._documents, labels, record.batch_size or 1)
+                _increment(self._characters, labels, record.input_size or 0)
+                if record.error is not None:
+                    _increment(self._errors, labels, 1)
+                self._histogram(self._parse_durations, labels).observe(record.duration)
+            elif record.kind == 'load':
+                labels = (('engine', engine), ('model', record.model or ''))
+                _increment(self._model_loads, labels, 1)
+                _increment(self._model_load_seconds, labels, record.duration)
+            else:
+                labels = (('engine', engine), ('stage', record.name))
+                self._histogram(self._stage_durations, labels).observe(record.duration)
+
+    def export(self):
+        """
+        Render every metric in the OpenMetrics text format.
+
+        Returns:
+            str: The exposition, terminated by ``# EOF``.
+        """
+        from sparse import cache, models
+
+        lines = []
+        with self._lock:
+            _counter(lines, 'sparse_documents', 'Documents parsed, excluding result-cache hits.',
+                     self._documents)
+            _counter(lines, 'sparse_characters', 'Characters of input parsed.', self._characters)
+            _counter(lines, 'sparse_errors', 'Parse calls that raised.', self._errors)
+            _histogram(lines, 'sparse_parse_duration_seconds',
+                       'Latency of parse calls; a batch is one call.', self._parse_durations)
+            _histogram(lines, 'sparse_stage_duration_seconds',
+                       'Latency of individual pipeline stages.', self._stage_durations)
+            _counter(lines, 'sparse_model_loads', 'Models loaded into the model cache.',
+                     self._model_loads)
+            _counter(lines, 'sparse_model_load_seconds', 'Time spent loading models.',
+                     self._model_load_seconds)
+
+        cache_stats = cache.stats()
+        if cache_stats is not None:
+            _counter(lines, 'sparse_cache_hits', 'Result cache hits.', {
+                (('tier', 'memory'),): cache_stats['hits'],
+                (('tier', 'store'),): cache_stats['store_hits'],
+            })
+            _counter(lines, 'sparse_cache_misses', 'Result cache misses.',
+                     {(): cache_stats['misses']})
+            _counter(lines, 'sparse_cache_evictions', 'Results evicted from the memory tier.',
+                     {(): cache_stats['evictions']})
+            _gauge(lines, 'sparse_cache_size', 'Results held in the memory tier.',
+                   {(): cache_stats['size']})
+
+        loaded = {}
+        for entry in models.loaded():
+            _increment(loaded, (('engine', entry['engine']),), 1)
+        _gauge(lines, 'sparse_models_loaded', 'Models currently held in the model cache.', loaded)
+
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def _histogram(self, histograms, labels):
+        histogram = histograms.get(labels)
+        if histogram is None:
+            histogram = histograms[labels] = Histogram(self.buckets)
+        return histogram
+
+
+def _increment(counters, labels, amount):
+    counters[labels] = counters.get(labels, 0) + amount
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels) + '}'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _counter(lines, name, help_text, samples):
+    lines.append(f'# TYPE {name} counter')
+    lines.append(f'# HELP {name} {help_text}')
+    for labels, value in sorted(samples.items()):
+        lines.append(f'{name}_total{_format_labels(labels)} {_format_value(value)}')
+
+
+def _gauge(lines, name, help_text, samples):
+    lines.append(f'# TYPE {name} gauge')
+    lines.append(f'# HELP {name} {help_text}')
+    for labels, value in sorted(samples.items()):
+        lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+
+
+def _histogram(lines, name, help_text, histograms):
+    lines.append(f'# TYPE {name} histogram')
+    lines.append(f'# HELP {name} {help_text}')
+    for labels, histogram in sorted(histograms.items()):
+        for bound, count in histogram.cumulative():
+            bucket_labels = labels + (('le', _format_value(float(bound))),)
+            lines.append(f'{name}_bucket{_format_labels(bucket_labels)} {count}')
+        lines.append(f'{name}_count{_format_labels(labels)} {histogram.count}')
+        lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}')
+
+
+_registry = MetricsRegistry()
+
+
+def enable():
+    """Start recording metrics for parse calls in this process."""
+    tracing.remove_hook(_registry)
+    tracing.add_hook(_registry)
+
+
+def disable():
+    """Stop recording metrics. Values recorded so far are kept."""
+    tracing.remove_hook(_registry)
+
+
+def reset():
+    """Zero every metric."""
+    _registry.reset()
+
+
+def export():
+    """Return the process-wide metrics in the OpenMetrics text format."""
+    return _registry.export()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = export().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would flood stderr.
+        pass
+
+
+def serve(port=9464, host='127.0.0.1'):
+    """
+    Serve :func:`export` at ``http://{host}:{port}/metrics`` from a background thread.
+
+    Also calls :func:`enable`.
+
+    Args:
+        port (int): Port to listen on; 0 picks a free port (see ``server.server_address``).
+        host (str): Interface to bind. The default only accepts local connections.
+
+    Returns:
+        http.server.ThreadingHTTPServer: The running server; call ``shutdown()`` to stop it.
+    """
+    enable()
+    server = ThreadingHTTPServer((host, port), _Handler)
+    thread = threading.Thread(target=server.serve_forever, name='sparse-metrics', daemon=True)
+    thread.start()
+    return server
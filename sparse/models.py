@@ -0,0 +1,236 @@
+"""Process-wide cache of loaded models.
+
+Engines load spaCy pipelines, Stanza pipelines, Flair taggers and Hugging Face
+tokenizers through :func:`get`, so each model is loaded once per process and
+shared by every call. Least recently used models are evicted when the cache
+exceeds its model-count or resident-memory budget.
+
+Example:
+    >>> from sparse import models
+    >>> models.configure(max_models=4, max_rss=8 * 1024 ** 3)
+    >>> models.loaded()
+    [{'engine': 'spacy', 'model': 'en_core_web_sm', ...}]
+    >>> models.evict(engine='spacy')
+    1
+"""
+
+import gc
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from sparse import tracing
+
+
+class ModelManager:
+    """
+    LRU cache of loaded models keyed by (engine, model, config).
+
+    Args:
+        max_models (int, optional): Maximum number of models kept loaded.
+        max_rss (int, optional): Resident memory budget for the process, in bytes.
+            When exceeded after a load, least recently used models are evicted
+            until RSS is back under budget or an eviction stops lowering it.
+            Ignored on platforms where RSS cannot be read.
+    """
+
+    def __init__(self, max_models=None, max_rss=None):
+        self.max_models = max_models
+        self.max_rss = max_rss
+        self._models = OrderedDict()
+        # Futures of in-progress loads. Concurrent callers for the same key wait
+        # on its future instead of loading the model twice; the lock only guards
+        # these dicts, so cache hits never wait behind a load.
+        self._loading = {}
+        self._lock = threading.Lock()
+
+    def get(self, engine, model, loader, config=None):
+        """
+        Return the cached model, calling ``loader()`` to load it on a miss.
+
+        Args:
+            engine (str): Engine name (e.g., 'spacy').
+            model (str): Model name or path.
+            loader (callable): Zero-argument function that loads the model. Runs
+                without holding the cache lock; other callers asking for the same
+                model meanwhile wait for it and get the same object (or error).
+            config (dict, optional): Load options that produce a distinct model
+                (e.g., excluded pipeline components).
+
+        Returns:
+            object: The loaded model.
+        """
+        key = (engine, model, _freeze(config))
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is not None:
+                self._models.move_to_end(key)
+                entry['hits'] += 1
+                entry['last_used'] = time.time()
+                return entry['model']
+
+            pending = self._loading.get(key)
+            if pending is None:
+                future = self._loading[key] = Future()
+
+        if pending is not None:
+            return pending.result()
+
+        start = time.perf_counter()
+        try:
+            if tracing._hooks:
+                loaded = tracing.run_stage('load_model', lambda _: loader(), None, engine, model,
+                                           kind='load')
+            else:
+                loaded = loader()
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._models[key] = {
+                'model': loaded,
+                'config': dict(config or {}),
+                'load_seconds': time.perf_counter() - start,
+                'hits': 0,
+                'last_used': time.time(),
+            }
+            del self._loading[key]
+            self._enforce_budget()
+        future.set_result(loaded)
+        return loaded
+
+    def find(self, engine, model):
+        """
+        Return the cached models loaded for ``engine`` and ``model``, under any config.
+
+        Does not count as a use: hits and LRU order are unchanged.
+
+        Returns:
+            list: Model objects, least recently used first.
+        """
+        with self._lock:
+            return [
+                entry['model'] for key, entry in self._models.items()
+                if key[0] == engine and key[1] == model
+            ]
+
+    def loaded(self):
+        """
+        Describe the loaded models, least recently used first.
+
+        Returns:
+            list of dict: ``engine``, ``model``, ``config``, ``load_seconds``,
+            ``hits`` and ``last_used`` for each model.
+        """
+        with self._lock:
+            return [
+                {
+                    'engine': engine,
+                    'model': model,
+                    'config': entry['config'],
+                    'load_seconds': entry['load_seconds'],
+                    'hits': entry['hits'],
+                    'last_used': entry['last_used'],
+                }
+                for (engine, model, _), entry in self._models.items()
+            ]
+
+    def evict(self, engine=None, model=None):
+        """
+        Unload models matching ``engine`` and/or ``model`` (all models by default).
+
+        Returns:
+            int: Number of models evicted.
+        """
+        with self._lock:
+            keys = [
+                key for key in self._models
+                if (engine is None or key[0] == engine) and (model is None or key[1] == model)
+            ]
+            for key in keys:
+                del self._models[key]
+        if keys:
+            gc.collect()
+        return len(keys)
+
+    def configure(self, max_models=None, max_rss=None):
+        """Set new budgets and evict models until they are met."""
+        with self._lock:
+            self.max_models = max_models
+            self.max_rss = max_rss
+            self._enforce_budget()
+
+    def _enforce_budget(self):
+        # The most recently used model is never evicted, even if it alone
+        # exceeds the budget.
+        if self.max_models is not None:
+            while len(self._models) > max(self.max_models, 1):
+                self._models.popitem(last=False)
+
+        if self.max_rss is not None:
+            rss = _current_rss()
+            while rss is not None and rss > self.max_rss and len(self._models) > 1:
+                self._models.popitem(last=False)
+                gc.collect()
+                # Allocators and framework caches often keep freed pages resident;
+                # when an eviction frees nothing, evicting more models will not either.
+                evicted_rss = _current_rss()
+                if evicted_rss is None or evicted_rss >= rss:
+                    break
+                rss = evicted_rss
+
+
+def _freeze(config):
+    if not config:
+        return ()
+    return tuple(sorted(
+        (name, tuple(value) if isinstance(value, (list, set, frozenset)) else value)
+        for name, value in config.items()
+    ))
+
+
+def _current_rss():
+    """Return this process's resident set size in bytes, or None if unavailable."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+_manager = ModelManager()
+
+
+def get(engine, model, loader, config=None):
+    """Return a model from the process-wide cache. See :meth:`ModelManager.get`."""
+    return _manager.get(engine, model, loader, config)
+
+
+def find(engine, model):
+    """Return cached models for ``engine`` and ``model``. See :meth:`ModelManager.find`."""
+    return _manager.find(engine, model)
+
+
+def loaded():
+    """Describe the models in the process-wide cache. See :meth:`ModelManager.loaded`."""
+    return _manager.loaded()
+
+
+def evict(engine=None, model=None):
+    """Unload models from the process-wide cache. See :meth:`ModelManager.evict`."""
+    return _manager.evict(engine, model)
+
+
+def configure(max_models=None, max_rss=None):
+    """Set the process-wide cache budgets. See :class:`ModelManager`."""
+    _manager.configure(max_models, max_rss)
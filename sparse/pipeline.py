@@ -0,0 +1,150 @@
+"""Pre-compiled parse pipelines.
+
+A :class:`Pipeline` checks its options, resolves its engine module (and loads
+the engine's model) once at construction. Calling it then runs only the stages
+the options selected, skipping the option handling :func:`sparse.parse` repeats
+on every call.
+"""
+
+import functools
+
+from sparse import tracing, utils
+from sparse.engines import get_engine
+from sparse.utils import html_cleaning, language_detection, normalization
+
+# Lightweight stages, in the order ``parse()`` applies them.
+_TEXT_STAGES = (
+    ('clean_html', html_cleaning.clean_html),
+    ('extract_text', html_cleaning.extract_text),
+    ('remove_urls', html_cleaning.remove_urls),
+    ('fix_text', normalization.fix_text),
+    ('transliterate', normalization.transliterate),
+    ('remove_emoji', normalization.remove_emoji),
+    ('remove_unicode', normalization.remove_unicode),
+    ('lowercase', utils.lowercase),
+    ('remove_punctuation', utils.remove_punctuation),
+)
+
+
+class Pipeline:
+    """
+    Reusable parse pipeline with options resolved up front.
+
+    Args:
+        engine (str, optional): Engine to use ('nltk', 'spacy', etc.). None = lightweight.
+        **options: Same options accepted by :func:`sparse.parse`.
+
+    Raises:
+        TypeError: If an option is not understood by the lightweight pipeline.
+        ValueError: If engine is unknown or not installed.
+
+    Example:
+        >>> clean = Pipeline(lowercase=True, remove_punctuation=True)
+        >>> clean("Hello, World!")
+        'hello world'
+    """
+
+    def __init__(self, engine=None, **options):
+        self.engine = engine
+        self.options = options
+        self.model = tracing.model_name(options) if engine else None
+        self._options_label = tracing.options_label(options)
+
+        if engine:
+            self._init_engine(engine, options)
+        else:
+            self._init_lightweight(options)
+
+    def _init_engine(self, engine, options):
+        from sparse import _engine_options, _extra_options
+
+        module = get_engine(engine)
+        engine_options = _engine_options(options, _extra_options(options))
+
+        preload = getattr(module, 'preload', None)
+        if preload is not None:
+            preload(**engine_options)
+
+        self.stages = ((engine, functools.partial(module.parse, **engine_options)),)
+        self._stage_funcs = (self.stages[0][1],)
+        engine_parse_batch = getattr(module, 'parse_batch', None)
+        if engine_parse_batch is not None:
+            self._parse_batch = functools.partial(engine_parse_batch, **engine_options)
+        else:
+            self._parse_batch = None
+
+    def _init_lightweight(self, options):
+        from sparse import _LIGHTWEIGHT_OPTIONS, _STANDARD_OPTIONS
+
+        unknown = sorted(set(options) - set(_STANDARD_OPTIONS) - set(_LIGHTWEIGHT_OPTIONS))
+        if unknown:
+            raise TypeError(
+                f"Unknown option(s) for the lightweight pipeline: {', '.join(unknown)}. "
+                "Engine-specific options require engine=..."
+            )
+
+        stages = [(name, stage) for name, stage in _TEXT_STAGES if options.get(name)]
+        if options.get('detect_language'):
+            stages.append(('detect_language', functools.partial(
+                language_detection.detect_language,
+                engine=options.get('language_engine', 'langdetect'),
+            )))
+        self.stages = tuple(stages)
+        self._stage_funcs = tuple(stage for _, stage in stages)
+        self._parse_batch = None
+
+    def __call__(self, text):
+        """Parse a single text. Equivalent to ``sparse.parse(text, engine, **options)``."""
+        if tracing._hooks:
+            return self._call_traced(text)
+        for stage in self._stage_funcs:
+            text = stage(text)
+        return text
+
+    def batch(self, texts):
+        """
+        Parse a list of texts, using the engine's bulk path when it has one.
+
+        Returns:
+            list: One result per input text, in input order.
+        """
+        if tracing._hooks:
+            return self._batch_traced(list(texts))
+        if self._parse_batch is not None:
+            return self._parse_batch(list(texts))
+
+        stages = self._stage_funcs
+        results = []
+        for text in texts:
+            for stage in stages:
+                text = stage(text)
+            results.append(text)
+        return results
+
+    def _call_traced(self, text):
+        return tracing.run_stage('parse', self._run_stages_traced, text, self.engine, self.model,
+                                 kind='call', options=self._options_label)
+
+    def _run_stages_traced(self, text):
+        for name, stage in self.stages:
+            text = tracing.run_stage(name, stage, text, self.engine, self.model)
+        return text
+
+    def _batch_traced(self, texts):
+        return tracing.run_stage('parse', self._run_batch_stages_traced, texts, self.engine,
+                                 self.model, batch_size=len(texts), kind='call',
+                                 options=self._options_label)
+
+    def _run_batch_stages_traced(self, texts):
+        # One record per stage for the whole batch.
+        if self._parse_batch is not None:
+            return tracing.run_stage(self.engine, self._parse_batch, texts, self.engine,
+                                     self.model, batch_size=len(texts))
+        for name, stage in self.stages:
+            texts = tracing.run_stage(name, lambda batch: [stage(text) for text in batch], texts,
+                                      self.engine, self.model, batch_size=len(texts))
+        return texts
+
+    def __repr__(self):
+        names = [name for name, _ in self.stages]
+        return f'Pipeline(engine={self.engine!r}, stages={names!r})'
@@ -0,0 +1,208 @@
+"""Per-stage tracing for :func:`sparse.parse` and the batch APIs.
+
+While a hook is installed, every stage of a call (each lightweight utils step,
+the engine call, and each model load) emits a :class:`StageRecord`. With no
+hooks installed the parse functions skip tracing entirely.
+
+Example:
+    >>> import sparse
+    >>> with sparse.instrument() as collector:
+    ...     sparse.parse(html, clean_html=True, fix_text=True, lowercase=True)
+    >>> collector.print_report()
+    stage          calls   total ms    mean ms   share
+    clean_html         1      0.412      0.412   78.1%
+    ...
+
+Hooks are per process: worker processes started by :func:`sparse.parse_corpus`
+do not report to the parent's hooks.
+"""
+
+import sys
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+# name: stage name ('clean_html', 'lowercase', an engine name, 'load_model', or
+# 'parse' for a whole call).
+# kind: 'stage', 'load' (a model load) or 'call' (a whole parse call; its
+# duration includes the stages it ran).
+# duration: seconds. input_size/output_size: characters for strings, items for
+# lists, summed over the texts of a batch; None when not measurable.
+# model: model name, if the call named one. options: the call's enabled options,
+# comma-separated. error: exception repr, or None.
+StageRecord = namedtuple(
+    'StageRecord',
+    ['name', 'kind', 'duration', 'input_size', 'output_size', 'engine', 'model', 'options',
+     'batch_size', 'error'],
+)
+
+# Options that name a model, in order of preference.
+_MODEL_OPTIONS = ('model', 'model_name', 'model_file', 'vectors')
+
+_hooks = []
+_hooks_lock = threading.Lock()
+
+
+def add_hook(callback):
+    """Call ``callback(record)`` with a :class:`StageRecord` for every traced stage."""
+    global _hooks
+
+    with _hooks_lock:
+        # Replace rather than mutate so emitters can iterate without the lock.
+        _hooks = _hooks + [callback]
+
+
+def remove_hook(callback):
+    """Stop calling ``callback``. Unknown callbacks are ignored."""
+    global _hooks
+
+    with _hooks_lock:
+        _hooks = [hook for hook in _hooks if hook != callback]
+
+
+def enabled():
+    """Return True if any hook is installed."""
+    return bool(_hooks)
+
+
+@contextmanager
+def instrument(on_stage=None):
+    """
+    Trace parse calls made inside the ``with`` block.
+
+    Args:
+        on_stage (callable, optional): Called with each :class:`StageRecord`.
+            None = collect records in a new :class:`Collector`.
+
+    Yields:
+        The callback, i.e. the :class:`Collector` when ``on_stage`` is None.
+    """
+    callback = on_stage if on_stage is not None else Collector()
+    add_hook(callback)
+    try:
+        yield callback
+    finally:
+        remove_hook(callback)
+
+
+def emit(record):
+    """Send ``record`` to every installed hook."""
+    for hook in _hooks:
+        hook(record)
+
+
+def run_stage(name, func, value, engine=None, model=None, batch_size=None, kind='stage',
+              options=None):
+    """
+    Call ``func(value)`` and emit a record for it.
+
+    Args:
+        name (str): Stage name.
+        func (callable): The stage.
+        value: Stage input; a list of texts when ``batch_size`` is set.
+        engine (str, optional): Engine name.
+        model (str, optional): Model name.
+        batch_size (int, optional): Number of texts when the stage runs over a batch.
+        kind (str): Record kind: 'stage', 'load' or 'call'.
+        options (str, optional): The call's enabled options, comma-separated.
+
+    Returns:
+        The stage's result.
+    """
+    start = time.perf_counter()
+    try:
+        result = func(value)
+    except Exception as e:
+        emit(StageRecord(name, kind, time.perf_counter() - start, _size(value, batch_size), None,
+                         engine, model, options, batch_size, repr(e)))
+        raise
+    emit(StageRecord(name, kind, time.perf_counter() - start, _size(value, batch_size),
+                     _size(result, batch_size), engine, model, options, batch_size, None))
+    return result
+
+
+def options_label(options):
+    """Return the names of the enabled boolean ``options``, sorted and comma-separated."""
+    return ','.join(sorted(name for name, value in options.items() if value is True))
+
+
+def model_name(options):
+    """Return the model named in ``options``, or None."""
+    for option in _MODEL_OPTIONS:
+        value = options.get(option)
+        if isinstance(value, str):
+            return value
+    return None
+
+
+def _size(value, batch_size=None):
+    if batch_size is not None:
+        sizes = [_size(item) for item in value]
+        return None if None in sizes else sum(sizes)
+    if isinstance(value, (str, list, tuple)):
+        return len(value)
+    return None
+
+
+class Collector:
+    """
+    Hook that stores records and summarizes them per stage.
+
+    Attributes:
+        records (list of StageRecord): Every record received, in order, including
+            the 'call' records that :meth:`summary` leaves out.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def __call__(self, record):
+        self.records.append(record)
+
+    def summary(self):
+        """
+        Aggregate stage and model-load records by name, in order of first appearance.
+
+        Returns:
+            dict: Stage name -> ``{'calls', 'errors', 'total', 'mean', 'input_size',
+            'output_size'}``, with times in seconds.
+        """
+        stages = {}
+        for record in list(self.records):
+            if record.kind == 'call':
+                continue
+            stage = stages.setdefault(record.name, {
+                'calls': 0, 'errors': 0, 'total': 0.0, 'input_size': 0, 'output_size': 0,
+            })
+            stage['calls'] += 1
+            stage['errors'] += record.error is not None
+            stage['total'] += record.duration
+            stage['input_size'] += record.input_size or 0
+            stage['output_size'] += record.output_size or 0
+        for stage in stages.values():
+            stage['mean'] = stage['total'] / stage['calls']
+        return stages
+
+    def report(self):
+        """Return the per-stage breakdown as a text table."""
+        stages = self.summary()
+        grand_total = sum(stage['total'] for stage in stages.values()) or 1.0
+        width = max([len('stage')] + [len(name) for name in stages])
+        lines = [
+            f"{'stage':<{width}}  {'calls':>6}  {'total ms':>10}  {'mean ms':>9}  {'share':>6}"
+        ]
+        for name, stage in sorted(stages.items(), key=lambda item: -item[1]['total']):
+            lines.append(
+                f"{name:<{width}}  {stage['calls']:>6}  {stage['total'] * 1000:>10.3f}  "
+                f"{stage['mean'] * 1000:>9.3f}  {stage['total'] / grand_total:>6.1%}"
+            )
+        return '\n'.join(lines)
+
+    def print_report(self, file=None):
+        """Print :meth:`report` to ``file`` (default: stdout)."""
+        print(self.report(), file=file or sys.stdout)
+
+    def clear(self):
+        """Drop every record."""
+        self.records = []
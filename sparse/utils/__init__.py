@@ -2,6 +2,8 @@
 
 import re
 
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
 # Optional helpers; imported lazily to avoid hard dependencies.
 
 
@@ -55,7 +57,7 @@ def remove_urls(text):
 
 def remove_punctuation(text):
     """Remove punctuation from text."""
-    return re.sub(r"[^\w\s]", "", text)
+    return _PUNCTUATION_RE.sub("", text)
 
 
 def lowercase(text):
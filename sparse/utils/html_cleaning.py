@@ -2,6 +2,8 @@
 
 import re
 
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+
 
 def clean_html(text: str) -> str:
     """Clean HTML content to plain text using BeautifulSoup + bleach."""
@@ -32,4 +34,4 @@ def extract_text(html: str) -> str:
 
 def remove_urls(text: str) -> str:
     """Remove URLs from text."""
-    return re.sub(r"https?://\S+|www\.\S+", "", text)
+    return _URL_RE.sub("", text)
@@ -0,0 +1,34 @@
+"""Fake engines shared by the tests."""
+
+import types
+
+from sparse import register_engine, unregister_engine
+
+
+def counting_engine(calls, batch=False):
+    """
+    Return an engine that records each text it parses in ``calls``.
+
+    ``parse`` upper-cases the text, or splits it with ``tokenize=True``.
+
+    Args:
+        calls (list): Receives every text handed to the engine.
+        batch (bool): Also expose ``parse_batch``.
+    """
+    engine = types.ModuleType('counting_engine')
+
+    def engine_parse_batch(texts, tokenize=False, **kwargs):
+        calls.extend(texts)
+        return [text.split() if tokenize else text.upper() for text in texts]
+
+    engine.parse = lambda text, tokenize=False, **kwargs: engine_parse_batch(
+        [text], tokenize=tokenize, **kwargs)[0]
+    if batch:
+        engine.parse_batch = engine_parse_batch
+    return engine
+
+
+def register_test_engine(test, name, engine):
+    """Register ``engine`` under ``name`` until ``test`` finishes."""
+    register_engine(name, engine)
+    test.addCleanup(unregister_engine, name)
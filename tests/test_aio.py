@@ -0,0 +1,49 @@
+"""Tests for the asyncio front-end."""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from sparse import AsyncParser, aparse, aparse_batch, aio, parse
+
+
+class TestAsyncParse(unittest.TestCase):
+    def test_aparse_matches_parse(self):
+        result = asyncio.run(aparse("HELLO, World!", lowercase=True, remove_punctuation=True))
+        self.assertEqual(result, parse("HELLO, World!", lowercase=True, remove_punctuation=True))
+
+    def test_aparse_batch_preserves_order(self):
+        texts = [f"Doc {i}" for i in range(20)]
+        result = asyncio.run(aparse_batch(texts, lowercase=True))
+        self.assertEqual(result, [t.lower() for t in texts])
+
+    def test_concurrent_calls_are_merged_into_batches(self):
+        parser = AsyncParser(max_batch_size=4, max_wait=0.05)
+
+        async def run():
+            return await asyncio.gather(*(parser.parse(f"T{i}", lowercase=True) for i in range(10)))
+
+        with patch('sparse.aio._run_batch', wraps=aio._run_batch) as run_batch:
+            result = asyncio.run(run())
+        self.assertEqual(result, [f"t{i}" for i in range(10)])
+        self.assertEqual([len(call.args[1]) for call in run_batch.call_args_list], [4, 4, 2])
+
+    def test_options_are_not_merged(self):
+        parser = AsyncParser(max_wait=0.01)
+
+        async def run():
+            return await asyncio.gather(parser.parse("A"), parser.parse("A", lowercase=True))
+
+        self.assertEqual(asyncio.run(run()), ["A", "a"])
+
+    def test_errors_propagate_to_callers(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(aparse("test", engine="unknown_engine"))
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            AsyncParser(max_concurrency=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
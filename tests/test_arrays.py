@@ -0,0 +1,43 @@
+"""Tests for ragged array helpers."""
+
+import unittest
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from sparse import arrays
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+class TestArrays(unittest.TestCase):
+    """Test flattening rows and splitting them back."""
+
+    def test_concat_and_split(self):
+        flat, row_splits = arrays.concat([[1, 2], [], [3]], np.int32)
+        self.assertEqual(flat.tolist(), [1, 2, 3])
+        self.assertEqual(flat.dtype, np.int32)
+        self.assertEqual(row_splits.tolist(), [0, 2, 2, 3])
+        self.assertEqual([row.tolist() for row in arrays.split(flat, row_splits)],
+                         [[1, 2], [], [3]])
+
+    def test_concat_fixed_width_items(self):
+        flat, row_splits = arrays.concat([[(0, 5), (6, 11)], [(0, 3)]], np.int64, width=2)
+        self.assertEqual(flat.shape, (3, 2))
+        self.assertEqual(arrays.split(flat, row_splits)[1].tolist(), [[0, 3]])
+
+    def test_split_returns_views(self):
+        flat, row_splits = arrays.concat([[1, 2], [3]], np.int64)
+        rows = arrays.split(flat, row_splits)
+        self.assertTrue(np.shares_memory(rows[0], flat))
+
+    def test_empty_batch(self):
+        flat, row_splits = arrays.concat([], np.int64)
+        self.assertEqual(len(flat), 0)
+        self.assertEqual(row_splits.tolist(), [0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""Tests for the benchmark harness."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from sparse import bench
+
+
+class TestBench(unittest.TestCase):
+    """Test corpora, single cases and the report."""
+
+    def test_make_corpus_is_deterministic(self):
+        """Same kind and seed always give the same documents."""
+        for kind in bench.CORPORA:
+            first = bench.make_corpus(kind, 10, seed=1)
+            self.assertEqual(len(first), 10)
+            self.assertEqual(first, bench.make_corpus(kind, 10, seed=1))
+            self.assertNotEqual(first, bench.make_corpus(kind, 10, seed=2))
+
+    def test_make_corpus_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            bench.make_corpus('poems', 1)
+
+    def test_run_case_lightweight_stage(self):
+        result = bench.run_case(None, {'lowercase': True}, 'tweets', n_docs=20)
+        self.assertEqual(result['status'], 'ok')
+        for key in ('docs_per_s', 'chars_per_s', 'batch_docs_per_s', 'cold_start_s',
+                    'latency_p50_ms', 'latency_p95_ms', 'latency_p99_ms'):
+            self.assertGreaterEqual(result[key], 0)
+        self.assertLessEqual(result['latency_p50_ms'], result['latency_p99_ms'])
+
+    def test_missing_engine_is_skipped(self):
+        from unittest import mock
+
+        with mock.patch('sparse.available_engines', return_value=[]):
+            result = bench.run_case('spacy', {'tokenize': True}, 'tweets', n_docs=5)
+        self.assertEqual(result['status'], 'skipped')
+
+    def test_cases_cover_engines_and_stages(self):
+        cases = bench.cases(engines=['nltk'], stages=['lowercase'], corpora=['html'])
+        self.assertEqual(len(cases), len(bench.ENGINE_OPTION_SETS) + 1)
+        self.assertEqual(cases[-1], {'engine': None, 'options': {'lowercase': True},
+                                     'corpus': 'html'})
+
+    def test_main_writes_json_report(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'bench.json')
+            code = bench.main(['--engines', '--stages', 'lowercase', 'remove_urls',
+                               '--corpora', 'tweets', '--docs', '5', '--output', path])
+            self.assertEqual(code, 0)
+            with open(path) as f:
+                report = json.load(f)
+        self.assertTrue(report['isolated'])
+        self.assertEqual([r['status'] for r in report['results']], ['ok', 'ok'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+"""Tests for the opt-in result cache."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from sparse import cache, engines, parse, parse_batch
+from tests.fakes import counting_engine, register_test_engine
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        register_test_engine(self, 'counting', counting_engine(self.calls))
+
+    def tearDown(self):
+        cache.disable()
+
+    def test_cache_disabled_by_default(self):
+        self.assertIsNone(cache.stats())
+        parse("a", engine="counting")
+        parse("a", engine="counting")
+        self.assertEqual(self.calls, ["a", "a"])
+
+    def test_memory_hits(self):
+        cache.enable()
+        self.assertEqual(parse("a b", engine="counting", tokenize=True), ["a", "b"])
+        self.assertEqual(parse("a b", engine="counting", tokenize=True), ["a", "b"])
+        self.assertEqual(self.calls, ["a b"])
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_options_are_part_of_key(self):
+        cache.enable()
+        self.assertEqual(parse("a", engine="counting"), "A")
+        self.assertEqual(parse("a", engine="counting", tokenize=True), ["a"])
+        # False defaults are normalized away
+        self.assertEqual(parse("a", engine="counting", tokenize=False), "A")
+        self.assertEqual(self.calls, ["a", "a"])
+
+    def test_true_default_set_to_false_is_part_of_key(self):
+        engine = counting_engine(self.calls)
+        engine.parse = lambda text, split=True, **kwargs: text.split() if split else [text]
+        register_test_engine(self, 'splitting', engine)
+        cache.enable()
+        self.assertEqual(parse("a b", engine="splitting"), ["a", "b"])
+        self.assertEqual(parse("a b", engine="splitting", split=False), ["a b"])
+        self.assertEqual(parse("a b", engine="splitting", split=True), ["a", "b"])
+        self.assertEqual(cache.stats()["misses"], 2)
+
+    def test_zero_is_not_a_false_default(self):
+        self.assertNotEqual(cache.options_fingerprint('counting', {'max_df': 0}),
+                            cache.options_fingerprint('counting', {}))
+        self.assertEqual(cache.options_fingerprint('counting', {'tokenize': False}),
+                         cache.options_fingerprint('counting', {}))
+
+    def test_default_model_version_is_part_of_key(self):
+        engine = counting_engine(self.calls)
+        engine.parse = lambda text, model='counting_model', **kwargs: text
+        register_test_engine(self, 'modelled', engine)
+        with patch('sparse.cache._model_version', side_effect=lambda model: f'{model}==1'):
+            default = cache.options_fingerprint('modelled', {})
+            self.assertIn('counting_model==1', default)
+            self.assertEqual(cache.options_fingerprint('modelled', {'model': 'counting_model'}),
+                             default)
+        with patch('sparse.cache._model_version', side_effect=lambda model: f'{model}==2'):
+            self.assertNotEqual(cache.options_fingerprint('modelled', {}), default)
+
+    def test_execution_options_are_not_part_of_key(self):
+        self.assertEqual(
+            cache.options_fingerprint('spacy', {'tokenize': True}),
+            cache.options_fingerprint('spacy', {'tokenize': True, 'batch_size': 64,
+                                                'n_process': 2}),
+        )
+
+    def test_batch_only_computes_misses(self):
+        cache.enable()
+        parse_batch(["a", "b"], engine="counting")
+        self.assertEqual(parse_batch(["b", "c", "a"], engine="counting"), ["B", "C", "A"])
+        self.assertEqual(self.calls, ["a", "b", "c"])
+
+    def test_cached_results_are_not_shared(self):
+        cache.enable()
+        parse("a b", engine="counting", tokenize=True).append("mutated")
+        self.assertEqual(parse("a b", engine="counting", tokenize=True), ["a", "b"])
+
+    def test_lru_eviction(self):
+        cache.enable(maxsize=2)
+        parse_batch(["a", "b", "c"], engine="counting")
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertEqual(cache.stats()["size"], 2)
+
+    def test_lightweight_pipeline_is_cached(self):
+        cache.enable()
+        self.assertEqual(parse("HELLO, World!", lowercase=True), "hello, world!")
+        self.assertEqual(parse("HELLO, World!", lowercase=True), "hello, world!")
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_engine_version_is_part_of_key(self):
+        cache.enable()
+        parse("a", engine="counting")
+        with patch.dict(engines._versions, {'counting': 'counting==2.0'}):
+            parse("a", engine="counting")
+        self.assertEqual(self.calls, ["a", "a"])
+
+    def _check_persistent(self, backend, path):
+        cache.enable(path=path, backend=backend)
+        parse("a b", engine="counting", tokenize=True)
+        # A fresh cache (e.g. after a restart) reads from the persistent tier
+        cache.enable(path=path, backend=backend)
+        self.assertEqual(parse("a b", engine="counting", tokenize=True), ["a", "b"])
+        self.assertEqual(self.calls, ["a b"])
+        self.assertEqual(cache.stats()["store_hits"], 1)
+        cache.clear()
+        parse("a b", engine="counting", tokenize=True)
+        self.assertEqual(self.calls, ["a b", "a b"])
+
+    def test_sqlite_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self._check_persistent('sqlite', os.path.join(tmp, 'cache.sqlite'))
+
+    def test_directory_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self._check_persistent('directory', tmp)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            cache.enable(path='x', backend='redis')
+
+
+if __name__ == '__main__':
+    unittest.main()
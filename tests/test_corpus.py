@@ -0,0 +1,72 @@
+"""Tests for the multi-process corpus runner."""
+
+import io
+import unittest
+from sparse import iter_parse, parse, parse_corpus
+
+
+class TestParseCorpus(unittest.TestCase):
+    def test_parse_corpus_preserves_order(self):
+        texts = [f"Doc NUMBER {i}!" for i in range(50)]
+        result = parse_corpus(texts, workers=2, chunksize=7, lowercase=True,
+                              remove_punctuation=True)
+        self.assertEqual(result, [parse(t, lowercase=True, remove_punctuation=True) for t in texts])
+
+    def test_parse_corpus_accepts_generator(self):
+        result = parse_corpus((t for t in ["A", "B", "C"]), workers=1, chunksize=2, lowercase=True)
+        self.assertEqual(result, ["a", "b", "c"])
+
+    def test_parse_corpus_progress_callback(self):
+        calls = []
+        parse_corpus(["a"] * 10, workers=2, chunksize=4,
+                     progress=lambda done, total: calls.append((done, total)))
+        self.assertEqual(calls, [(4, 10), (8, 10), (10, 10)])
+
+    def test_parse_corpus_unknown_engine_raises_error(self):
+        with self.assertRaises(ValueError) as ctx:
+            parse_corpus(["test"], engine="unknown_engine", workers=1)
+        self.assertIn("Unknown engine", str(ctx.exception))
+
+    def test_parse_corpus_invalid_chunksize(self):
+        with self.assertRaises(ValueError):
+            parse_corpus(["test"], workers=1, chunksize=0)
+
+
+
+class TestIterParse(unittest.TestCase):
+    def test_iter_parse_is_lazy(self):
+        pulled = []
+
+        def source():
+            for i in range(100):
+                pulled.append(i)
+                yield f"Text {i}"
+
+        results = iter_parse(source(), batch_size=10, lowercase=True)
+        self.assertEqual(pulled, [])
+        self.assertEqual(next(results), "text 0")
+        self.assertLessEqual(len(pulled), 11)
+        self.assertEqual(len(list(results)), 99)
+
+    def test_iter_parse_file_object(self):
+        source = io.StringIO("Hello, World!\nSecond LINE\n")
+        result = list(iter_parse(source, lowercase=True, remove_punctuation=True))
+        self.assertEqual(result, ["hello world", "second line"])
+
+    def test_iter_parse_key(self):
+        rows = [(1, "ONE"), (2, "TWO")]
+        result = list(iter_parse(rows, key=lambda row: row[1], lowercase=True))
+        self.assertEqual(result, ["one", "two"])
+
+    def test_iter_parse_workers_preserves_order(self):
+        texts = [f"Doc {i}" for i in range(30)]
+        result = list(iter_parse(iter(texts), batch_size=4, workers=2, lowercase=True))
+        self.assertEqual(result, [t.lower() for t in texts])
+
+    def test_iter_parse_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            list(iter_parse(["test"], batch_size=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Tests for in-batch deduplication."""
+
+import unittest
+
+from sparse import dedup, parse_batch, parse_corpus
+from tests.fakes import counting_engine, register_test_engine
+
+
+class TestDedupHelpers(unittest.TestCase):
+    def test_dedupe_exact(self):
+        unique, positions = dedup.dedupe(["a", "b", "a", "c", "b"])
+        self.assertEqual(unique, ["a", "b", "c"])
+        self.assertEqual(positions, [0, 1, 0, 2, 1])
+
+    def test_dedupe_normalized(self):
+        unique, positions = dedup.dedupe(["Hello  World", "hello world ", "other"],
+                                         key=dedup.normalize)
+        self.assertEqual(unique, ["Hello  World", "other"])
+        self.assertEqual(positions, [0, 0, 1])
+
+    def test_expand_copies_mutable_results(self):
+        results = dedup.expand([["a"], [{"text": "x"}]], [0, 0, 1, 1])
+        self.assertEqual(results, [["a"], ["a"], [{"text": "x"}], [{"text": "x"}]])
+        self.assertIsNot(results[0], results[1])
+        self.assertIsNot(results[2][0], results[3][0])
+
+
+class TestBatchDedup(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        register_test_engine(self, 'counting', counting_engine(self.calls, batch=True))
+
+    def test_parse_batch_parses_duplicates_once(self):
+        result = parse_batch(["a b", "c", "a b", "a b"], engine="counting", tokenize=True)
+        self.assertEqual(result, [["a", "b"], ["c"], ["a", "b"], ["a", "b"]])
+        self.assertEqual(self.calls, ["a b", "c"])
+        result[0].append("mutated")
+        self.assertEqual(result[2], ["a", "b"])
+
+    def test_parse_batch_dedupe_disabled(self):
+        parse_batch(["a", "a"], engine="counting", dedupe=False)
+        self.assertEqual(self.calls, ["a", "a"])
+
+    def test_parse_batch_normalized_key(self):
+        result = parse_batch(["RT  hello", "rt hello"], engine="counting", dedupe=dedup.normalize)
+        self.assertEqual(result, ["RT  HELLO", "RT  HELLO"])
+        self.assertEqual(self.calls, ["RT  hello"])
+
+    def test_parse_corpus_dedupe_preserves_order(self):
+        texts = ["A", "B", "A", "C", "A", "B"] * 5
+        result = parse_corpus(texts, workers=2, chunksize=4, lowercase=True)
+        self.assertEqual(result, [t.lower() for t in texts])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Tests for the persistent DocBin store."""
+
+import os
+import tempfile
+import unittest
+
+try:
+    import spacy
+    SPACY_AVAILABLE = True
+except ImportError:
+    SPACY_AVAILABLE = False
+
+from sparse import docstore
+
+
+@unittest.skipUnless(SPACY_AVAILABLE, "spaCy not installed")
+class TestDocStore(unittest.TestCase):
+    """Test storing and reloading annotated Docs."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'docs.sqlite')
+        self.nlp = spacy.blank('en')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_second_run_loads_stored_docs(self):
+        store = docstore.DocStore(self.path)
+        texts = ["Hello world", "Another text", "Hello world"]
+        first = [doc.text for doc in store.pipe(self.nlp, texts)]
+        self.assertEqual(first, texts)
+        self.assertEqual(store.stats(), {'hits': 0, 'misses': 3})
+
+        # A new instance reads what the first one wrote.
+        reopened = docstore.DocStore(self.path)
+        docs = list(reopened.pipe(self.nlp, texts))
+        self.assertEqual([[t.text for t in doc] for doc in docs],
+                         [["Hello", "world"], ["Another", "text"], ["Hello", "world"]])
+        self.assertEqual(reopened.stats(), {'hits': 3, 'misses': 0})
+
+    def test_as_tuples(self):
+        store = docstore.DocStore(self.path)
+        result = [(doc.text, context)
+                  for doc, context in store.pipe(self.nlp, [("a b", 1), ("c", 2)], as_tuples=True)]
+        self.assertEqual(result, [("a b", 1), ("c", 2)])
+
+    def test_pipeline_is_part_of_key(self):
+        store = docstore.DocStore(self.path)
+        list(store.pipe(self.nlp, ["Hello"]))
+        other = spacy.blank('en')
+        other.add_pipe('sentencizer')
+        list(store.pipe(other, ["Hello"]))
+        self.assertEqual(store.stats(), {'hits': 0, 'misses': 2})
+
+    def test_get_store_shares_instances(self):
+        self.assertIs(docstore.get_store(self.path), docstore.get_store(self.path))
+        store = docstore.DocStore(self.path)
+        self.assertIs(docstore.get_store(store), store)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 """Tests for the Flair engine."""
 
 import unittest
-from sparse import parse
+from sparse import parse, parse_batch
 
 
 class TestFlairEngine(unittest.TestCase):
@@ -38,6 +38,24 @@ class TestFlairEngine(unittest.TestCase):
         except RuntimeError:
             raise unittest.SkipTest("Flair POS model not available")
 
+    def test_flair_ner_and_pos_together(self):
+        text = "Apple is in Cupertino. Tim Cook works there."
+        try:
+            result = parse(text, engine="flair", ner=True, pos_tag=True, mini_batch_size=4,
+                           split_sentences=True)
+        except RuntimeError:
+            raise unittest.SkipTest("Flair NER/POS models not available")
+        self.assertEqual(set(result), {"entities", "pos"})
+        self.assertEqual(result["entities"],
+                         parse(text, engine="flair", ner=True, split_sentences=True))
+        for entity in result["entities"]:
+            # Offsets refer to the original text, across split sentences
+            self.assertEqual(text[entity["start"]:entity["end"]], entity["text"])
+
+    def test_flair_parse_batch(self):
+        result = parse_batch(["Hello world", "Goodbye"], engine="flair", tokenize=True)
+        self.assertEqual(result, [["Hello", "world"], ["Goodbye"]])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,10 @@
 """Tests for the Gensim engine."""
 
+import os
+import tempfile
 import unittest
-from sparse import parse
+from sparse import models, parse
+from sparse.engines.gensim_engine import TokenStream
 
 
 class TestGensimEngine(unittest.TestCase):
@@ -38,6 +41,77 @@ class TestGensimEngine(unittest.TestCase):
         self.assertIsInstance(joined, str)
         self.assertEqual(joined, "hello world")
 
+    def test_dictionary_and_mm_corpus(self):
+        from sparse.engines.gensim_engine import build_dictionary, serialize_corpus
+
+        tokens = TokenStream(["Hello world", "hello again", "Goodbye world"])
+        dictionary = build_dictionary(tokens)
+        self.assertEqual(dictionary.num_docs, 3)
+        self.assertIn("hello", dictionary.token2id)
+
+        # The highest id never occurs in the serialized documents
+        dictionary.add_documents([["unseen"]])
+        with tempfile.TemporaryDirectory() as tmp:
+            corpus = serialize_corpus(tokens, dictionary, os.path.join(tmp, "corpus.mm"))
+            self.assertEqual(len(corpus), 3)
+            self.assertEqual(corpus.num_terms, len(dictionary))
+            self.assertEqual(list(corpus)[1], sorted(
+                (dictionary.token2id[t], 1.0) for t in ["hello", "again"]))
+
+    def test_train_vectors_and_embed(self):
+        import numpy as np
+        from sparse.engines.gensim_engine import load_vectors, train_vectors
+
+        tokens = TokenStream(["hello world", "hello again", "goodbye world"] * 10)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "vectors.kv")
+            trained = train_vectors(tokens, path, workers=2, vector_size=8, min_count=1,
+                                    epochs=1)
+            try:
+                vectors = load_vectors(path)
+                self.assertIsInstance(vectors.vectors, np.memmap)
+                vector = parse("Hello world", engine="gensim", embed=True, vectors=path)
+                np.testing.assert_allclose(
+                    vector, np.mean([trained["hello"], trained["world"]], axis=0), rtol=1e-6)
+                unknown = parse("unseen", engine="gensim", embed=True, vectors=path)
+                self.assertFalse(unknown.any())
+            finally:
+                models.evict(engine="gensim")
+
+    def test_train_vectors_unknown_algorithm(self):
+        from sparse.engines.gensim_engine import train_vectors
+
+        with self.assertRaises(ValueError):
+            train_vectors([["a"]], algorithm="glove")
+
+
+class TestTokenStream(unittest.TestCase):
+    """Streaming token lists, using the lightweight pipeline."""
+
+    def test_file_source_restarts(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "corpus.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("Hello, World\nfoo bar\n")
+            tokens = TokenStream(path, engine=None, lowercase=True, remove_punctuation=True)
+            self.assertEqual(list(tokens), [["hello", "world"], ["foo", "bar"]])
+            self.assertEqual(list(tokens), list(tokens))
+
+    def test_callable_source_restarts(self):
+        tokens = TokenStream(lambda: (text for text in ["a b", "c"]), engine=None, batch_size=1)
+        self.assertEqual(list(tokens), [["a", "b"], ["c"]])
+        self.assertEqual(list(tokens), [["a", "b"], ["c"]])
+
+    def test_tokenize_option_is_accepted(self):
+        tokens = TokenStream(["a b"], engine=None, tokenize=True)
+        self.assertEqual(list(tokens), [["a", "b"]])
+
+    def test_one_shot_iterator(self):
+        tokens = TokenStream(iter(["a b"]), engine=None)
+        self.assertEqual(list(tokens), [["a", "b"]])
+        with self.assertRaises(RuntimeError):
+            list(tokens)
+
 
 if __name__ == '__main__':
     unittest.main()
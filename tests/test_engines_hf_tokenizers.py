@@ -1,7 +1,12 @@
 """Tests for the Hugging Face Tokenizers engine."""
 
+import os
+import threading
 import unittest
-from sparse import parse
+from unittest import mock
+
+from sparse import parse, parse_batch
+from sparse.engines import hf_tokenizers_engine
 
 
 class TestHFTokenizersEngine(unittest.TestCase):
@@ -11,6 +16,10 @@ class TestHFTokenizersEngine(unittest.TestCase):
             import tokenizers  # noqa: F401
         except ImportError:
             raise unittest.SkipTest("Tokenizers not installed")
+        try:
+            hf_tokenizers_engine._load_tokenizer("bert-base-uncased")
+        except RuntimeError:
+            raise unittest.SkipTest("bert-base-uncased tokenizer not available")
 
     def test_hf_tokenizers_tokenize(self):
         result = parse("Hello world", engine="hf_tokenizers", tokenize=True)
@@ -26,6 +35,92 @@ class TestHFTokenizersEngine(unittest.TestCase):
         joined = parse("Hello world", engine="hf_tokenizers", tokenize=False)
         self.assertIsInstance(joined, str)
 
+    def test_hf_tokenizers_parse_batch(self):
+        texts = ["Hello world", "Goodbye"]
+        result = parse_batch(texts, engine="hf_tokenizers", tokenize=True)
+        self.assertEqual(result, [parse(t, engine="hf_tokenizers", tokenize=True) for t in texts])
+
+    def test_hf_tokenizers_as_arrays(self):
+        texts = ["Hello world", "Goodbye"]
+        result = parse_batch(texts, engine="hf_tokenizers", as_arrays=True, num_threads=2)
+        for text, arrays in zip(texts, result):
+            self.assertEqual(arrays["ids"].tolist(),
+                             parse(text, engine="hf_tokenizers", return_ids=True))
+            self.assertEqual(arrays["offsets"].shape, (len(arrays["ids"]), 2))
+
+    def test_hf_tokenizers_encode_flat(self):
+        from sparse.engines.hf_tokenizers_engine import encode
+
+        flat = encode(["Hello world", "Goodbye"])
+        self.assertEqual(len(flat["row_splits"]), 3)
+        self.assertEqual(flat["row_splits"][-1], len(flat["ids"]))
+
+    def test_hf_tokenizers_local_file(self):
+        import os
+        import tempfile
+        from sparse.engines.hf_tokenizers_engine import _load_tokenizer
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tokenizer.json")
+            _load_tokenizer("bert-base-uncased").save(path)
+            self.assertEqual(parse("Hello world", engine="hf_tokenizers", tokenize=True,
+                                   model_name=tmp),
+                             parse("Hello world", engine="hf_tokenizers", tokenize=True))
+
+
+class TestThreadSettings(unittest.TestCase):
+    """num_threads only applies to its own call, without the tokenizers library."""
+
+    def test_environment_restored(self):
+        with mock.patch.dict(os.environ, clear=True), \
+                mock.patch.object(hf_tokenizers_engine, '_num_threads', None):
+            with hf_tokenizers_engine._thread_settings(1):
+                self.assertEqual(os.environ['TOKENIZERS_PARALLELISM'], 'false')
+            self.assertNotIn('TOKENIZERS_PARALLELISM', os.environ)
+
+            os.environ['TOKENIZERS_PARALLELISM'] = 'true'
+            with hf_tokenizers_engine._thread_settings(4):
+                self.assertEqual(os.environ['RAYON_NUM_THREADS'], '4')
+            self.assertEqual(os.environ['TOKENIZERS_PARALLELISM'], 'true')
+            self.assertNotIn('RAYON_NUM_THREADS', os.environ)
+
+    def test_concurrent_overrides_restore_environment(self):
+        inside, release = threading.Event(), threading.Event()
+        second_entered = threading.Event()
+
+        def first():
+            with hf_tokenizers_engine._thread_settings(1):
+                inside.set()
+                release.wait(5)
+
+        def second():
+            with hf_tokenizers_engine._thread_settings(4):
+                second_entered.set()
+
+        with mock.patch.dict(os.environ, clear=True), \
+                mock.patch.object(hf_tokenizers_engine, '_num_threads', None):
+            threads = [threading.Thread(target=first), threading.Thread(target=second)]
+            threads[0].start()
+            inside.wait(5)
+            threads[1].start()
+            # The second call waits until the first has restored the environment.
+            self.assertFalse(second_entered.wait(0.2))
+            release.set()
+            for thread in threads:
+                thread.join(5)
+            self.assertTrue(second_entered.is_set())
+            self.assertNotIn('TOKENIZERS_PARALLELISM', os.environ)
+            self.assertNotIn('RAYON_NUM_THREADS', os.environ)
+
+    def test_pool_size_change_warns(self):
+        with mock.patch.dict(os.environ, clear=True), \
+                mock.patch.object(hf_tokenizers_engine, '_num_threads', None):
+            with hf_tokenizers_engine._thread_settings(4):
+                pass
+            with self.assertWarns(UserWarning):
+                with hf_tokenizers_engine._thread_settings(8):
+                    self.assertNotIn('RAYON_NUM_THREADS', os.environ)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,65 @@
+"""Tests for the engine registry."""
+
+import sys
+import types
+import unittest
+from unittest.mock import patch
+
+from sparse import (available_engines, engines, parse, parse_batch, register_engine,
+                    unregister_engine)
+from tests.fakes import counting_engine
+
+
+def _fake_engine():
+    return counting_engine([])
+
+
+class TestEngineRegistry(unittest.TestCase):
+    def tearDown(self):
+        unregister_engine('fake')
+
+    def test_available_engines_does_not_import_libraries(self):
+        before = set(sys.modules)
+        names = available_engines()
+        self.assertIsInstance(names, list)
+        self.assertEqual(names, sorted(names))
+        for heavy in ('spacy', 'stanza', 'flair', 'transformers', 'torch'):
+            if heavy not in before:
+                self.assertNotIn(heavy, sys.modules)
+
+    def test_register_engine_object(self):
+        register_engine('fake', _fake_engine())
+        self.assertEqual(parse("hello world", engine="fake"), "HELLO WORLD")
+        self.assertEqual(parse_batch(["a b", "c"], engine="fake", tokenize=True),
+                         [["a", "b"], ["c"]])
+        self.assertIn('fake', available_engines())
+
+    def test_get_engine_is_cached(self):
+        register_engine('fake', _fake_engine())
+        self.assertIs(engines.get_engine('fake'), engines.get_engine('fake'))
+
+    def test_entry_point_engine(self):
+        entry_point = types.SimpleNamespace(name='fake', value='fake_pkg.engine',
+                                            load=_fake_engine)
+        with patch.object(engines, '_entry_points_scanned', False), \
+                patch.object(engines, '_iter_entry_points', return_value=[entry_point]):
+            self.assertEqual(parse("hi", engine="fake"), "HI")
+
+    def test_unimportable_engine_raises_install_hint(self):
+        register_engine('fake', 'sparse_missing_module', install_hint='Install fake')
+        with self.assertRaises(ValueError) as ctx:
+            parse("test", engine="fake")
+        self.assertEqual(str(ctx.exception), 'Install fake')
+        self.assertNotIn('fake', available_engines())
+
+    def test_unregister_engine(self):
+        register_engine('fake', _fake_engine())
+        parse("hi", engine="fake")
+        unregister_engine('fake')
+        self.assertNotIn('fake', available_engines())
+        with self.assertRaises(ValueError):
+            parse("hi", engine="fake")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,12 @@
 """Tests for the SentencePiece engine."""
 
+import os
+import tempfile
 import unittest
-from sparse import parse
+from unittest import mock
+
+from sparse import models, parse, parse_batch
+from sparse.engines import sentencepiece_engine
 
 
 class TestSentencePieceEngine(unittest.TestCase):
@@ -27,6 +32,82 @@ class TestSentencePieceEngine(unittest.TestCase):
             raise unittest.SkipTest("SentencePiece model not available")
         self.assertIsInstance(joined, str)
 
+    def test_sentencepiece_parse_batch(self):
+        try:
+            result = parse_batch(["Hello world", "Goodbye"], engine="sentencepiece",
+                                 tokenize=True, model_file="dummy.model")
+        except RuntimeError:
+            raise unittest.SkipTest("SentencePiece model not available")
+        self.assertEqual(len(result), 2)
+
+    def test_sentencepiece_out_type_int(self):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            raise unittest.SkipTest("NumPy not installed")
+        import sentencepiece as spm
+
+        try:
+            sentencepiece_engine._proto_out_type()
+        except RuntimeError:
+            raise unittest.SkipTest("protobuf not installed")
+
+        texts = ["Hello world", "Goodbye world", "héllo café"]
+        with tempfile.TemporaryDirectory() as tmp:
+            prefix = os.path.join(tmp, "m")
+            spm.SentencePieceTrainer.train(sentence_iterator=iter(texts * 50), model_prefix=prefix,
+                                           vocab_size=20, model_type="char",
+                                           hard_vocab_limit=False)
+            model_file = prefix + ".model"
+            result = parse_batch(texts, engine="sentencepiece", model_file=model_file,
+                                 out_type=int, num_threads=2)
+            flat = sentencepiece_engine.encode(texts, model_file)
+            models.evict(engine="sentencepiece")
+
+        for text, arrays in zip(texts, result):
+            self.assertEqual(len(arrays["ids"]), len(arrays["offsets"]))
+            start, end = arrays["offsets"][-1]
+            self.assertEqual(end, len(text))
+        self.assertEqual(flat["row_splits"][-1], len(flat["ids"]))
+
+
+class TestSentencePieceProcessorCache(unittest.TestCase):
+    """Processor caching, without SentencePiece models."""
+
+    def tearDown(self):
+        models.evict(engine='sentencepiece')
+
+    def test_processors_cached_per_model_file(self):
+        with mock.patch.object(sentencepiece_engine, '_processor_load',
+                               side_effect=lambda model_file: object()) as load:
+            first = sentencepiece_engine._load_processor('a.model')
+            self.assertIs(sentencepiece_engine._load_processor('a.model'), first)
+            sentencepiece_engine._load_processor('b.model')
+        self.assertEqual(load.call_args_list, [mock.call('a.model'), mock.call('b.model')])
+
+    def test_proto_out_type_follows_version(self):
+        for version, out_type in (("0.1.99", "immutable_proto"), ("0.2.0", "immutable_proto"),
+                                  ("0.2.1", "proto")):
+            sentencepiece_engine._proto_out_type.cache_clear()
+            google = mock.Mock()
+            with mock.patch.dict("sys.modules", {"sentencepiece": mock.Mock(__version__=version),
+                                                 "google": google,
+                                                 "google.protobuf": google.protobuf}):
+                self.assertEqual(sentencepiece_engine._proto_out_type(), out_type)
+        sentencepiece_engine._proto_out_type.cache_clear()
+
+    def test_proto_byte_offsets_become_character_offsets(self):
+        text = "héllo café"
+        # UTF-8 byte spans of "h", "é", "llo", " café"
+        byte_spans = [(0, 1), (1, 3), (3, 6), (6, 12)]
+        self.assertEqual(sentencepiece_engine._char_spans(text, byte_spans),
+                         [(0, 1), (1, 2), (2, 5), (5, 10)])
+        self.assertEqual(sentencepiece_engine._char_spans("hello", [(0, 5)]), [(0, 5)])
+
+    def test_model_file_required(self):
+        with self.assertRaises(RuntimeError):
+            sentencepiece_engine._load_processor(None)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,7 @@
 """Tests for the scikit-learn feature extraction engine."""
 
+import os
+import tempfile
 import unittest
 from sparse import parse
 
@@ -25,6 +27,70 @@ class TestSklearnEngine(unittest.TestCase):
         vec = parse("Hello world", engine="sklearn", tokenize=False, vectorizer="tfidf")
         self.assertFalse(vec.shape[0] == 0)
 
+    def test_corpus_vectorizer_one_matrix(self):
+        from sparse.engines.sklearn_engine import CorpusVectorizer
+
+        texts = ["Hello, world!", "hello again", "Goodbye world"]
+        vectorizer = CorpusVectorizer("tfidf", lowercase=True, remove_punctuation=True)
+        matrix = vectorizer.fit_transform(iter(texts))
+        self.assertEqual(matrix.format, "csr")
+        self.assertEqual(matrix.shape, (3, 4))
+        self.assertEqual(list(vectorizer.get_feature_names_out()),
+                         ["again", "goodbye", "hello", "world"])
+
+    def test_corpus_vectorizer_save_load(self):
+        from sparse.engines.sklearn_engine import CorpusVectorizer
+
+        vectorizer = CorpusVectorizer("count", lowercase=True, tokenize=True)
+        vectorizer.fit(["Hello world", "hello again"])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "vectorizer.pkl")
+            vectorizer.save(path)
+            loaded = CorpusVectorizer.load(path)
+        matrix = loaded.transform(["HELLO unseen"])
+        self.assertEqual(matrix.shape, (1, 3))
+        self.assertEqual(matrix.sum(), 1)
+
+    def test_hashing_featurizer_chunks_and_workers(self):
+        from sparse.engines.sklearn_engine import HashingFeaturizer
+
+        texts = ["Hello world", "hello again", "Goodbye world", "again and again", "bye"]
+        featurizer = HashingFeaturizer(n_features=2 ** 10, chunksize=2, lowercase=True)
+        chunks = list(featurizer.iter_transform(texts))
+        self.assertEqual([chunk.shape[0] for chunk in chunks], [2, 2, 1])
+
+        matrix = featurizer.transform(texts)
+        self.assertEqual(matrix.format, "csr")
+        self.assertEqual(matrix.shape, (5, 2 ** 10))
+        parallel = HashingFeaturizer(n_features=2 ** 10, chunksize=2, lowercase=True, workers=2)
+        self.assertEqual((parallel.transform(texts) != matrix).nnz, 0)
+
+    def test_hashing_featurizer_tfidf_matches_tfidf_vectorizer(self):
+        import numpy as np
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sparse.engines.sklearn_engine import HashingFeaturizer
+
+        texts = ["hello world", "hello again", "goodbye world", "again and again"]
+        featurizer = HashingFeaturizer(n_features=2 ** 18, tfidf=True, chunksize=3)
+        with self.assertRaises(RuntimeError):
+            featurizer.transform(texts)
+        hashed = featurizer.fit(iter(texts)).transform(iter(texts))
+        expected = TfidfVectorizer().fit_transform(texts)
+        for i in range(len(texts)):
+            np.testing.assert_allclose(sorted(hashed[i].data), sorted(expected[i].data))
+
+    def test_hashing_featurizer_shards(self):
+        from sparse.engines.sklearn_engine import HashingFeaturizer, load_shards
+
+        texts = ["Hello world", "hello again", "Goodbye world"]
+        featurizer = HashingFeaturizer(n_features=2 ** 10, chunksize=2)
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = featurizer.write_shards(iter(texts), os.path.join(tmp, "features"))
+            self.assertEqual([os.path.basename(path) for path in paths],
+                             ["shard-00000.npz", "shard-00001.npz"])
+            matrix = load_shards(paths)
+        self.assertEqual((matrix != featurizer.transform(texts)).nnz, 0)
+
 
 if __name__ == '__main__':
     unittest.main()
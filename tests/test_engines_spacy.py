@@ -1,7 +1,7 @@
 """Tests for spaCy engine."""
 
 import unittest
-from sparse import parse
+from sparse import parse, parse_batch, parse_corpus
 
 
 class TestSpaCyEngine(unittest.TestCase):
@@ -112,6 +112,113 @@ class TestSpaCyEngine(unittest.TestCase):
         self.assertIn("start", entity)
         self.assertIn("end", entity)
 
+    
+    def test_spacy_parse_batch(self):
+        """Test spaCy batch parsing matches single-text parsing."""
+        texts = ["Hello world", "The quick brown fox"]
+        result = parse_batch(texts, engine="spacy", remove_stopwords=True, tokenize=True)
+        self.assertEqual(result, [parse(t, engine="spacy", remove_stopwords=True, tokenize=True)
+                                  for t in texts])
+    
+    def test_spacy_parse_batch_tuning_and_tuples(self):
+        """Test batch_size, n_process and as_tuples on the nlp.pipe path."""
+        texts = [("Hello world", 1), ("The quick brown fox", 2)]
+        result = parse_batch(texts, engine="spacy", tokenize=True, batch_size=1,
+                             n_process=1, as_tuples=True)
+        self.assertEqual(result, [(parse(t, engine="spacy", tokenize=True), i) for t, i in texts])
+
+    def test_spacy_as_arrays(self):
+        """Test columnar output matches the token-list output."""
+        from sparse.engines.spacy_engine import strings
+
+        text = "The cats are running, quickly!"
+        options = dict(remove_stopwords=True, remove_punctuation=True, lemmatize=True)
+        arrays = parse(text, engine="spacy", as_arrays=True, pos_tag=True, **options)
+        store = strings()
+
+        self.assertEqual([store[int(h)] for h in arrays["lemma"]],
+                         parse(text, engine="spacy", tokenize=True, **options))
+        self.assertEqual([text[s:e] for s, e in zip(arrays["start"], arrays["end"])],
+                         [store[int(h)] for h in arrays["orth"]])
+        self.assertFalse(arrays["is_stop"].any())
+        self.assertFalse(arrays["is_punct"].any())
+        self.assertEqual(len(arrays["pos"]), len(arrays["orth"]))
+
+    def test_spacy_as_arrays_batch(self):
+        """Test batch columnar output, including lowercase hashes."""
+        from sparse.engines.spacy_engine import strings
+
+        result = parse_batch(["Hello World", ""], engine="spacy", as_arrays=True, lowercase=True)
+        self.assertEqual([strings()[int(h)] for h in result[0]["orth"]], ["hello", "world"])
+        self.assertEqual(len(result[1]["orth"]), 0)
+
+    def test_spacy_doc_store(self):
+        """Test re-runs with different options reuse stored annotations."""
+        import os
+        import tempfile
+        from sparse import docstore
+
+        texts = ["The cats are running", "Apple is in London"]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "docs.sqlite")
+            lemmas = parse_batch(texts, engine="spacy", lemmatize=True, tokenize=True,
+                                 doc_store=path)
+            entities = parse_batch(texts, engine="spacy", ner=True, doc_store=path)
+            self.assertEqual(docstore.get_store(path).stats(), {'hits': 2, 'misses': 2})
+
+        self.assertEqual(lemmas, parse_batch(texts, engine="spacy", lemmatize=True, tokenize=True))
+        self.assertEqual(entities, parse_batch(texts, engine="spacy", ner=True))
+
+    def test_spacy_parse_corpus(self):
+        """Test spaCy corpus parsing across worker processes."""
+        texts = ["Hello world", "The quick brown fox", "Apple is in Cupertino"]
+        result = parse_corpus(texts, engine="spacy", workers=2, chunksize=1, tokenize=True)
+        self.assertEqual(result, [parse(t, engine="spacy", tokenize=True) for t in texts])
+
+
+    def test_spacy_minimal_components(self):
+        """Only the components the options need are loaded."""
+        from sparse import models
+        from sparse.engines import spacy_engine
+
+        parse("Hello world", engine="spacy", tokenize=True, remove_stopwords=True)
+        parse("Apple is in London", engine="spacy", ner=True)
+        parse("cats running", engine="spacy", lemmatize=True)
+
+        nlp = spacy_engine._load_model(
+            'en_core_web_sm', spacy_engine._excluded_components(False, True, False, False))
+        self.assertEqual(nlp.pipe_names, [])
+
+        nlp = spacy_engine._load_model(
+            'en_core_web_sm', spacy_engine._excluded_components(False, False, False, True))
+        self.assertIn('ner', nlp.pipe_names)
+        self.assertNotIn('parser', nlp.pipe_names)
+        self.assertNotIn('lemmatizer', nlp.pipe_names)
+
+        nlp = spacy_engine._load_model(
+            'en_core_web_sm', spacy_engine._excluded_components(True, True, False, False))
+        self.assertIn('lemmatizer', nlp.pipe_names)
+        self.assertNotIn('ner', nlp.pipe_names)
+
+        spacy_models = [entry for entry in models.loaded() if entry['engine'] == 'spacy']
+        self.assertGreaterEqual(len(spacy_models), 3)
+
+    def test_spacy_vocab_freed_with_models(self):
+        """The shared Vocab lives only as long as a cached component set."""
+        from sparse import models
+        from sparse.engines import spacy_engine
+
+        tokenizer_only = spacy_engine._load_model('en_core_web_sm',
+                                                  spacy_engine._OPTIONAL_COMPONENTS)
+        nlp = spacy_engine._load_model(
+            'en_core_web_sm', spacy_engine._excluded_components(False, False, False, True))
+        self.assertIs(nlp.vocab, tokenizer_only.vocab)
+
+        models.evict(engine='spacy')
+        self.assertIsNone(spacy_engine._shared_vocab('en_core_web_sm'))
+        reloaded = spacy_engine._load_model('en_core_web_sm', spacy_engine._OPTIONAL_COMPONENTS)
+        self.assertIsNot(reloaded.vocab, tokenizer_only.vocab)
+
 
 if __name__ == '__main__':
     unittest.main()
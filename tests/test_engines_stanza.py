@@ -1,7 +1,11 @@
 """Tests for the Stanza engine."""
 
 import unittest
-from sparse import parse
+from types import SimpleNamespace
+from unittest import mock
+
+from sparse import models, parse, parse_batch
+from sparse.engines import stanza_engine
 
 
 class TestStanzaEngine(unittest.TestCase):
@@ -48,5 +52,47 @@ class TestStanzaEngine(unittest.TestCase):
         self.assertIn("text", ents[0])
 
 
+    def test_stanza_parse_batch(self):
+        result = parse_batch(["Hello world", "cats dogs"], engine="stanza", tokenize=True)
+        self.assertEqual(len(result), 2)
+        self.assertIn("Hello", result[0])
+        self.assertIn("dogs", result[1])
+
+    def test_stanza_lang_parameter(self):
+        result = parse("Hello world", engine="stanza", tokenize=True, lang="en")
+        self.assertEqual(result, parse("Hello world", engine="stanza", tokenize=True))
+
+
+class TestStanzaProcessors(unittest.TestCase):
+    """Processor selection and pipeline caching, without Stanza models."""
+
+    def tearDown(self):
+        models.evict(engine='stanza')
+
+    def test_processors_follow_options(self):
+        self.assertEqual(stanza_engine._processors(lemmatize=False, ner=False), 'tokenize')
+        self.assertEqual(stanza_engine._processors(lemmatize=True, ner=False),
+                         'tokenize,pos,lemma')
+        self.assertEqual(stanza_engine._processors(lemmatize=True, ner=True), 'tokenize,ner')
+
+    def test_pipelines_cached_per_lang_and_processors(self):
+        with mock.patch.object(stanza_engine, '_build_pipeline',
+                               side_effect=lambda lang, processors: object()) as build:
+            first = stanza_engine._load_pipeline('en', 'tokenize')
+            self.assertIs(stanza_engine._load_pipeline('en', 'tokenize'), first)
+            stanza_engine._load_pipeline('en', 'tokenize,ner')
+            stanza_engine._load_pipeline('fr', 'tokenize')
+        self.assertEqual(build.call_args_list, [
+            mock.call('en', 'tokenize'),
+            mock.call('en', 'tokenize,ner'),
+            mock.call('fr', 'tokenize'),
+        ])
+
+    def test_punctuation_without_pos(self):
+        self.assertTrue(stanza_engine._is_punct(SimpleNamespace(text='!?', upos=None)))
+        self.assertFalse(stanza_engine._is_punct(SimpleNamespace(text='a!', upos=None)))
+        self.assertTrue(stanza_engine._is_punct(SimpleNamespace(text='-', upos='PUNCT')))
+
+
 if __name__ == '__main__':
     unittest.main()
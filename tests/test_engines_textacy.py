@@ -1,6 +1,7 @@
 """Tests for Textacy engine."""
 
 import unittest
+import unittest.mock
 from unittest.mock import patch
 
 try:
@@ -13,6 +14,11 @@ except ImportError:
 class TestTextacyEngine(unittest.TestCase):
     """Test Textacy engine functionality."""
 
+    def tearDown(self):
+        # Loaded (here: mocked) models are cached across calls.
+        from sparse import models
+        models.evict(engine='textacy')
+
     @unittest.skipUnless(TEXTACY_AVAILABLE, "textacy not installed")
     def test_textacy_tokenize(self):
         """Test basic tokenization."""
@@ -84,4 +90,20 @@ class TestTextacyEngine(unittest.TestCase):
         with patch('spacy.load', side_effect=OSError("Model not found")):
             with self.assertRaises(RuntimeError) as cm:
                 parse("test")
-            self.assertIn("spaCy model", str(cm.exception))
\ No newline at end of file
+            self.assertIn("spaCy model", str(cm.exception))
+
+    @unittest.skipUnless(TEXTACY_AVAILABLE, "textacy not installed")
+    def test_textacy_parse_batch_as_tuples(self):
+        """Test batch parsing streams Docs through nlp.pipe and keeps contexts."""
+        from sparse.engines.textacy_engine import parse_batch
+
+        with patch('spacy.load') as mock_load:
+            mock_nlp = mock_load.return_value
+            docs = [unittest.mock.MagicMock(text="a"), unittest.mock.MagicMock(text="b")]
+            mock_nlp.pipe.return_value = zip(docs, [1, 2])
+
+            result = parse_batch([("a", 1), ("b", 2)], lowercase=True, as_tuples=True,
+                                 batch_size=50)
+            self.assertEqual(result, [("a", 1), ("b", 2)])
+            mock_nlp.pipe.assert_called_once_with(
+                [("a", 1), ("b", 2)], batch_size=50, n_process=1, as_tuples=True)
@@ -1,7 +1,7 @@
 """Tests for the Transformers engine."""
 
 import unittest
-from sparse import parse
+from sparse import parse, parse_batch
 
 
 class TestTransformersEngine(unittest.TestCase):
@@ -33,6 +33,27 @@ class TestTransformersEngine(unittest.TestCase):
         self.assertIsInstance(joined, str)
         self.assertEqual(joined, "hello world")
 
+    def test_transformers_parse_batch_matches_parse(self):
+        texts = ["Hello world", "Tokenizers are fast"]
+        for options in ({"tokenize": True}, {"tokenize": True, "return_ids": True}, {}):
+            self.assertEqual(parse_batch(texts, engine="transformers", **options),
+                             [parse(t, engine="transformers", **options) for t in texts])
+
+    def test_transformers_as_arrays(self):
+        result = parse("Hello world", engine="transformers", as_arrays=True, return_offsets=True)
+        # [CLS] hello world [SEP]
+        self.assertEqual(result["input_ids"].shape, (4,))
+        self.assertEqual(result["attention_mask"].tolist(), [1, 1, 1, 1])
+        self.assertEqual(result["offset_mapping"][1].tolist(), [0, 5])
+
+    def test_transformers_encode_pads_batch(self):
+        from sparse.engines.transformers_engine import encode
+
+        batch = encode(["Hello", "Hello world again"], max_length=4, return_offsets=True)
+        self.assertEqual(batch["input_ids"].shape, (2, 4))
+        self.assertEqual(batch["attention_mask"][0].tolist(), [1, 1, 1, 0])
+        self.assertEqual(batch["offset_mapping"].shape, (2, 4, 2))
+
     def test_unknown_model_raises(self):
         with self.assertRaises(RuntimeError):
             parse("test", engine="transformers", model_name="nonexistent-model")
@@ -0,0 +1,92 @@
+"""Tests for the metrics registry and OpenMetrics exporter."""
+
+import unittest
+import urllib.request
+
+import sparse
+from sparse import cache, metrics, tracing
+
+
+class TestMetrics(unittest.TestCase):
+    """Test counters, histograms and the exposition format."""
+
+    def setUp(self):
+        metrics.reset()
+        metrics.enable()
+
+    def tearDown(self):
+        metrics.disable()
+        metrics.reset()
+        cache.disable()
+
+    def test_disabled_by_default(self):
+        metrics.disable()
+        self.assertFalse(tracing.enabled())
+        sparse.parse('Hello', lowercase=True)
+        self.assertNotIn('sparse_documents_total{', metrics.export())
+
+    def test_documents_and_characters(self):
+        sparse.parse('Hello', lowercase=True)
+        sparse.parse_batch(['One', 'Two', 'Three'], lowercase=True)
+        output = metrics.export()
+        self.assertIn('sparse_documents_total{engine="lightweight",options="lowercase"} 4', output)
+        self.assertIn('sparse_characters_total{engine="lightweight",options="lowercase"} 16',
+                      output)
+        self.assertTrue(output.endswith('# EOF\n'))
+
+    def test_histograms(self):
+        for _ in range(3):
+            sparse.parse('Hello!', lowercase=True, remove_punctuation=True)
+        output = metrics.export()
+        labels = 'engine="lightweight",options="lowercase,remove_punctuation"'
+        self.assertIn(f'sparse_parse_duration_seconds_bucket{{{labels},le="+Inf"}} 3', output)
+        self.assertIn(f'sparse_parse_duration_seconds_count{{{labels}}} 3', output)
+        self.assertIn('sparse_stage_duration_seconds_count'
+                      '{engine="lightweight",stage="remove_punctuation"} 3', output)
+
+    def test_bucket_counts_are_cumulative(self):
+        histogram = metrics.Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.cumulative(), [(0.1, 1), (1.0, 3), (float('inf'), 4)])
+        self.assertEqual(histogram.count, 4)
+
+    def test_errors_and_model_loads(self):
+        registry = metrics.MetricsRegistry()
+        registry(tracing.StageRecord('parse', 'call', 0.01, 3, None, 'spacy', None, 'tokenize',
+                                     None, 'ValueError()'))
+        registry(tracing.StageRecord('load_model', 'load', 1.5, None, None, 'spacy',
+                                     'en_core_web_sm', None, None, None))
+        output = registry.export()
+        self.assertIn('sparse_errors_total{engine="spacy",options="tokenize"} 1', output)
+        self.assertIn('sparse_model_loads_total{engine="spacy",model="en_core_web_sm"} 1', output)
+        self.assertIn('sparse_model_load_seconds_total{engine="spacy",model="en_core_web_sm"} 1.5',
+                      output)
+
+    def test_cache_counters(self):
+        cache.enable()
+        sparse.parse('Hello', lowercase=True)
+        sparse.parse('Hello', lowercase=True)
+        output = metrics.export()
+        self.assertIn('sparse_cache_hits_total{tier="memory"} 1', output)
+        self.assertIn('sparse_cache_misses_total 1', output)
+
+    def test_label_escaping(self):
+        self.assertEqual(metrics._format_labels((('model', 'a"b\\c'),)), '{model="a\\"b\\\\c"}')
+
+    def test_serve(self):
+        server = metrics.serve(port=0)
+        try:
+            sparse.parse('Hello', lowercase=True)
+            host, port = server.server_address[:2]
+            with urllib.request.urlopen(f'http://{host}:{port}/metrics') as response:
+                body = response.read().decode('utf-8')
+                self.assertEqual(response.headers['Content-Type'], metrics.CONTENT_TYPE)
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertIn('sparse_documents_total', body)
+
+
+if __name__ == '__main__':
+    unittest.main()
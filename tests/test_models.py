@@ -0,0 +1,149 @@
+"""Tests for the process-wide model manager."""
+
+import threading
+import unittest
+from unittest.mock import patch
+
+from sparse import models
+from sparse.models import ModelManager
+
+
+class TestModelManager(unittest.TestCase):
+    def test_loader_called_once(self):
+        manager = ModelManager()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return object()
+
+        first = manager.get('spacy', 'en_core_web_sm', loader)
+        self.assertIs(manager.get('spacy', 'en_core_web_sm', loader), first)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(manager.loaded()[0]['hits'], 1)
+
+    def test_config_is_part_of_key(self):
+        manager = ModelManager()
+        a = manager.get('spacy', 'm', object, config={'exclude': ['ner']})
+        b = manager.get('spacy', 'm', object, config={'exclude': ['parser']})
+        self.assertIsNot(a, b)
+        self.assertIs(manager.get('spacy', 'm', object, config={'exclude': ['ner']}), a)
+
+    def test_lru_eviction_by_count(self):
+        manager = ModelManager(max_models=2)
+        manager.get('e', 'a', object)
+        manager.get('e', 'b', object)
+        manager.get('e', 'a', object)  # 'b' is now least recently used
+        manager.get('e', 'c', object)
+        self.assertEqual([m['model'] for m in manager.loaded()], ['a', 'c'])
+
+    def test_rss_budget_evicts_oldest(self):
+        manager = ModelManager(max_rss=100)
+        with patch('sparse.models._current_rss', side_effect=[50, 150, 90, 90]):
+            manager.get('e', 'a', object)
+            manager.get('e', 'b', object)
+            manager.get('e', 'c', object)
+        self.assertEqual([m['model'] for m in manager.loaded()], ['b', 'c'])
+
+    def test_rss_budget_stops_when_eviction_frees_nothing(self):
+        manager = ModelManager()
+        for name in ('a', 'b', 'c'):
+            manager.get('e', name, object)
+        with patch('sparse.models._current_rss', return_value=150):
+            manager.configure(max_rss=100)
+        self.assertEqual([m['model'] for m in manager.loaded()], ['b', 'c'])
+
+    def test_load_does_not_block_other_models(self):
+        manager = ModelManager()
+        manager.get('e', 'fast', object)
+        started, release = threading.Event(), threading.Event()
+
+        def slow_loader():
+            started.set()
+            release.wait(5)
+            return object()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(manager.get('e', 'slow',
+                                                                             slow_loader)))
+                   for _ in range(2)]
+        threads[0].start()
+        started.wait(5)
+        threads[1].start()
+        # Hits on other models are served while 'slow' is loading.
+        manager.get('e', 'fast', object)
+        self.assertEqual(results, [])
+        self.assertEqual(manager.loaded()[0]['hits'], 1)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(len(results), 2)
+        self.assertIs(results[0], results[1])
+
+    def test_waiters_get_load_error(self):
+        manager = ModelManager()
+        started, release = threading.Event(), threading.Event()
+
+        def failing_loader():
+            started.set()
+            release.wait(5)
+            raise RuntimeError("model not found")
+
+        errors = []
+
+        def load():
+            try:
+                manager.get('e', 'missing', failing_loader)
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=load) for _ in range(2)]
+        threads[0].start()
+        started.wait(5)
+        threads[1].start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(manager.loaded(), [])
+
+    def test_find_does_not_count_as_use(self):
+        manager = ModelManager()
+        a = manager.get('spacy', 'm', object, config={'exclude': ['ner']})
+        b = manager.get('spacy', 'm', object, config={'exclude': ['parser']})
+        manager.get('spacy', 'other', object)
+        self.assertEqual(manager.find('spacy', 'm'), [a, b])
+        self.assertEqual([m['hits'] for m in manager.loaded()], [0, 0, 0])
+        self.assertEqual(manager.find('flair', 'm'), [])
+
+    def test_evict_filters(self):
+        manager = ModelManager()
+        manager.get('spacy', 'a', object)
+        manager.get('spacy', 'b', object)
+        manager.get('flair', 'a', object)
+        self.assertEqual(manager.evict(engine='spacy', model='a'), 1)
+        self.assertEqual(manager.evict(model='a'), 1)
+        self.assertEqual(manager.evict(), 1)
+        self.assertEqual(manager.loaded(), [])
+
+    def test_failed_load_is_not_cached(self):
+        manager = ModelManager()
+
+        def loader():
+            raise RuntimeError("model not found")
+
+        with self.assertRaises(RuntimeError):
+            manager.get('e', 'missing', loader)
+        self.assertEqual(manager.loaded(), [])
+
+    def test_module_level_api(self):
+        sentinel = object()
+        try:
+            self.assertIs(models.get('test', 'sentinel', lambda: sentinel), sentinel)
+            self.assertIn('sentinel', [m['model'] for m in models.loaded()])
+        finally:
+            self.assertEqual(models.evict(engine='test'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+"""Tests for pre-compiled pipelines."""
+
+import unittest
+from sparse import Pipeline, parse
+
+
+class TestPipeline(unittest.TestCase):
+    def test_pipeline_matches_parse(self):
+        options = {"lowercase": True, "remove_punctuation": True, "remove_urls": True}
+        pipeline = Pipeline(**options)
+        for text in ["Hello, World!", "See https://example.com NOW", ""]:
+            self.assertEqual(pipeline(text), parse(text, **options))
+
+    def test_pipeline_only_runs_selected_stages(self):
+        pipeline = Pipeline(remove_punctuation=True, lowercase=True, tokenize=False)
+        # Stages follow parse() order, not keyword order
+        self.assertEqual([name for name, _ in pipeline.stages], ["lowercase", "remove_punctuation"])
+
+    def test_pipeline_without_options_is_identity(self):
+        self.assertEqual(Pipeline()("Hello World!"), "Hello World!")
+
+    def test_pipeline_batch(self):
+        pipeline = Pipeline(lowercase=True)
+        self.assertEqual(pipeline.batch(["A", "B"]), ["a", "b"])
+
+    def test_pipeline_rejects_unknown_option(self):
+        with self.assertRaises(TypeError) as ctx:
+            Pipeline(lowercse=True)
+        self.assertIn("lowercse", str(ctx.exception))
+
+    def test_pipeline_unknown_engine_raises_error(self):
+        with self.assertRaises(ValueError) as ctx:
+            Pipeline(engine="unknown_engine")
+        self.assertIn("Unknown engine", str(ctx.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from sparse import parse
+from sparse import parse, parse_batch
 from sparse import utils
 
 
@@ -61,6 +61,34 @@ class TestSparse(unittest.TestCase):
             self.assertIn("NLTK", str(e))
 
 
+
+class TestParseBatch(unittest.TestCase):
+    """Test the batch parse entry point."""
+
+    def test_parse_batch_lightweight_matches_parse(self):
+        """Batch results match per-text parse results, in input order."""
+        texts = ["HELLO, World!", "Second TEXT.", ""]
+        expected = [parse(t, lowercase=True, remove_punctuation=True) for t in texts]
+        result = parse_batch(texts, lowercase=True, remove_punctuation=True)
+        self.assertEqual(result, expected)
+
+    def test_parse_batch_accepts_generator(self):
+        """Any iterable of texts is accepted."""
+        result = parse_batch((t for t in ["A", "B"]), lowercase=True)
+        self.assertEqual(result, ["a", "b"])
+
+    def test_parse_batch_as_tuples(self):
+        """Test contexts are passed through alongside results."""
+        result = parse_batch([("Hello", 1), ("World", {"id": 2}), ("Hello", 3)],
+                             lowercase=True, as_tuples=True)
+        self.assertEqual(result, [("hello", 1), ("world", {"id": 2}), ("hello", 3)])
+
+    def test_parse_batch_unknown_engine_raises_error(self):
+        """Unknown engine raises ValueError for batches too."""
+        with self.assertRaises(ValueError) as ctx:
+            parse_batch(["test"], engine="unknown_engine")
+        self.assertIn("Unknown engine", str(ctx.exception))
+
 class TestNLTKEngine(unittest.TestCase):
     """Test suite for NLTK engine."""
 
@@ -0,0 +1,120 @@
+"""Tests for per-stage tracing."""
+
+import io
+import unittest
+from unittest import mock
+
+import sparse
+from sparse import models, tracing
+from tests.fakes import register_test_engine
+
+
+class _FakeEngine:
+    """Engine whose model is loaded through the model cache."""
+
+    @staticmethod
+    def _model():
+        return models.get('fake', 'fake-model', lambda: str.upper)
+
+    @staticmethod
+    def preload(**options):
+        _FakeEngine._model()
+
+    @staticmethod
+    def parse(text, **options):
+        return _FakeEngine._model()(text).split()
+
+    @staticmethod
+    def parse_batch(texts, **options):
+        return [_FakeEngine.parse(text) for text in texts]
+
+
+class TestTracing(unittest.TestCase):
+    """Test hooks, records and the collector."""
+
+    def tearDown(self):
+        models.evict(engine='fake')
+
+    def test_no_hooks_by_default(self):
+        self.assertFalse(tracing.enabled())
+
+    def test_lightweight_stage_records(self):
+        with sparse.instrument() as collector:
+            result = sparse.parse('Hello, World!', lowercase=True, remove_punctuation=True)
+        self.assertEqual(result, 'hello world')
+        self.assertFalse(tracing.enabled())
+
+        names = [record.name for record in collector.records]
+        self.assertEqual(names, ['lowercase', 'remove_punctuation', 'parse'])
+        call = collector.records[-1]
+        self.assertEqual(call.kind, 'call')
+        self.assertEqual(call.options, 'lowercase,remove_punctuation')
+        punctuation = collector.records[1]
+        self.assertEqual(punctuation.input_size, 13)
+        self.assertEqual(punctuation.output_size, 11)
+        self.assertIsNone(punctuation.engine)
+        self.assertIsNone(punctuation.error)
+
+    def test_callback_receives_records(self):
+        records = []
+        with sparse.instrument(on_stage=records.append):
+            sparse.parse('ABC', lowercase=True)
+        self.assertEqual([record.kind for record in records], ['stage', 'call'])
+        self.assertGreaterEqual(records[0].duration, 0)
+
+    def test_batch_emits_one_record_per_stage(self):
+        with sparse.instrument() as collector:
+            results = sparse.parse_batch(['A', 'BB', 'CCC'], lowercase=True)
+        self.assertEqual(results, ['a', 'bb', 'ccc'])
+        self.assertEqual(len(collector.records), 2)
+        self.assertEqual(collector.records[0].batch_size, 3)
+        self.assertEqual(collector.records[1].batch_size, 3)
+        self.assertEqual(collector.records[0].input_size, 6)
+
+    def test_engine_and_model_load_records(self):
+        register_test_engine(self, 'fake', _FakeEngine)
+        with sparse.instrument() as collector:
+            self.assertEqual(sparse.parse('a b', engine='fake', model='fake-model'), ['A', 'B'])
+            sparse.parse('c d', engine='fake', model='fake-model')
+
+        names = [record.name for record in collector.records]
+        # The model is loaded once, before the first engine call.
+        self.assertEqual(names, ['load_model', 'fake', 'parse', 'fake', 'parse'])
+        self.assertEqual(collector.records[0].kind, 'load')
+        self.assertEqual(collector.records[0].model, 'fake-model')
+        self.assertEqual(collector.records[1].engine, 'fake')
+        self.assertEqual(collector.records[1].model, 'fake-model')
+        self.assertEqual(collector.records[1].output_size, 2)
+
+    def test_error_is_recorded_and_raised(self):
+        with mock.patch('sparse.utils.lowercase', side_effect=RuntimeError('boom')), \
+                mock.patch('sparse.pipeline._TEXT_STAGES', (('lowercase', sparse.utils.lowercase),)):
+            with sparse.instrument() as collector:
+                with self.assertRaises(RuntimeError):
+                    sparse.parse('X', lowercase=True)
+        self.assertIn('boom', collector.records[0].error)
+
+    def test_report(self):
+        with sparse.instrument() as collector:
+            for _ in range(3):
+                sparse.parse('Hi!', lowercase=True, remove_punctuation=True)
+        summary = collector.summary()
+        self.assertEqual(summary['lowercase']['calls'], 3)
+        self.assertEqual(list(summary), ['lowercase', 'remove_punctuation'])
+
+        out = io.StringIO()
+        collector.print_report(file=out)
+        lines = out.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith('stage'))
+        self.assertEqual(len(lines), 3)
+
+    def test_remove_hook(self):
+        records = []
+        tracing.add_hook(records.append)
+        tracing.remove_hook(records.append)
+        sparse.parse('X', lowercase=True)
+        self.assertEqual(records, [])
+
+
+if __name__ == '__main__':
+    unittest.main()